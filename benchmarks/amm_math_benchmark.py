@@ -0,0 +1,115 @@
+# === === === === === === ===
+# Micro-benchmark of the integer AMM math against the former float implementation.
+#
+# Usage: python -m benchmarks.amm_math_benchmark
+# === === === === === === ===
+
+import random
+import timeit
+from typing import List, Tuple
+
+from src.features.ton_dex import amm_math
+
+# === === === === === === ===
+
+FEE_DIVIDER = 10000
+NUMBER = 200_000
+
+# === === === === === === ===
+
+
+def float_get_amount_out(
+    has_ref: bool,
+    amount_in: int,
+    reserve_in: int,
+    reserve_out: int,
+    lp_fee: int,
+    protocol_fee: int,
+    ref_fee: int,
+) -> Tuple[int, int, int]:
+    """The float quote formerly used by `DexParamsManager`."""
+
+    if amount_in <= 0:
+        return (0, 0, 0)
+
+    amount_in_with_fee = amount_in / 1_000_000_000 * (FEE_DIVIDER - lp_fee)
+    base_out = (amount_in_with_fee * reserve_out / 1_000_000_000) / (
+        reserve_in / 1_000_000_000 * FEE_DIVIDER + amount_in_with_fee
+    )
+
+    protocol_fee_out = 0
+    ref_fee_out = 0
+
+    if protocol_fee > 0:
+        protocol_fee_out = base_out * protocol_fee / FEE_DIVIDER
+
+    if has_ref and (ref_fee > 0):
+        ref_fee_out = base_out * ref_fee / FEE_DIVIDER
+
+    base_out -= protocol_fee_out + ref_fee_out
+
+    return (
+        int(base_out * 1_000_000_000),
+        int(protocol_fee_out * 1_000_000_000),
+        int(ref_fee_out * 1_000_000_000),
+    )
+
+
+# === === === === === === ===
+
+
+def make_cases(
+    count: int,
+) -> List[Tuple[bool, int, int, int, int, int, int]]:
+
+    rng = random.Random(0)
+
+    return [
+        (
+            rng.random() < 0.5,
+            rng.randint(10**6, 10**15),
+            rng.randint(10**9, 10**24),
+            rng.randint(10**9, 10**24),
+            20,
+            10,
+            10,
+        )
+        for _ in range(count)
+    ]
+
+
+# === === === === === === ===
+
+
+def main() -> None:
+
+    cases = make_cases(1000)
+
+    mismatches = 0
+    for case in cases:
+        if float_get_amount_out(*case)[0] != amm_math.get_amount_out(*case)[0]:
+            mismatches += 1
+
+    for name, function in [
+        ("float", float_get_amount_out),
+        ("integer", amm_math.get_amount_out),
+    ]:
+        seconds = min(
+            timeit.repeat(
+                "for case in cases: function(*case)",
+                globals={"cases": cases, "function": function},
+                number=NUMBER // len(cases),
+                repeat=5,
+            )
+        )
+        print(f"{name:>8}: {seconds / NUMBER * 1e9:8.1f} ns per quote")
+
+    print(f"float quotes differing from the contract formula: {mismatches}/{len(cases)}")
+
+
+# === === === === === === ===
+
+if __name__ == "__main__":
+    main()
+
+# === === === === === === ===
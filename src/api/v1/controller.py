@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from .account.controller import account_router
+from .system.controller import system_router
 from .ton_dex.controller import ton_dex_router
 from .ton_staking.controller import staking_router
 
@@ -18,5 +19,6 @@ api_v1_router = APIRouter(
 api_v1_router.include_router(account_router, prefix="/account", tags=["account"])
 api_v1_router.include_router(staking_router, prefix="/ton-staking", tags=["staking", "ton"])
 api_v1_router.include_router(ton_dex_router, prefix="/ton-dex", tags=["dex", "ton"])
+api_v1_router.include_router(system_router, prefix="/system", tags=["system"])
 
 # === === === === === === ===
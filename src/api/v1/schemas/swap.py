@@ -1,7 +1,9 @@
-from pydantic import BaseModel
-from src.api.v1.schemas.base_messages import SuccessMessage
+from typing import List
+
+from pydantic import BaseModel, Field
+from src.api.v1.schemas.base_messages import ErrorMessage, SuccessMessage
 from src.features.ton_dex.params_manager import SwapType
-from src.features.ton_dex.schemas import TonSwapParams
+from src.features.ton_dex.schemas import TonSwapCurve, TonSwapParams
 from src.utils.ton_address import ValidatedAddress
 
 # === === === === === === ===
@@ -39,6 +41,7 @@ class GetSwapParamsBody(BaseModel):
     units: int
     slippage_tolerance: float
     swap_type: SwapType
+    allow_route: bool = False
 
 
 # === === === === === === ===
@@ -50,3 +53,70 @@ class GetSwapParamsSuccessMessage(SuccessMessage):
 
 
 # === === === === === === ===
+
+
+class GetSwapParamsBatchItem(BaseModel):
+
+    model_config = {
+        "arbitrary_types_allowed": True,
+    }
+
+    # === === === === === === ===
+
+    offer_address: ValidatedAddress
+    ask_address: ValidatedAddress
+    units: int
+    swap_type: SwapType
+
+
+# === === === === === === ===
+
+
+class GetSwapParamsBatchBody(BaseModel):
+
+    items: List[GetSwapParamsBatchItem] = Field(min_length=1, max_length=100)
+    slippage_tolerance: float
+
+
+# === === === === === === ===
+
+
+class SwapParamsBatchResult(BaseModel):
+
+    data: TonSwapParams | None = None
+    error: ErrorMessage | None = None
+
+
+# === === === === === === ===
+
+
+class GetSwapParamsBatchSuccessMessage(SuccessMessage):
+
+    data: List[SwapParamsBatchResult]
+
+
+# === === === === === === ===
+
+
+class GetSwapCurveBody(BaseModel):
+
+    model_config = {
+        "arbitrary_types_allowed": True,
+    }
+
+    # === === === === === === ===
+
+    offer_address: ValidatedAddress
+    ask_address: ValidatedAddress
+    units: List[int] = Field(min_length=1, max_length=1000)
+
+
+# === === === === === === ===
+
+
+class GetSwapCurveSuccessMessage(SuccessMessage):
+
+    data: TonSwapCurve
+
+
+# === === === === === === ===
@@ -0,0 +1,61 @@
+from typing import List
+
+from pydantic import BaseModel
+
+# === === === === === === ===
+
+
+class CoalescedCallsMetrics(BaseModel):
+
+    calls_count: int
+    deduplicated_count: int
+    in_flight_count: int
+
+
+# === === === === === === ===
+
+
+class CacheMetrics(BaseModel):
+
+    size: int
+    hits: int
+    misses: int
+
+
+# === === === === === === ===
+
+
+class SchedulerLaneMetrics(BaseModel):
+
+    priority: str
+    queue_depth: int
+    acquired_count: int
+    queued_count: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+# === === === === === === ===
+
+
+class SystemMetrics(BaseModel):
+
+    ton_api_scheduler_lanes: List[SchedulerLaneMetrics]
+    ton_get_method_calls: CoalescedCallsMetrics
+    lp_account_addresses_cache: CacheMetrics
+    jetton_wallet_verifications_count: int
+    jetton_wallet_mismatches_count: int
+
+
+# === === === === === === ===
+
+
+class LeaderStatus(BaseModel):
+
+    identity: str
+    is_leader: bool
+    elected_at: float | None = None
+    leader: str | None = None
+
+
+# === === === === === === ===
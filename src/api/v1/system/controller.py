@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+from src.api.v1.schemas.system import LeaderStatus, SystemMetrics
+
+from .endpoints import get_leader_status, get_system_metrics
+
+# === === === === === === ===
+
+system_router = APIRouter()
+
+# === === === === === === ===
+
+system_router.add_api_route(
+    path="/metrics",
+    endpoint=get_system_metrics,
+    methods=["GET"],
+    response_model=SystemMetrics,
+)
+
+# === === === === === === ===
+
+system_router.add_api_route(
+    path="/leader",
+    endpoint=get_leader_status,
+    methods=["GET"],
+    response_model=LeaderStatus,
+)
+
+# === === === === === === ===
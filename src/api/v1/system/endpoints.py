@@ -0,0 +1,77 @@
+# === === === === === === ===
+
+from typing import Annotated, List
+
+from fastapi import Depends
+from src.api.v1.schemas.system import (
+    CacheMetrics,
+    CoalescedCallsMetrics,
+    LeaderStatus,
+    SchedulerLaneMetrics,
+    SystemMetrics,
+)
+from src.blockchains.ton.clients.jetton_wallet_deriver import JettonWalletDeriver
+from src.blockchains.ton.clients.ton_client import TonClient
+from src.blockchains.ton.clients.tonapi_client.tonapi_client import TonApiClient
+from src.database.leader_election import LeaderElection
+from src.dependencies.ton_client import get_ton_client
+from src.features.ton_dex.pool_contract import PoolContract
+
+# === === === === === === ===
+
+
+async def get_system_metrics(
+    ton_client: Annotated[TonClient, Depends(get_ton_client)],
+) -> SystemMetrics:
+
+    scheduler_lanes: List[SchedulerLaneMetrics] = []
+    if isinstance(ton_client, TonApiClient):
+        for priority, stats in ton_client.scheduler.lane_stats.items():
+            scheduler_lanes.append(
+                SchedulerLaneMetrics(
+                    priority=priority.name.lower(),
+                    queue_depth=ton_client.scheduler.get_queue_depth(priority),
+                    acquired_count=stats.acquired_count,
+                    queued_count=stats.queued_count,
+                    total_wait_seconds=stats.total_wait_seconds,
+                    max_wait_seconds=stats.max_wait_seconds,
+                )
+            )
+
+    get_method_calls = TonApiClient.get_method_calls
+    lp_account_addresses_cache = PoolContract.lp_account_addresses_cache
+    jetton_wallet_deriver = JettonWalletDeriver()
+
+    return SystemMetrics(
+        ton_api_scheduler_lanes=scheduler_lanes,
+        ton_get_method_calls=CoalescedCallsMetrics(
+            calls_count=get_method_calls.calls_count,
+            deduplicated_count=get_method_calls.deduplicated_count,
+            in_flight_count=get_method_calls.in_flight_count,
+        ),
+        lp_account_addresses_cache=CacheMetrics(
+            size=len(lp_account_addresses_cache),
+            hits=lp_account_addresses_cache.hits,
+            misses=lp_account_addresses_cache.misses,
+        ),
+        jetton_wallet_verifications_count=jetton_wallet_deriver.verifications_count,
+        jetton_wallet_mismatches_count=jetton_wallet_deriver.mismatches_count,
+    )
+
+
+# === === === === === === ===
+
+
+async def get_leader_status() -> LeaderStatus:
+
+    leader_election = LeaderElection()
+
+    return LeaderStatus(
+        identity=leader_election.identity,
+        is_leader=leader_election.is_leader,
+        elected_at=leader_election.elected_at,
+        leader=await leader_election.get_leader(),
+    )
+
+
+# === === === === === === ===
@@ -11,6 +11,7 @@ from src.dependencies.config import get_config
 from src.dependencies.database_session import get_session
 from src.dependencies.ton_client import get_ton_client
 from src.features.ton_common.schemas.ton_asset import TonAsset
+from src.features.ton_dex.schemas import TonDexAssetPrice
 from src.services.ton.ton_dex_service import TonDexService
 from src.utils.ton_address import validate_address_or_none
 
@@ -35,6 +36,24 @@ async def get_assets(
 # === === === === === === ===
 
 
+async def get_asset_prices(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    config: Annotated[Config, Depends(get_config)],
+    ton_client: Annotated[TonClient, Depends(get_ton_client)],
+) -> List[TonDexAssetPrice]:
+
+    try:
+        dex_service = TonDexService(session=session, config=config, ton_client=ton_client)
+        prices = dex_service.get_asset_prices()
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return prices
+
+
+# === === === === === === ===
+
+
 async def find_new_asset(
     request: Request,
     session: Annotated[AsyncSession, Depends(get_session)],
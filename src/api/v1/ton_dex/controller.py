@@ -7,7 +7,11 @@ from src.api.v1.schemas.liquidity import (
     GetProvideLiquidityParamsSuccessMessage,
     PrepareTransactionSuccessMessage,
 )
-from src.api.v1.schemas.swap import GetSwapParamsSuccessMessage
+from src.api.v1.schemas.swap import (
+    GetSwapCurveSuccessMessage,
+    GetSwapParamsBatchSuccessMessage,
+    GetSwapParamsSuccessMessage,
+)
 from src.api.v1.ton_dex.liquidity_endpoints import (
     get_provide_liquidity_params_endpoint,
     prepare_activate_liquidity_endpoint,
@@ -17,12 +21,22 @@ from src.api.v1.ton_dex.liquidity_endpoints import (
     prepare_refund_liquidity_endpoint,
     prepare_remove_liquidity_endpoint,
 )
-from src.api.v1.ton_dex.pool_endpoints import get_assets_pairs_endpoint
+from src.api.v1.ton_dex.pool_endpoints import (
+    get_assets_pairs_endpoint,
+    get_pool_candles_endpoint,
+    get_pools_endpoint,
+)
 from src.features.ton_common.schemas.ton_asset import TonAsset
+from src.features.ton_dex.schemas import TonDexAssetPrice, TonDexCandle, TonDexPoolSummary
 
 from ..schemas.base_messages import ErrorMessage
-from .asset_endpoints import find_new_asset, get_assets
-from .swap_endpoints import get_swap_params_endpoint, prepare_swap_endpoint
+from .asset_endpoints import find_new_asset, get_asset_prices, get_assets
+from .swap_endpoints import (
+    get_swap_curve_endpoint,
+    get_swap_params_batch_endpoint,
+    get_swap_params_endpoint,
+    prepare_swap_endpoint,
+)
 
 # === === === === === === ===
 
@@ -57,6 +71,24 @@ ton_dex_router.add_api_route(
 
 # === === === === === === ===
 
+ton_dex_router.add_api_route(
+    path="/swap/params/batch",
+    endpoint=get_swap_params_batch_endpoint,
+    methods=["POST"],
+    response_model=GetSwapParamsBatchSuccessMessage | ErrorMessage,
+)
+
+# === === === === === === ===
+
+ton_dex_router.add_api_route(
+    path="/swap/curve",
+    endpoint=get_swap_curve_endpoint,
+    methods=["POST"],
+    response_model=GetSwapCurveSuccessMessage | ErrorMessage,
+)
+
+# === === === === === === ===
+
 ton_dex_router.add_api_route(
     path="/liquidity/params",
     endpoint=get_provide_liquidity_params_endpoint,
@@ -129,6 +161,15 @@ ton_dex_router.add_api_route(
 
 # === === === === === === ===
 
+ton_dex_router.add_api_route(
+    path="/assets/prices",
+    endpoint=get_asset_prices,
+    methods=["GET"],
+    response_model=List[TonDexAssetPrice] | ErrorMessage,
+)
+
+# === === === === === === ===
+
 ton_dex_router.add_api_route(
     path="/assets/pairs",
     endpoint=get_assets_pairs_endpoint,
@@ -137,3 +178,21 @@ ton_dex_router.add_api_route(
 )
 
 # === === === === === === ===
+
+ton_dex_router.add_api_route(
+    path="/pools",
+    endpoint=get_pools_endpoint,
+    methods=["GET"],
+    response_model=List[TonDexPoolSummary] | ErrorMessage,
+)
+
+# === === === === === === ===
+
+ton_dex_router.add_api_route(
+    path="/pools/{address}/candles",
+    endpoint=get_pool_candles_endpoint,
+    methods=["GET"],
+    response_model=List[TonDexCandle] | ErrorMessage,
+)
+
+# === === === === === === ===
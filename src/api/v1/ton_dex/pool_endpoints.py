@@ -1,15 +1,19 @@
 # === === === === === === ===
 
-from typing import Annotated, List, Tuple
+from typing import Annotated, List
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Path, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.api.v1.schemas.base_messages import ErrorMessage
 from src.blockchains.ton.clients.ton_client import TonClient
 from src.config.config import Config
+from src.constants.api_message_code import ApiMessageCode
 from src.dependencies.config import get_config
 from src.dependencies.database_session import get_session
 from src.dependencies.ton_client import get_ton_client
+from src.features.ton_dex.schemas import TonDexCandle, TonDexCandleResolution, TonDexPoolSummary
 from src.services.ton.ton_dex_service import TonDexService
+from src.utils.ton_address import validate_address_or_none
 
 # === === === === === === ===
 
@@ -18,15 +22,67 @@ async def get_assets_pairs_endpoint(
     session: Annotated[AsyncSession, Depends(get_session)],
     config: Annotated[Config, Depends(get_config)],
     ton_client: Annotated[TonClient, Depends(get_ton_client)],
-) -> List[Tuple[str, str]]:
+) -> Response:
 
     try:
         dex_service = TonDexService(session=session, config=config, ton_client=ton_client)
-        assets_pairs = await dex_service.get_assets_pairs()
+        payload = await dex_service.get_assets_pairs_payload()
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error")
 
-    return assets_pairs
+    # Already serialized, so it skips response model validation and encoding.
+    return Response(content=payload, media_type="application/json")
+
+
+# === === === === === === ===
+
+
+async def get_pools_endpoint(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    config: Annotated[Config, Depends(get_config)],
+    ton_client: Annotated[TonClient, Depends(get_ton_client)],
+) -> List[TonDexPoolSummary]:
+
+    try:
+        dex_service = TonDexService(session=session, config=config, ton_client=ton_client)
+        pools = await dex_service.get_pools()
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return pools
+
+
+# === === === === === === ===
+
+
+async def get_pool_candles_endpoint(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    config: Annotated[Config, Depends(get_config)],
+    ton_client: Annotated[TonClient, Depends(get_ton_client)],
+    address: str = Path(),
+    resolution: TonDexCandleResolution = Query(TonDexCandleResolution.HOUR),
+    start: int | None = Query(None, description="Unix time, inclusive"),
+    end: int | None = Query(None, description="Unix time, exclusive"),
+    limit: int = Query(500, ge=1, le=1000),
+) -> List[TonDexCandle] | ErrorMessage:
+
+    pool_address = validate_address_or_none(address=address)
+    if not pool_address:
+        return ErrorMessage(code=ApiMessageCode.INVALID_TON_ADDRESS, error="Invalid TON address")
+
+    try:
+        dex_service = TonDexService(session=session, config=config, ton_client=ton_client)
+        candles = await dex_service.get_pool_candles(
+            pool_address=pool_address,
+            resolution=resolution,
+            start=start,
+            end=end,
+            limit=limit,
+        )
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return candles
 
 
 # === === === === === === ===
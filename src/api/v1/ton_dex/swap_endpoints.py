@@ -10,13 +10,28 @@ from src.api.v1.schemas.liquidity import PrepareTransactionSuccessMessage
 from src.api.v1.security_utils import get_account_from_request, validate_auth_token
 from src.blockchains.ton.clients.ton_client import TonClient
 from src.config.config import Config
+from src.constants.api_message_code import ApiMessageCode
 from src.dependencies.config import get_config
 from src.dependencies.database_session import get_session
 from src.dependencies.ton_client import get_ton_client
+from src.exceptions.ton_dex_exceptions import (
+    NotEnoughLiquidityError,
+    PoolAddressNotFoundError,
+    PoolNotFoundError,
+)
 from src.features.ton_dex.params_manager import DexParamsManager
 from src.features.ton_dex.router_contract import TonDexRouterContract
 
-from ..schemas.swap import GetSwapParamsBody, GetSwapParamsSuccessMessage, SwapParamsBody
+from ..schemas.swap import (
+    GetSwapCurveBody,
+    GetSwapCurveSuccessMessage,
+    GetSwapParamsBatchBody,
+    GetSwapParamsBatchSuccessMessage,
+    GetSwapParamsBody,
+    GetSwapParamsSuccessMessage,
+    SwapParamsBatchResult,
+    SwapParamsBody,
+)
 
 # === === === === === === ===
 
@@ -44,6 +59,7 @@ async def get_swap_params_endpoint(
             units=simulate_swap_request_body.units,
             slippage_tolerance=simulate_swap_request_body.slippage_tolerance,
             swap_type=simulate_swap_request_body.swap_type,
+            allow_route=simulate_swap_request_body.allow_route,
         )
 
     except Exception:
@@ -55,6 +71,87 @@ async def get_swap_params_endpoint(
 # === === === === === === ===
 
 
+async def get_swap_params_batch_endpoint(
+    request: Request,
+    batch_request_body: GetSwapParamsBatchBody,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    config: Annotated[Config, Depends(get_config)],
+    ton_client: Annotated[TonClient, Depends(get_ton_client)],
+) -> GetSwapParamsBatchSuccessMessage | ErrorMessage:
+
+    account = await get_account_from_request(request=request, config=config, session=session)
+
+    try:
+        dex_params_manager = DexParamsManager(config=config, ton_client=ton_client)
+        results = await dex_params_manager.get_batch_swap_params(
+            queries=[
+                (item.offer_address, item.ask_address, item.units, item.swap_type)
+                for item in batch_request_body.items
+            ],
+            referral_address=account.affiliate_ton_address if account is not None else None,
+            slippage_tolerance=batch_request_body.slippage_tolerance,
+        )
+
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    data = []
+    for result in results:
+        if isinstance(result, (PoolAddressNotFoundError, PoolNotFoundError)):
+            error = ErrorMessage(
+                code=ApiMessageCode.TON_DEX_POOL_NOT_FOUND, error="Pool not found."
+            )
+        elif isinstance(result, NotEnoughLiquidityError):
+            error = ErrorMessage(
+                code=ApiMessageCode.TON_DEX_NOT_ENOUGH_LIQUIDITY, error="Not enough liquidity."
+            )
+        elif isinstance(result, Exception):
+            logger.warning("Failed to get swap params: %r", result)
+            error = ErrorMessage(
+                code=ApiMessageCode.TON_DEX_ERROR_GETTING_SWAP_PARAMS,
+                error="Failed to get swap params.",
+            )
+        else:
+            data.append(SwapParamsBatchResult(data=result))
+            continue
+        data.append(SwapParamsBatchResult(error=error))
+
+    return GetSwapParamsBatchSuccessMessage(data=data)
+
+
+# === === === === === === ===
+
+
+async def get_swap_curve_endpoint(
+    request: Request,
+    swap_curve_request_body: GetSwapCurveBody,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    config: Annotated[Config, Depends(get_config)],
+    ton_client: Annotated[TonClient, Depends(get_ton_client)],
+) -> GetSwapCurveSuccessMessage | ErrorMessage:
+
+    account = await get_account_from_request(request=request, config=config, session=session)
+
+    try:
+        dex_params_manager = DexParamsManager(config=config, ton_client=ton_client)
+        result = await dex_params_manager.get_swap_curve(
+            offer_address=swap_curve_request_body.offer_address,
+            ask_address=swap_curve_request_body.ask_address,
+            referral_address=account.affiliate_ton_address if account is not None else None,
+            units=swap_curve_request_body.units,
+        )
+
+    except (PoolAddressNotFoundError, PoolNotFoundError):
+        return ErrorMessage(code=ApiMessageCode.TON_DEX_POOL_NOT_FOUND, error="Pool not found.")
+    except Exception:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return GetSwapCurveSuccessMessage(data=result)
+
+
+# === === === === === === ===
+
+
 async def prepare_swap_endpoint(
     request: Request,
     swap_request_body: SwapParamsBody,
@@ -0,0 +1,135 @@
+# === === === === === === ===
+
+import random
+import time
+from typing import Dict, Set
+
+from pytoniq_core import Address, Cell, StateInit, begin_cell
+from src.utils.singleton import SingletonMeta
+from src.utils.ton_address import TonAddress
+
+# === === === === === === ===
+
+WALLET_CODE_RETRY_SECONDS = 10 * 60
+
+# === === === === === === ===
+
+
+class JettonWalletDeriver(metaclass=SingletonMeta):
+    """Derives jetton wallet addresses locally from the minter's jetton wallet code.
+
+    The wallet address is the hash of the wallet StateInit, whose data is built
+    like in the reference (TEP-74) minter. Minters are trusted only after the
+    first derived address matches the `get_wallet_address` get-method. Minters
+    whose derived address doesn't match are marked non-standard and always
+    resolved remotely. Minters without a readable wallet code are resolved
+    remotely until the code is requested again.
+    """
+
+    # === === === === === === ===
+
+    def __init__(self) -> None:
+
+        self._wallet_codes: Dict[TonAddress, Cell] = {}
+        self._verified_minters: Set[TonAddress] = set()
+        self._non_standard_minters: Set[TonAddress] = set()
+        self._wallet_code_retry_at: Dict[TonAddress, float] = {}
+
+        self.verifications_count = 0
+        self.mismatches_count = 0
+
+    # === === === === === === ===
+
+    def is_known(
+        self,
+        jetton_minter_address: TonAddress,
+    ) -> bool:
+
+        return (
+            jetton_minter_address in self._wallet_codes
+            or jetton_minter_address in self._non_standard_minters
+            or self._wallet_code_retry_at.get(jetton_minter_address, 0.0) > time.time()
+        )
+
+    # === === === === === === ===
+
+    def add_minter(
+        self,
+        jetton_minter_address: TonAddress,
+        jetton_wallet_code: Cell | None,
+    ) -> None:
+        """Stores the wallet code. A missing one is requested after `WALLET_CODE_RETRY_SECONDS`."""
+
+        if jetton_wallet_code is None:
+            self._wallet_code_retry_at[jetton_minter_address] = (
+                time.time() + WALLET_CODE_RETRY_SECONDS
+            )
+            return
+
+        self._wallet_code_retry_at.pop(jetton_minter_address, None)
+        self._wallet_codes[jetton_minter_address] = jetton_wallet_code
+
+    # === === === === === === ===
+
+    def derive(
+        self,
+        jetton_minter_address: TonAddress,
+        owner_address: TonAddress,
+    ) -> TonAddress | None:
+        """Returns the locally derived wallet address or None for non-standard minters."""
+
+        if jetton_minter_address in self._non_standard_minters:
+            return None
+
+        wallet_code = self._wallet_codes.get(jetton_minter_address)
+        if wallet_code is None:
+            return None
+
+        wallet_data = (
+            begin_cell()
+            .store_coins(0)
+            .store_address(owner_address.address)
+            .store_address(jetton_minter_address.address)
+            .store_ref(wallet_code)
+            .end_cell()
+        )
+        state_init = StateInit(code=wallet_code, data=wallet_data)
+
+        return TonAddress(Address((0, state_init.serialize().hash)))
+
+    # === === === === === === ===
+
+    def needs_verification(
+        self,
+        jetton_minter_address: TonAddress,
+        sample_rate: float,
+    ) -> bool:
+
+        if jetton_minter_address not in self._verified_minters:
+            return True
+
+        return sample_rate > 0 and random.random() < sample_rate
+
+    # === === === === === === ===
+
+    def verify(
+        self,
+        jetton_minter_address: TonAddress,
+        derived_address: TonAddress,
+        remote_address: TonAddress,
+    ) -> bool:
+
+        self.verifications_count += 1
+
+        if derived_address == remote_address:
+            self._verified_minters.add(jetton_minter_address)
+            return True
+
+        self.mismatches_count += 1
+        self._verified_minters.discard(jetton_minter_address)
+        self._wallet_codes.pop(jetton_minter_address, None)
+        self._non_standard_minters.add(jetton_minter_address)
+
+        return False
+
+    # === === === === === === ===
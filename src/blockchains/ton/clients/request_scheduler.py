@@ -0,0 +1,166 @@
+# === === === === === === ===
+
+import asyncio
+import time
+from collections import deque
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Deque, Dict
+
+# === === === === === === ===
+
+
+class RequestPriority(IntEnum):
+    """Lower value is served first."""
+
+    USER = 0
+    BACKGROUND = 1
+
+
+# === === === === === === ===
+
+# Background tasks set this once at their start; tasks they spawn inherit it.
+request_priority: ContextVar[RequestPriority] = ContextVar(
+    "request_priority",
+    default=RequestPriority.USER,
+)
+
+# === === === === === === ===
+
+
+class LaneStats:
+
+    def __init__(self) -> None:
+
+        self.acquired_count = 0
+        self.queued_count = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+
+# === === === === === === ===
+
+
+class RequestScheduler:
+    """Token bucket shared by all upstream requests of a client.
+
+    Requests that find no free token are queued in the lane of their priority
+    and released in priority order as tokens refill, so user-facing calls go
+    ahead of background indexing calls. Requests are never rejected.
+    """
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+    ) -> None:
+
+        self.rate = rate
+        self.burst = max(burst, 1)
+
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+
+        self._lanes: Dict[RequestPriority, Deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in RequestPriority
+        }
+        self._dispatcher: asyncio.Task[None] | None = None
+
+        self.lane_stats: Dict[RequestPriority, LaneStats] = {
+            priority: LaneStats() for priority in RequestPriority
+        }
+
+    # === === === === === === ===
+
+    def get_queue_depth(
+        self,
+        priority: RequestPriority,
+    ) -> int:
+
+        return sum(1 for waiter in self._lanes[priority] if not waiter.done())
+
+    # === === === === === === ===
+
+    async def acquire(self) -> None:
+        """Waits for a token at the priority of the current context."""
+
+        priority = request_priority.get()
+        stats = self.lane_stats[priority]
+        stats.acquired_count += 1
+
+        self._refill()
+        if self._tokens >= 1 and not self._has_waiters(up_to=priority):
+            self._tokens -= 1
+            return
+
+        stats.queued_count += 1
+        started_at = time.monotonic()
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._lanes[priority].append(waiter)
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        try:
+            await waiter
+        finally:
+            wait_seconds = time.monotonic() - started_at
+            stats.total_wait_seconds += wait_seconds
+            stats.max_wait_seconds = max(stats.max_wait_seconds, wait_seconds)
+
+    # === === === === === === ===
+
+    async def _dispatch(self) -> None:
+
+        while True:
+            lane = self._get_next_lane()
+            if lane is None:
+                return
+
+            self._refill()
+            if self._tokens < 1:
+                # Re-pick the lane after sleeping, a higher priority waiter may arrive meanwhile.
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                continue
+
+            self._tokens -= 1
+            lane.popleft().set_result(None)
+
+    # === === === === === === ===
+
+    def _get_next_lane(self) -> Deque[asyncio.Future[None]] | None:
+
+        for priority in sorted(self._lanes):
+            lane = self._lanes[priority]
+            # Drop waiters cancelled while queued.
+            while lane and lane[0].done():
+                lane.popleft()
+            if lane:
+                return lane
+
+        return None
+
+    # === === === === === === ===
+
+    def _has_waiters(
+        self,
+        up_to: RequestPriority,
+    ) -> bool:
+
+        return any(
+            self.get_queue_depth(priority) > 0 for priority in self._lanes if priority <= up_to
+        )
+
+    # === === === === === === ===
+
+    def _refill(self) -> None:
+
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+# === === === === === === ===
@@ -1,9 +1,11 @@
 # === === === === === === ===
 
 from abc import ABCMeta, abstractmethod
-from typing import List
+from typing import AsyncIterator, Awaitable, Callable, List
 
 from src.blockchains.ton.schemas.ton_transaction import TonTransaction
+from src.blockchains.ton.schemas.transaction_cursor import TransactionCursor
+from src.utils.logging.logging import create_custom_logger
 from src.utils.ton_address import TonAddress
 
 from ..schemas.balances import Balances
@@ -12,6 +14,10 @@ from ..schemas.ton_jetton_info import TonJettonInfo
 
 # === === === === === === ===
 
+logger = create_custom_logger("TonClient")
+
+# === === === === === === ===
+
 
 class TonClient(metaclass=ABCMeta):
 
@@ -88,6 +94,65 @@ class TonClient(metaclass=ABCMeta):
 
     # === === === === === === ===
 
+    async def iter_account_transactions(
+        self,
+        account_address: TonAddress,
+        cursor: TransactionCursor,
+        checkpoint: Callable[[TransactionCursor], Awaitable[None]] | None = None,
+        max_page_size: int = 500,
+    ) -> AsyncIterator[List[TonTransaction]]:
+        """Yields the transaction pages of one sweep, newest first.
+
+        The page size is halved on upstream errors and grows back after each
+        successful page. The advanced cursor is passed to `checkpoint` when the
+        consumer asks for the next page, i.e. once the previous one is processed.
+        """
+
+        page_size = max_page_size
+
+        while True:
+            try:
+                transactions = await self.get_account_transactions(
+                    account_address=account_address,
+                    limit=page_size,
+                    before_lt=cursor.before_lt,
+                    after_lt=cursor.after_lt,
+                )
+            except Exception as e:
+                if page_size == 1:
+                    raise e
+                page_size = max(1, page_size // 2)
+                logger.warning("Transactions page failed, retrying with %d: %s", page_size, e)
+                continue
+
+            page_size = min(max_page_size, page_size * 2)
+
+            transactions = [
+                transaction
+                for transaction in transactions
+                if (cursor.after_lt is None or transaction.lt > cursor.after_lt)
+                and (cursor.before_lt is None or transaction.lt < cursor.before_lt)
+            ]
+
+            if not transactions:
+                after_lt = cursor.sweep_max_lt if cursor.sweep_max_lt else cursor.after_lt
+                if checkpoint:
+                    await checkpoint(TransactionCursor(after_lt=after_lt))
+                return
+
+            yield transactions
+
+            page_lts = [transaction.lt for transaction in transactions]
+            cursor = TransactionCursor(
+                after_lt=cursor.after_lt,
+                before_lt=min(page_lts),
+                sweep_max_lt=max(page_lts + [cursor.sweep_max_lt or 0]),
+            )
+            if checkpoint:
+                await checkpoint(cursor)
+
+    # === === === === === === ===
+
     async def get_all_jettons(
         self,
         limit: int = 100,
@@ -198,6 +263,7 @@ class TonClient(metaclass=ABCMeta):
         self,
         minter_address: TonAddress,
     ) -> TonJettonInfo | None:
+        """Returns `None` for unknown or invalid jettons. Transient errors are raised."""
 
         raise NotImplementedError()
 
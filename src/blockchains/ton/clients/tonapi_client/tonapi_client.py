@@ -1,11 +1,20 @@
 from collections import defaultdict
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 
+from pytoniq_core import Cell
 from pytonapi import AsyncTonapi
 from pytonapi.exceptions import TONAPINotFoundError
 from src.blockchains.ton.clients.exceptions import TonGetMethodNotFoundError
+from src.blockchains.ton.clients.jetton_wallet_deriver import JettonWalletDeriver
+from src.blockchains.ton.clients.request_scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    request_priority,
+)
 from src.blockchains.ton.schemas.ton_transaction import TonTransaction
 from src.config import Config
+from src.utils.logging.logging import create_custom_logger
+from src.utils.single_flight import SingleFlight
 from src.utils.ton_address import TonAddress
 
 from ...schemas.balances import Balances
@@ -15,10 +24,21 @@ from ..ton_client import TonClient
 from ..utils import get_address_cell, parse_address_from_bytes
 from .mappers import GetMethodResultMapper, JettonInfoMapper, TransactionMapper
 
+# === === === === === === ===
+
+logger = create_custom_logger("TonApiClient")
+
+# === === === === === === ===
+
 
 class TonApiClient(TonClient):
 
     jetton_wallets_cache: Dict[TonAddress, Dict[TonAddress, TonAddress]] = defaultdict(lambda: {})
+    # Identical get-method calls in flight share one TonAPI request. Calls of different
+    # priorities are not shared, so user calls never wait in the background lane.
+    get_method_calls: SingleFlight[
+        Tuple[RequestPriority, str, str, Tuple[str | None, ...]], Any
+    ] = SingleFlight()
 
     # === === === === === ===
 
@@ -35,6 +55,11 @@ class TonApiClient(TonClient):
             is_testnet=config.ton_console.is_testnet,
             max_retries=config.ton_console.max_retries,
         )
+        self.jetton_wallet_verification_rate = config.ton_console.jetton_wallet_verification_rate
+        self.scheduler = RequestScheduler(
+            rate=config.ton_console.requests_per_second,
+            burst=config.ton_console.requests_burst,
+        )
 
     # === === === === === === ===
 
@@ -75,11 +100,7 @@ class TonApiClient(TonClient):
     ) -> GetMethodResult:
 
         try:
-            raw_result = await self.tonapi.blockchain.execute_get_method(
-                address.to_string(),
-                method_name,
-                *args,
-            )
+            raw_result = await self._execute_get_method(address.to_string(), method_name, *args)
         except TONAPINotFoundError:
             raise TonGetMethodNotFoundError("Method not found. Maybe contract is not deployed.")
 
@@ -201,9 +222,65 @@ class TonApiClient(TonClient):
         if wallet_address:
             return wallet_address
 
+        deriver = JettonWalletDeriver()
+
+        if not deriver.is_known(jetton_minter_address):
+            deriver.add_minter(
+                jetton_minter_address=jetton_minter_address,
+                jetton_wallet_code=await self._get_jetton_wallet_code(
+                    jetton_minter_address=jetton_minter_address
+                ),
+            )
+
+        derived_wallet_address = deriver.derive(
+            jetton_minter_address=jetton_minter_address,
+            owner_address=owner_address,
+        )
+
+        if derived_wallet_address and not deriver.needs_verification(
+            jetton_minter_address=jetton_minter_address,
+            sample_rate=self.jetton_wallet_verification_rate,
+        ):
+            wallet_address = derived_wallet_address
+        else:
+            wallet_address = await self._get_remote_jetton_wallet_address(
+                jetton_minter_address=jetton_minter_address,
+                owner_address=owner_address,
+            )
+            if not wallet_address:
+                return None
+
+            if derived_wallet_address and not deriver.verify(
+                jetton_minter_address=jetton_minter_address,
+                derived_address=derived_wallet_address,
+                remote_address=wallet_address,
+            ):
+                logger.warning(
+                    "Derived jetton wallet mismatch for minter %s: %s != %s",
+                    jetton_minter_address.to_string(),
+                    derived_wallet_address.to_string(),
+                    wallet_address.to_string(),
+                )
+
+        await self._save_wallet_to_cache(
+            owner_address=owner_address,
+            jetton_minter_address=jetton_minter_address,
+            jetton_wallet_address=wallet_address,
+        )
+
+        return wallet_address
+
+    # === === === === ===
+
+    async def _get_remote_jetton_wallet_address(
+        self,
+        jetton_minter_address: TonAddress,
+        owner_address: TonAddress,
+    ) -> TonAddress | None:
+
         owner_wallet_address_cell = get_address_cell(owner_address._address)
 
-        response = await self.tonapi.blockchain.execute_get_method(
+        response = await self._execute_get_method(
             jetton_minter_address.to_string(),
             "get_wallet_address",
             owner_wallet_address_cell.to_boc(False).hex(),
@@ -211,17 +288,45 @@ class TonApiClient(TonClient):
         if not response.stack or len(response.stack) == 0 or not response.stack[0].cell:
             return None
 
-        wallet_address = parse_address_from_bytes(bytes.fromhex(response.stack[0].cell))
-        if not wallet_address:
-            return None
+        return parse_address_from_bytes(bytes.fromhex(response.stack[0].cell))
 
-        await self._save_wallet_to_cache(
-            owner_address=owner_address,
-            jetton_minter_address=jetton_minter_address,
-            jetton_wallet_address=wallet_address,
+    # === === === === ===
+
+    async def _execute_get_method(
+        self,
+        address: str,
+        method_name: str,
+        *args: str | None,
+    ) -> Any:
+
+        async def execute() -> Any:
+            await self.scheduler.acquire()
+            return await self.tonapi.blockchain.execute_get_method(address, method_name, *args)
+
+        return await TonApiClient.get_method_calls.run(
+            (request_priority.get(), address, method_name, args), execute
         )
 
-        return wallet_address
+    # === === === === ===
+
+    async def _get_jetton_wallet_code(
+        self,
+        jetton_minter_address: TonAddress,
+    ) -> Cell | None:
+        """Returns the jetton wallet code from `get_jetton_data` or None if it's unavailable."""
+
+        try:
+            response = await self.run_get_method(jetton_minter_address, "get_jetton_data")
+        except TonGetMethodNotFoundError:
+            return None
+
+        if not response.success or len(response.stack) < 5 or not response.stack[4].cell:
+            return None
+
+        try:
+            return Cell.one_from_boc(response.stack[4].cell)
+        except Exception:
+            return None
 
     # === === === === ===
 
@@ -233,6 +338,7 @@ class TonApiClient(TonClient):
         after_lt: int | None = None,
     ) -> List[TonTransaction]:
 
+        await self.scheduler.acquire()
         transactions = await self.tonapi.blockchain.get_account_transactions(
             account_id=account_address.to_string(),
             limit=limit,
@@ -253,6 +359,7 @@ class TonApiClient(TonClient):
         offset: int = 0,
     ) -> List[TonJettonInfo]:
 
+        await self.scheduler.acquire()
         raw_jettons = await self.tonapi.jettons.get_all_jettons(limit=limit, offset=offset)
 
         return list(map(JettonInfoMapper.to_model, raw_jettons.jettons))
@@ -417,6 +524,7 @@ class TonApiClient(TonClient):
         wallet_address: TonAddress,
     ) -> str | None:
 
+        await self.scheduler.acquire()
         response = await self.tonapi.accounts.get_public_key(wallet_address.to_string())
         return response.public_key
 
@@ -427,6 +535,7 @@ class TonApiClient(TonClient):
         state_init: str,
     ) -> str | None:
 
+        await self.scheduler.acquire()
         response = await self.tonapi.tonconnect.get_info_by_state_init(state_init=state_init)
         return response.public_key
 
@@ -437,12 +546,14 @@ class TonApiClient(TonClient):
         account_address: TonAddress,
     ) -> Balances:
 
+        await self.scheduler.acquire()
         response = await self.tonapi.accounts.get_jettons_balances(account_address.to_string())
         jettons_balances = {
             TonAddress(item.jetton.address.to_userfriendly()): int(item.balance)
             for item in response.balances
         }
 
+        await self.scheduler.acquire()
         response = await self.tonapi.accounts.get_info(account_address.to_string())
         ton_balance = int(response.balance.to_nano())
 
@@ -461,9 +572,15 @@ class TonApiClient(TonClient):
     ) -> TonJettonInfo | None:
 
         try:
+            await self.scheduler.acquire()
             response = await self.tonapi.jettons.get_info(minter_address.to_string())
+        except TONAPINotFoundError:
+            return None
+
+        try:
             jetton_info = JettonInfoMapper.to_model(response)
-        except Exception:
+        except Exception as e:
+            logger.warning("Invalid jetton info: %s. Error: %s", minter_address.to_string(), e)
             return None
 
         return jetton_info
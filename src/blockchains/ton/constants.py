@@ -52,3 +52,10 @@ class TonConstants:
         BURN_LIQUIDITY = 0x595F07BC
 
         PAY_TO = 0xF93BB43F
+
+    @dataclass(frozen=True)
+    class PayToExitCodes:
+        SWAP_OK = 0xC64370E5
+        SWAP_OK_REF = 0x45078540
+        BURN_OK = 0xDDA48B6A
+        REFUND_OK = 0xDE7DBBC2
@@ -10,11 +10,13 @@ from ._models import (
 from .ton_block import TonBlock
 from .ton_message import TonMessage
 from .ton_transaction import TonTransaction
+from .transaction_cursor import TransactionCursor
 
 __all__ = [
     "TonBlock",
     "TonMessage",
     "TonTransaction",
+    "TransactionCursor",
     "JettonWalletData",
     "JettonMessageBody",
     "JettonMessageBodyForwardPayload",
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+# === === === === === === ===
+
+
+class TransactionCursor(BaseModel):
+    """Position of a newest-to-oldest sweep over an account's transactions.
+
+    A sweep walks down from the newest transaction (or from `before_lt` when
+    resumed) to `after_lt`, the highest lt of the last completed sweep. When it
+    completes, `after_lt` moves up to `sweep_max_lt` and the next sweep starts.
+    """
+
+    after_lt: int | None = None
+    before_lt: int | None = None
+    sweep_max_lt: int | None = None
+
+
+# === === === === === === ===
@@ -1,4 +1,6 @@
-from pydantic import SecretStr
+from typing import List
+
+from pydantic import Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from src.types import DatabaseConfigDict
 from src.types.ton.ton_address_annotated import TonAddressType
@@ -58,6 +60,9 @@ class TonConsole(BaseSettings):
     api_key: SecretStr
     is_testnet: bool = False
     max_retries: int = 10
+    jetton_wallet_verification_rate: float = 0.01
+    requests_per_second: float = 10
+    requests_burst: int = 10
 
 
 # === === === === === === ===
@@ -68,6 +73,39 @@ class TonDex(BaseSettings):
     router_address: TonAddressType
     proxy_ton_address: TonAddressType
 
+    # Pools untouched by router transactions are current as of the last observer cycle.
+    # Followers see a cycle up to one more interval late, so this covers two intervals.
+    pool_state_max_age_seconds: int = 2 * 5 * 60
+    # Route search handles up to 3 hops.
+    max_route_hops: int = Field(3, ge=1, le=3)
+    pool_refresh_concurrency: int = 16
+    pool_refresh_batch_size: int = 100
+    # Anchors of the USD asset prices, valued at 1 USD.
+    stablecoin_addresses: List[TonAddressType] = []
+    # Concurrent lt segments of the history backfill on a fresh database, 0 to sweep it live.
+    backfill_segments: int = 8
+
+
+# === === === === === === ===
+
+
+class Indexer(BaseSettings):
+
+    # The API process also campaigns for leadership and runs the indexers.
+    # Disable when a standalone indexer process (`python -m src.indexer`) runs them.
+    run_in_api: bool = True
+
+    health_host: str = "0.0.0.0"
+    health_port: int = 8090
+
+    elect_leader_interval_seconds: int = 10
+    update_pools_interval_seconds: int = 5 * 60
+    update_staking_interval_seconds: int = 60
+    sync_jetton_catalog_interval_seconds: int = 24 * 60 * 60
+    downsample_pool_snapshots_interval_seconds: int = 60 * 60
+    backfill_router_interval_seconds: int = 10
+    backfill_router_run_seconds: int = 5 * 60
+
 
 # === === === === === === ===
 
@@ -87,6 +125,22 @@ class Config(BaseSettings):
     account: Account
     ton_console: TonConsole
     ton_dex: TonDex
+    indexer: Indexer = Indexer()
+
+    # === === === === === === ===
+
+    @model_validator(mode="after")
+    def check_pool_state_max_age(self) -> "Config":
+
+        # A shorter bound turns the pool state store into a per-pool TTL between cycles.
+        min_max_age_seconds = 2 * self.indexer.update_pools_interval_seconds
+        if self.ton_dex.pool_state_max_age_seconds < min_max_age_seconds:
+            raise ValueError(
+                f"ton_dex.pool_state_max_age_seconds must be at least {min_max_age_seconds},"
+                " twice indexer.update_pools_interval_seconds"
+            )
+
+        return self
 
     # === === === === === === ===
 
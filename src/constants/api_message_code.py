@@ -25,6 +25,7 @@ class ApiMessageCode(IntEnum):
     TON_DEX_ERROR_PREPARING_REFUND = 129
     TON_DEX_ERROR_PREPARING_SWAP = 133
     TON_DEX_ERROR_GETTING_SWAP_PARAMS = 134
+    TON_DEX_NOT_ENOUGH_LIQUIDITY = 135
 
     INVALID_TON_ADDRESS = 131
     ACCOUNT_NOT_FOUND = 132
@@ -0,0 +1,29 @@
+from decimal import Decimal
+
+from sqlalchemy import Dialect, Numeric, TypeDecorator
+
+# === === === === === === ===
+
+
+class ExactInteger(TypeDecorator[int]):
+    """`NUMERIC` column read back as an exact `int`.
+
+    On-chain amounts exceed 2**63, so they are stored as `NUMERIC`. Reading them
+    with `asdecimal=False` goes through `float` and rounds them.
+    """
+
+    impl = Numeric(asdecimal=True)
+    cache_ok = True
+
+    # === === === === === === ===
+
+    def process_result_value(
+        self,
+        value: Decimal | None,
+        dialect: Dialect,
+    ) -> int | None:
+
+        return int(value) if value is not None else None
+
+
+# === === === === === === ===
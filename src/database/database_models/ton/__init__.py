@@ -1,9 +1,21 @@
 from .ton_dex_asset import TonAssetDb
+from .ton_dex_candle import TonDexCandleDb
+from .ton_dex_event import TonDexEventDb
 from .ton_dex_pool import TonDexPoolDb
+from .ton_dex_pool_refresh import TonDexPoolRefreshDb
+from .ton_dex_pool_snapshot import TonDexPoolSnapshotDb
+from .ton_dex_pool_stats import TonDexPoolStatsDb
 from .ton_staking_contract import TonStakingContractDb
+from .ton_staking_state import TonStakingStateDb
 
 __all__ = [
     "TonAssetDb",
     "TonStakingContractDb",
+    "TonStakingStateDb",
     "TonDexPoolDb",
+    "TonDexEventDb",
+    "TonDexCandleDb",
+    "TonDexPoolSnapshotDb",
+    "TonDexPoolStatsDb",
+    "TonDexPoolRefreshDb",
 ]
@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Float, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from src.database.database_models.column_types import ExactInteger
+from src.database.database_models.mixins.id_mixin import IdMixin
+
+from ..base import Base
+
+# === === === === === === ===
+
+
+class TonDexCandleDb(
+    Base,
+    IdMixin,
+):
+    """OHLCV rollup of the completed swaps of a pool.
+
+    Prices are in token 1 units per token 0 unit, without decimals. `first_lt`
+    and `last_lt` are the lts of the swaps that set `open` and `close`, so
+    swaps can be merged in any order.
+    """
+
+    __tablename__ = "ton_dex_candle"
+    __table_args__ = (UniqueConstraint("pool_address", "resolution", "open_time"),)
+
+    # === === === Columns === === ===
+    pool_address: Mapped[str] = mapped_column(String(100), nullable=False)
+    resolution: Mapped[str] = mapped_column(String(8), nullable=False)
+    open_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    open: Mapped[float] = mapped_column(Float, nullable=False)
+    high: Mapped[float] = mapped_column(Float, nullable=False)
+    low: Mapped[float] = mapped_column(Float, nullable=False)
+    close: Mapped[float] = mapped_column(Float, nullable=False)
+
+    volume_0: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    volume_1: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    trades_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    first_lt: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    last_lt: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+# === === === === === === ===
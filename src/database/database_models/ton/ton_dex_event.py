@@ -0,0 +1,66 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Numeric, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+from src.database.database_models.column_types import ExactInteger
+
+from ..base import Base
+
+# === === === === === === ===
+
+
+class TonDexEventDb(Base):
+    """Swap and liquidity events of DEX pools, range-partitioned by month of `time`.
+
+    Partitions are created on demand by `TonDexEventRepository`. A swap is
+    assembled from two router transactions: the `swap` sent to the pool (`lt`)
+    and the `pay_to` received back (`completion_lt`). Until both are indexed
+    only the known side is filled and the other lt is NULL.
+
+    Amounts are in pool token order. The token minters are stored on the event,
+    since pools with unresolved jettons have no `ton_dex_pool` row.
+    """
+
+    __tablename__ = "ton_dex_event"
+    __table_args__ = (
+        Index("ix_ton_dex_event_pool_address_time", "pool_address", "time"),
+        Index("ix_ton_dex_event_user_address_time", "user_address", "time"),
+        Index("ix_ton_dex_event_lt", "lt"),
+        Index("ix_ton_dex_event_completion_lt", "completion_lt"),
+        Index(
+            "ix_ton_dex_event_pending_swap",
+            "pool_address",
+            "query_id",
+            postgresql_where=text("lt IS NULL OR completion_lt IS NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (time)"},
+    )
+
+    # === === === Columns === === ===
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    time: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+
+    event_type: Mapped[str] = mapped_column(String(16), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+
+    pool_address: Mapped[str] = mapped_column(String(100), nullable=False)
+    token_0_minter_address: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    token_1_minter_address: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    user_address: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    recipient_address: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    referral_address: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    # Compared exactly when legs are merged, so it is kept as a decimal.
+    query_id: Mapped[Decimal] = mapped_column(Numeric(20, 0), nullable=False)
+
+    amount_0_in: Mapped[int] = mapped_column(ExactInteger(), nullable=False, default=0)
+    amount_1_in: Mapped[int] = mapped_column(ExactInteger(), nullable=False, default=0)
+    amount_0_out: Mapped[int] = mapped_column(ExactInteger(), nullable=False, default=0)
+    amount_1_out: Mapped[int] = mapped_column(ExactInteger(), nullable=False, default=0)
+
+    lt: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    completion_lt: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    transaction_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
+
+# === === === === === === ===
@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, Numeric, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from src.database.database_models.column_types import ExactInteger
 from src.database.database_models.mixins.created_at_mixin import CreatedAtMixin
 from src.database.database_models.mixins.id_mixin import IdMixin
 from src.database.database_models.mixins.modified_at_mixin import ModifiedAtMixin
@@ -25,12 +26,19 @@ class TonDexPoolDb(
 ):
 
     __tablename__ = "ton_dex_pool"
+    __table_args__ = (
+        Index(
+            "ix_ton_dex_pool_minter_addresses",
+            "token_0_minter_address",
+            "token_1_minter_address",
+        ),
+    )
 
     # === === === Columns === === ===
     address: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
 
-    reserve_0: Mapped[int] = mapped_column(Numeric(asdecimal=False), nullable=False)
-    reserve_1: Mapped[int] = mapped_column(Numeric(asdecimal=False), nullable=False)
+    reserve_0: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    reserve_1: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
     token_0_minter_address: Mapped[str] = mapped_column(
         String(100), ForeignKey("ton_asset.address"), nullable=False
     )
@@ -43,14 +51,10 @@ class TonDexPoolDb(
     protocol_fee: Mapped[int] = mapped_column(Integer, nullable=False)
     ref_fee: Mapped[int] = mapped_column(Integer, nullable=False)
     protocol_fee_address: Mapped[str] = mapped_column(String(100), nullable=False)
-    collected_token_0_protocol_fee: Mapped[int] = mapped_column(
-        Numeric(asdecimal=False), nullable=False
-    )
-    collected_token_1_protocol_fee: Mapped[int] = mapped_column(
-        Numeric(asdecimal=False), nullable=False
-    )
+    collected_token_0_protocol_fee: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    collected_token_1_protocol_fee: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
 
-    total_supply: Mapped[int] = mapped_column(Numeric(asdecimal=False), nullable=False)
+    total_supply: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
 
     # === === === Relationships === === ===
 
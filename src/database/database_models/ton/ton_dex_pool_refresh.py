@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.database.database_models.mixins.created_at_mixin import CreatedAtMixin
+
+from ..base import Base
+
+# === === === === === === ===
+
+
+class TonDexPoolRefreshDb(
+    Base,
+    CreatedAtMixin,
+):
+    """Pools with router activity whose state is still to be refreshed.
+
+    Rows are added with the transaction page they were detected in and deleted
+    once the pool is saved. Failed refreshes are retried with backoff.
+    """
+
+    __tablename__ = "ton_dex_pool_refresh_queue"
+    __table_args__ = (Index("ix_ton_dex_pool_refresh_queue_next_attempt_at", "next_attempt_at"),)
+
+    # === === === Columns === === ===
+    pool_address: Mapped[str] = mapped_column(String(100), primary_key=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_error: Mapped[str | None] = mapped_column(String(), nullable=True)
+
+
+# === === === === === === ===
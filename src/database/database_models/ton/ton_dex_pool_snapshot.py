@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.database.database_models.column_types import ExactInteger
+
+from ..base import Base
+
+# === === === === === === ===
+
+
+class TonDexPoolSnapshotDb(Base):
+    """Append-only history of the pool state, one row per pool per observer cycle.
+
+    Only pools refreshed by a cycle get a row. Old rows are downsampled by
+    `TonDexPoolSnapshotRepository.downsample`, keeping the last row per bucket.
+    """
+
+    __tablename__ = "ton_dex_pool_snapshot"
+
+    # === === === Columns === === ===
+    pool_address: Mapped[str] = mapped_column(String(100), primary_key=True)
+    time: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+
+    reserve_0: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    reserve_1: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    total_supply: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    collected_token_0_protocol_fee: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    collected_token_1_protocol_fee: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+
+
+# === === === === === === ===
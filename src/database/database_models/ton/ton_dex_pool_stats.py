@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.database.database_models.column_types import ExactInteger
+
+from ..base import Base
+
+# === === === === === === ===
+
+
+class TonDexPoolStatsDb(Base):
+    """Precomputed pool metrics, rewritten by `PoolStatsCalculator` every observer cycle.
+
+    TON values are in nanotons and are NULL when neither pool token can be
+    priced in TON. `fee_apr` is a fraction, e.g. 0.12 for 12%.
+    """
+
+    __tablename__ = "ton_dex_pool_stats"
+
+    # === === === Columns === === ===
+    pool_address: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    tvl_ton: Mapped[int | None] = mapped_column(ExactInteger(), nullable=True)
+    volume_24h_0: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    volume_24h_1: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    volume_24h_ton: Mapped[int | None] = mapped_column(ExactInteger(), nullable=True)
+    fee_apr: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+# === === === === === === ===
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.database.database_models.column_types import ExactInteger
+
+from ..base import Base
+
+# === === === === === === ===
+
+
+class TonStakingStateDb(Base):
+    """Latest stake data of a staking contract, rewritten by `StakingObserver`."""
+
+    __tablename__ = "ton_staking_state"
+
+    # === === === Columns === === ===
+    contract_address: Mapped[str] = mapped_column(String(48), primary_key=True)
+
+    price: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    reference_offer_amount: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+    reference_jetton_amount: Mapped[int] = mapped_column(ExactInteger(), nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+# === === === === === === ===
@@ -0,0 +1,139 @@
+# === === === === === === ===
+
+import os
+import socket
+import time
+import zlib
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from src.utils.logging.logging import create_custom_logger
+from src.utils.singleton import SingletonMeta
+
+# === === === === === === ===
+
+logger = create_custom_logger("LeaderElection")
+
+LEADER_LOCK_NAME = "terminus_dex_background_tasks"
+
+# === === === === === === ===
+
+
+class LeaderElection(metaclass=SingletonMeta):
+    """Elects the process that runs the background tasks among all workers.
+
+    The leader holds a session-level Postgres advisory lock on a dedicated
+    connection. Postgres releases the lock when that connection ends, so if
+    the leader dies another worker takes over on its next `campaign`. The
+    leader tags its connection with its identity so any worker can report it.
+    """
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        lock_name: str = LEADER_LOCK_NAME,
+    ) -> None:
+
+        self.engine = engine
+        # Fits the low half of a bigint key, so it's `pg_locks.objid` with `classid = 0`.
+        self.lock_key = zlib.crc32(lock_name.encode())
+        self.identity = f"{socket.gethostname()}:{os.getpid()}"
+
+        self.is_leader = False
+        self.elected_at: float | None = None
+        self._connection: AsyncConnection | None = None
+
+    # === === === === === === ===
+
+    async def campaign(self) -> bool:
+        """Checks the held leadership or tries to take it. Returns whether this process leads."""
+
+        if self._connection is not None:
+            try:
+                await self._connection.execute(text("SELECT 1"))
+                return True
+            except Exception as e:
+                logger.warning("Leader connection lost, stepping down: %s", e)
+                await self._drop_connection()
+
+        connection = await self.engine.connect()
+        try:
+            # Never idle in a transaction while holding the lock.
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+            result = await connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.lock_key}
+            )
+            if not result.scalar():
+                await connection.close()
+                return False
+
+            await connection.execute(
+                text("SELECT set_config('application_name', :name, false)"),
+                {"name": f"leader {self.identity}"[:63]},
+            )
+        except Exception as e:
+            logger.warning("Leader election failed: %s", e)
+            await connection.invalidate()
+            return False
+
+        self._connection = connection
+        self.is_leader = True
+        self.elected_at = time.time()
+        logger.info("Elected as leader: %s", self.identity)
+
+        return True
+
+    # === === === === === === ===
+
+    async def resign(self) -> None:
+
+        if self._connection is None:
+            return
+
+        logger.info("Resigning leadership: %s", self.identity)
+        await self._drop_connection()
+
+    # === === === === === === ===
+
+    async def get_leader(self) -> str | None:
+        """Returns the identity of the current leader, in any process."""
+
+        async with self.engine.connect() as connection:
+            result = await connection.execute(
+                text(
+                    "SELECT activity.application_name FROM pg_locks AS locks "
+                    "JOIN pg_stat_activity AS activity ON activity.pid = locks.pid "
+                    "WHERE locks.locktype = 'advisory' AND locks.granted "
+                    "AND locks.classid = 0 AND locks.objid = :key AND locks.objsubid = 1"
+                ),
+                {"key": self.lock_key},
+            )
+            application_name = result.scalar_one_or_none()
+
+        if application_name is None:
+            return None
+
+        return application_name.removeprefix("leader ")
+
+    # === === === === === === ===
+
+    async def _drop_connection(self) -> None:
+
+        connection = self._connection
+        self._connection = None
+        self.is_leader = False
+        self.elected_at = None
+
+        if connection is None:
+            return
+
+        # Invalidated rather than returned to the pool, which would keep the lock alive.
+        try:
+            await connection.invalidate()
+        except Exception:
+            pass
+
+
+# === === === === === === ===
@@ -1,8 +1,9 @@
 # === === === === === === ===
 
-from typing import Literal
+from typing import Literal, cast
 
 from sqlalchemy import select
+from src.blockchains.ton.schemas.transaction_cursor import TransactionCursor
 from src.database.repositories.base_repo import BaseRepository
 
 from ..database_models.storage import StorageCellDb
@@ -65,3 +66,32 @@ class StorageCellRepo(BaseRepository):
         return element
 
     # === === === === === === ===
+
+    async def get_transaction_cursor(
+        self,
+        name: str,
+    ) -> TransactionCursor:
+
+        return TransactionCursor(
+            after_lt=cast(int | None, await self.get_value(f"{name}_after_lt", "int")),
+            before_lt=cast(int | None, await self.get_value(f"{name}_before_lt", "int")),
+            sweep_max_lt=cast(int | None, await self.get_value(f"{name}_sweep_max_lt", "int")),
+        )
+
+    # === === === === === === ===
+
+    async def set_transaction_cursor(
+        self,
+        name: str,
+        cursor: TransactionCursor,
+        needs_flush: bool = False,
+    ) -> None:
+
+        await self.set(f"{name}_after_lt", value=cursor.after_lt)
+        await self.set(f"{name}_before_lt", value=cursor.before_lt)
+        await self.set(f"{name}_sweep_max_lt", value=cursor.sweep_max_lt)
+
+        if needs_flush:
+            await self.session.flush()
+
+    # === === === === === === ===
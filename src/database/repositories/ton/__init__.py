@@ -1,5 +1,7 @@
 from .ton_staking_contract_repo import TonStakingContractRepository
+from .ton_staking_state_repository import TonStakingStateRepository
 
 __all__ = [
     "TonStakingContractRepository",
+    "TonStakingStateRepository",
 ]
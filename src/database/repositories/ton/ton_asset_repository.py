@@ -2,11 +2,26 @@ from datetime import UTC, datetime
 from typing import List
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from src.utils.ton_address import TonAddress
 
 from ...database_models.ton import TonAssetDb
 from ..base_repo import BaseRepository
 
+# Rows per INSERT, 10 parameters each, well within the bind parameter limit.
+UPSERT_BATCH_SIZE = 1000
+
+# Registry metadata overwritten when an upserted asset already exists.
+UPSERT_UPDATED_COLUMNS = [
+    "name",
+    "symbol",
+    "decimals",
+    "image_url",
+    "is_whitelisted",
+    "is_community",
+    "is_blacklisted",
+]
+
 
 class TonAssetRepository(BaseRepository):
 
@@ -166,3 +181,68 @@ class TonAssetRepository(BaseRepository):
         return assets
 
     # === === ===  === === ===
+
+    # === === === Get Many TonAssetDb === === ===
+    async def get_many(
+        self,
+        addresses: List[TonAddress],
+        deleted: bool = False,
+    ) -> List[TonAssetDb]:
+
+        if not addresses:
+            return []
+
+        query = select(TonAssetDb).where(
+            TonAssetDb.address.in_([address.to_string() for address in addresses])
+        )
+
+        if not deleted:
+            query = query.where(TonAssetDb.is_deleted.is_not(True))
+
+        result = await self.session.execute(query)
+        assets = list(result.unique().scalars().all())
+
+        return assets
+
+    # === === ===  === === ===
+
+    # === === === Upsert Many TonAssetDb === === ===
+    async def upsert_many(
+        self,
+        assets: List[TonAssetDb],
+    ) -> None:
+        """Inserts new assets and updates the registry metadata of existing ones.
+
+        Takes transient `TonAssetDb` objects. Local flags (`is_deprecated`,
+        `account_address`) of existing assets are kept.
+        """
+
+        # A statement can't update the same row twice.
+        assets = list({asset.address: asset for asset in assets}.values())
+
+        for start in range(0, len(assets), UPSERT_BATCH_SIZE):
+            query = insert(TonAssetDb).values(
+                [
+                    {
+                        "address": asset.address,
+                        "name": asset.name,
+                        "symbol": asset.symbol,
+                        "decimals": asset.decimals,
+                        "image_url": asset.image_url,
+                        "is_whitelisted": bool(asset.is_whitelisted),
+                        "is_community": bool(asset.is_community),
+                        "is_deprecated": bool(asset.is_deprecated),
+                        "is_blacklisted": bool(asset.is_blacklisted),
+                        "is_deleted": False,
+                    }
+                    for asset in assets[start : start + UPSERT_BATCH_SIZE]
+                ]
+            )
+            query = query.on_conflict_do_update(
+                index_elements=[TonAssetDb.address],
+                set_={column: query.excluded[column] for column in UPSERT_UPDATED_COLUMNS},
+            )
+
+            await self.session.execute(query)
+
+    # === === ===  === === ===
@@ -0,0 +1,136 @@
+# === === === === === === ===
+
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert
+from src.database.database_models.ton.ton_dex_candle import TonDexCandleDb
+from src.database.repositories.base_repo import BaseRepository
+from src.utils.ton_address import TonAddress
+
+# === === === === === === ===
+
+# Rows per INSERT, 12 parameters each.
+MERGE_BATCH_SIZE = 1000
+
+# === === === === === === ===
+
+
+class TonDexCandleRepository(BaseRepository):
+
+    # === === === === === === ===
+
+    async def merge_many(
+        self,
+        candles: List[TonDexCandleDb],
+    ) -> None:
+        """Merges partial candles into the stored ones.
+
+        Takes transient `TonDexCandleDb` objects, unique per pool, resolution
+        and open time. Open and close are taken from the candle with the lowest
+        `first_lt` and the highest `last_lt`, so the merge is order independent.
+        """
+
+        for start in range(0, len(candles), MERGE_BATCH_SIZE):
+            query = insert(TonDexCandleDb).values(
+                [
+                    {
+                        "pool_address": candle.pool_address,
+                        "resolution": candle.resolution,
+                        "open_time": candle.open_time,
+                        "open": candle.open,
+                        "high": candle.high,
+                        "low": candle.low,
+                        "close": candle.close,
+                        "volume_0": candle.volume_0,
+                        "volume_1": candle.volume_1,
+                        "trades_count": candle.trades_count,
+                        "first_lt": candle.first_lt,
+                        "last_lt": candle.last_lt,
+                    }
+                    for candle in candles[start : start + MERGE_BATCH_SIZE]
+                ]
+            )
+            stored = TonDexCandleDb.__table__.c
+            query = query.on_conflict_do_update(
+                index_elements=["pool_address", "resolution", "open_time"],
+                set_={
+                    "open": case(
+                        (query.excluded.first_lt < stored.first_lt, query.excluded.open),
+                        else_=stored.open,
+                    ),
+                    "close": case(
+                        (query.excluded.last_lt > stored.last_lt, query.excluded.close),
+                        else_=stored.close,
+                    ),
+                    "high": func.greatest(stored.high, query.excluded.high),
+                    "low": func.least(stored.low, query.excluded.low),
+                    "volume_0": stored.volume_0 + query.excluded.volume_0,
+                    "volume_1": stored.volume_1 + query.excluded.volume_1,
+                    "trades_count": stored.trades_count + query.excluded.trades_count,
+                    "first_lt": func.least(stored.first_lt, query.excluded.first_lt),
+                    "last_lt": func.greatest(stored.last_lt, query.excluded.last_lt),
+                },
+            )
+
+            await self.session.execute(query)
+
+    # === === === === === === ===
+
+    async def get_range(
+        self,
+        pool_address: TonAddress,
+        resolution: str,
+        start: datetime,
+        end: datetime,
+        limit: int = 1000,
+    ) -> List[TonDexCandleDb]:
+
+        query = (
+            select(TonDexCandleDb)
+            .where(
+                TonDexCandleDb.pool_address == pool_address.to_string(),
+                TonDexCandleDb.resolution == resolution,
+                TonDexCandleDb.open_time >= start,
+                TonDexCandleDb.open_time < end,
+            )
+            .order_by(TonDexCandleDb.open_time)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(query)
+        candles = list(result.scalars().all())
+
+        return candles
+
+    # === === === === === === ===
+
+    async def get_volumes(
+        self,
+        resolution: str,
+        since: datetime,
+    ) -> Dict[str, Tuple[int, int]]:
+        """Returns the token volumes of every traded pool since `since`, by pool address."""
+
+        query = (
+            select(
+                TonDexCandleDb.pool_address,
+                func.sum(TonDexCandleDb.volume_0),
+                func.sum(TonDexCandleDb.volume_1),
+            )
+            .where(
+                TonDexCandleDb.resolution == resolution,
+                TonDexCandleDb.open_time >= since,
+            )
+            .group_by(TonDexCandleDb.pool_address)
+        )
+
+        result = await self.session.execute(query)
+
+        return {
+            pool_address: (int(volume_0), int(volume_1))
+            for pool_address, volume_0, volume_1 in result.all()
+        }
+
+    # === === === === === === ===
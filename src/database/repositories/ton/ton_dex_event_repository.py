@@ -0,0 +1,132 @@
+# === === === === === === ===
+
+from datetime import UTC, datetime
+from typing import ClassVar, Iterable, List, Set, Tuple
+
+from sqlalchemy import or_, select, text, update
+from src.database.database_models.ton.ton_dex_event import TonDexEventDb
+from src.database.repositories.base_repo import BaseRepository
+from src.utils.ton_address import TonAddress
+
+# === === === === === === ===
+
+
+class TonDexEventRepository(BaseRepository):
+
+    # Monthly partitions known to exist, shared by all sessions of the process.
+    created_partitions: ClassVar[Set[Tuple[int, int]]] = set()
+
+    # === === === === === === ===
+
+    async def ensure_partitions(
+        self,
+        times: Iterable[datetime],
+    ) -> None:
+
+        for year, month in {(time.year, time.month) for time in times}:
+            if (year, month) in TonDexEventRepository.created_partitions:
+                continue
+
+            start = datetime(year, month, 1, tzinfo=UTC)
+            end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=UTC)
+
+            await self.session.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS ton_dex_event_y{year}m{month:02d} "
+                    f"PARTITION OF ton_dex_event "
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                )
+            )
+            TonDexEventRepository.created_partitions.add((year, month))
+
+    # === === === === === === ===
+
+    async def create_many(
+        self,
+        events: List[TonDexEventDb],
+        needs_flush: bool = False,
+    ) -> None:
+
+        await self.ensure_partitions(event.time for event in events)
+
+        self.session.add_all(events)
+
+        if needs_flush:
+            await self.session.flush()
+
+    # === === === === === === ===
+
+    async def get_indexed_lts(
+        self,
+        lts: Set[int],
+    ) -> Tuple[Set[int], Set[int]]:
+        """Returns which of the lts are already indexed as `lt` and as `completion_lt`."""
+
+        if not lts:
+            return set(), set()
+
+        query = select(TonDexEventDb.lt, TonDexEventDb.completion_lt).where(
+            or_(TonDexEventDb.lt.in_(lts), TonDexEventDb.completion_lt.in_(lts))
+        )
+
+        result = await self.session.execute(query)
+        rows = result.all()
+
+        return (
+            {lt for lt, _ in rows if lt in lts},
+            {completion_lt for _, completion_lt in rows if completion_lt in lts},
+        )
+
+    # === === === === === === ===
+
+    async def get_incomplete_swaps(
+        self,
+        pool_addresses: Set[TonAddress],
+        since: datetime,
+        until: datetime,
+    ) -> List[TonDexEventDb]:
+        """Returns the swaps of the pools with only one of their two legs indexed.
+
+        Only swaps in the `[since, until]` time range are returned, which also
+        limits the scanned partitions.
+        """
+
+        if not pool_addresses:
+            return []
+
+        query = select(TonDexEventDb).where(
+            TonDexEventDb.event_type == "swap",
+            TonDexEventDb.time >= since,
+            TonDexEventDb.time <= until,
+            TonDexEventDb.pool_address.in_([address.to_string() for address in pool_addresses]),
+            or_(TonDexEventDb.lt.is_(None), TonDexEventDb.completion_lt.is_(None)),
+        )
+
+        result = await self.session.execute(query)
+        events = list(result.scalars().all())
+
+        return events
+
+    # === === === === === === ===
+
+    async def expire_swaps(
+        self,
+        before: datetime,
+    ) -> int:
+        """Marks the pending swaps older than `before` as expired. Returns their count."""
+
+        query = (
+            update(TonDexEventDb)
+            .where(
+                TonDexEventDb.event_type == "swap",
+                TonDexEventDb.status == "pending",
+                TonDexEventDb.time < before,
+            )
+            .values(status="expired")
+        )
+
+        result = await self.session.execute(query)
+
+        return result.rowcount
+
+    # === === === === === === ===
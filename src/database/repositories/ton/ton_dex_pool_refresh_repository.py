@@ -0,0 +1,77 @@
+# === === === === === === ===
+
+from datetime import datetime
+from typing import Iterable, List
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from src.database.database_models.ton.ton_dex_pool_refresh import TonDexPoolRefreshDb
+from src.database.repositories.base_repo import BaseRepository
+from src.utils.ton_address import TonAddress
+
+# === === === === === === ===
+
+
+class TonDexPoolRefreshRepository(BaseRepository):
+
+    # === === === === === === ===
+
+    async def enqueue_many(
+        self,
+        pool_addresses: Iterable[TonAddress],
+        now: datetime,
+    ) -> None:
+        """Queues the pools for an immediate refresh. Pools already queued keep their backoff."""
+
+        values = [
+            {"pool_address": address, "attempts": 0, "next_attempt_at": now}
+            for address in sorted({pool_address.to_string() for pool_address in pool_addresses})
+        ]
+        if not values:
+            return
+
+        query = insert(TonDexPoolRefreshDb).values(values).on_conflict_do_nothing()
+        await self.session.execute(query)
+
+    # === === === === === === ===
+
+    async def get_due(
+        self,
+        now: datetime,
+        limit: int,
+    ) -> List[TonDexPoolRefreshDb]:
+
+        query = (
+            select(TonDexPoolRefreshDb)
+            .where(TonDexPoolRefreshDb.next_attempt_at <= now)
+            .order_by(TonDexPoolRefreshDb.next_attempt_at)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(query)
+        refreshes = list(result.scalars().all())
+
+        return refreshes
+
+    # === === === === === === ===
+
+    async def get_pool_addresses(
+        self,
+    ) -> List[str]:
+        """Returns the addresses of all queued pools, due or not."""
+
+        result = await self.session.execute(select(TonDexPoolRefreshDb.pool_address))
+
+        return list(result.scalars().all())
+
+    # === === === === === === ===
+
+    async def delete_many(
+        self,
+        refreshes: Iterable[TonDexPoolRefreshDb],
+    ) -> None:
+
+        for refresh in refreshes:
+            await self.session.delete(refresh)
+
+    # === === === === === === ===
@@ -1,15 +1,33 @@
 # === === === === === === ===
 
 from datetime import UTC, datetime
-from typing import List
+from typing import List, Set
 
-from sqlalchemy import select
+from sqlalchemy import literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 from src.database.database_models.ton.ton_dex_pool import TonDexPoolDb
 from src.database.repositories.base_repo import BaseRepository
 from src.utils.ton_address import TonAddress
 
 # === === === === === === ===
 
+# Keeps a single statement well below the bind parameter limit.
+UPSERT_BATCH_SIZE = 1000
+
+# Columns overwritten when an upserted pool already exists.
+UPSERT_UPDATED_COLUMNS = [
+    "reserve_0",
+    "reserve_1",
+    "lp_fee",
+    "protocol_fee",
+    "ref_fee",
+    "collected_token_0_protocol_fee",
+    "collected_token_1_protocol_fee",
+    "total_supply",
+]
+
+# === === === === === === ===
+
 
 class TonDexPoolRepository(BaseRepository):
 
@@ -169,3 +187,59 @@ class TonDexPoolRepository(BaseRepository):
         return pools
 
     # === === === === === === ===
+
+    async def upsert_many(
+        self,
+        pools: List[TonDexPoolDb],
+    ) -> Set[TonAddress]:
+        """Inserts new pools and updates the state of existing ones by address.
+
+        Takes transient `TonDexPoolDb` objects and returns the addresses of the
+        inserted pools. Costs one statement per `UPSERT_BATCH_SIZE` pools.
+        """
+
+        inserted_addresses: Set[TonAddress] = set()
+
+        # A statement can't update the same row twice.
+        pools = list({pool.address: pool for pool in pools}.values())
+
+        for start in range(0, len(pools), UPSERT_BATCH_SIZE):
+            query = insert(TonDexPoolDb).values(
+                [
+                    {
+                        "address": pool.address,
+                        "reserve_0": pool.reserve_0,
+                        "reserve_1": pool.reserve_1,
+                        "token_0_minter_address": pool.token_0_minter_address,
+                        "token_1_minter_address": pool.token_1_minter_address,
+                        "token_0_wallet_address": pool.token_0_wallet_address,
+                        "token_1_wallet_address": pool.token_1_wallet_address,
+                        "lp_fee": pool.lp_fee,
+                        "protocol_fee": pool.protocol_fee,
+                        "ref_fee": pool.ref_fee,
+                        "protocol_fee_address": pool.protocol_fee_address,
+                        "collected_token_0_protocol_fee": pool.collected_token_0_protocol_fee,
+                        "collected_token_1_protocol_fee": pool.collected_token_1_protocol_fee,
+                        "total_supply": pool.total_supply,
+                        "is_deleted": False,
+                    }
+                    for pool in pools[start : start + UPSERT_BATCH_SIZE]
+                ]
+            )
+            query = query.on_conflict_do_update(
+                index_elements=[TonDexPoolDb.address],
+                set_={column: query.excluded[column] for column in UPSERT_UPDATED_COLUMNS},
+            ).returning(
+                TonDexPoolDb.address,
+                # A row inserted by this statement has no deleting transaction id.
+                literal_column("xmax = 0").label("is_inserted"),
+            )
+
+            result = await self.session.execute(query)
+            inserted_addresses.update(
+                TonAddress(address) for address, is_inserted in result.all() if is_inserted
+            )
+
+        return inserted_addresses
+
+    # === === === === === === ===
@@ -0,0 +1,77 @@
+# === === === === === === ===
+
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import delete, exists, func
+from sqlalchemy.dialects.postgresql import insert
+from src.database.database_models.ton.ton_dex_pool import TonDexPoolDb
+from src.database.database_models.ton.ton_dex_pool_snapshot import TonDexPoolSnapshotDb
+from src.database.repositories.base_repo import BaseRepository
+
+# === === === === === === ===
+
+# Rows per INSERT, 7 parameters each.
+INSERT_BATCH_SIZE = 1000
+
+# === === === === === === ===
+
+
+class TonDexPoolSnapshotRepository(BaseRepository):
+
+    # === === === === === === ===
+
+    async def create_many(
+        self,
+        pools: List[TonDexPoolDb],
+        time: datetime,
+    ) -> None:
+        """Appends the current state of the pools, taken at `time`."""
+
+        for start in range(0, len(pools), INSERT_BATCH_SIZE):
+            query = insert(TonDexPoolSnapshotDb).values(
+                [
+                    {
+                        "pool_address": pool.address,
+                        "time": time,
+                        "reserve_0": pool.reserve_0,
+                        "reserve_1": pool.reserve_1,
+                        "total_supply": pool.total_supply,
+                        "collected_token_0_protocol_fee": pool.collected_token_0_protocol_fee,
+                        "collected_token_1_protocol_fee": pool.collected_token_1_protocol_fee,
+                    }
+                    for pool in pools[start : start + INSERT_BATCH_SIZE]
+                ]
+            )
+            await self.session.execute(query.on_conflict_do_nothing())
+
+    # === === === === === === ===
+
+    async def downsample(
+        self,
+        bucket: str,
+        before: datetime,
+    ) -> int:
+        """Keeps only the last snapshot per pool and `bucket` ("hour", "day") before `before`.
+
+        Returns the deleted rows count.
+        """
+
+        snapshot = TonDexPoolSnapshotDb.__table__
+        newer = snapshot.alias("newer")
+
+        query = delete(snapshot).where(
+            snapshot.c.time < before,
+            exists().where(
+                newer.c.pool_address == snapshot.c.pool_address,
+                newer.c.time > snapshot.c.time,
+                newer.c.time < before,
+                func.date_trunc(bucket, newer.c.time) == func.date_trunc(bucket, snapshot.c.time),
+            ),
+        )
+
+        result = await self.session.execute(query)
+
+        return result.rowcount
+
+    # === === === === === === ===
@@ -0,0 +1,79 @@
+# === === === === === === ===
+
+from typing import List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from src.database.database_models.ton.ton_dex_pool import TonDexPoolDb
+from src.database.database_models.ton.ton_dex_pool_stats import TonDexPoolStatsDb
+from src.database.repositories.base_repo import BaseRepository
+
+# === === === === === === ===
+
+# Rows per INSERT, 7 parameters each.
+UPSERT_BATCH_SIZE = 1000
+
+# === === === === === === ===
+
+
+class TonDexPoolStatsRepository(BaseRepository):
+
+    # === === === === === === ===
+
+    async def upsert_many(
+        self,
+        stats: List[TonDexPoolStatsDb],
+    ) -> None:
+
+        for start in range(0, len(stats), UPSERT_BATCH_SIZE):
+            query = insert(TonDexPoolStatsDb).values(
+                [
+                    {
+                        "pool_address": pool_stats.pool_address,
+                        "tvl_ton": pool_stats.tvl_ton,
+                        "volume_24h_0": pool_stats.volume_24h_0,
+                        "volume_24h_1": pool_stats.volume_24h_1,
+                        "volume_24h_ton": pool_stats.volume_24h_ton,
+                        "fee_apr": pool_stats.fee_apr,
+                        "updated_at": pool_stats.updated_at,
+                    }
+                    for pool_stats in stats[start : start + UPSERT_BATCH_SIZE]
+                ]
+            )
+            query = query.on_conflict_do_update(
+                index_elements=[TonDexPoolStatsDb.pool_address],
+                set_={
+                    column: query.excluded[column]
+                    for column in (
+                        "tvl_ton",
+                        "volume_24h_0",
+                        "volume_24h_1",
+                        "volume_24h_ton",
+                        "fee_apr",
+                        "updated_at",
+                    )
+                },
+            )
+
+            await self.session.execute(query)
+
+    # === === === === === === ===
+
+    async def get_pools_with_stats(
+        self,
+    ) -> List[Tuple[TonDexPoolDb, TonDexPoolStatsDb | None]]:
+        """Returns the active pools with their stats, if already computed."""
+
+        query = (
+            select(TonDexPoolDb, TonDexPoolStatsDb)
+            .outerjoin(TonDexPoolStatsDb, TonDexPoolStatsDb.pool_address == TonDexPoolDb.address)
+            .where(TonDexPoolDb.is_deleted.is_(False))
+            .order_by(TonDexPoolDb.id)
+        )
+
+        result = await self.session.execute(query)
+        rows = [(pool, stats) for pool, stats in result.unique().all()]
+
+        return rows
+
+    # === === === === === === ===
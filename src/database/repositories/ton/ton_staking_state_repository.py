@@ -0,0 +1,64 @@
+# === === === === === === ===
+
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from ...database_models.ton.ton_staking_state import TonStakingStateDb
+from ..base_repo import BaseRepository
+
+# === === === === === === ===
+
+
+class TonStakingStateRepository(BaseRepository):
+
+    # === === === === === === ===
+
+    async def upsert_many(
+        self,
+        states: List[TonStakingStateDb],
+    ) -> None:
+
+        if not states:
+            return
+
+        query = insert(TonStakingStateDb).values(
+            [
+                {
+                    "contract_address": state.contract_address,
+                    "price": state.price,
+                    "is_active": state.is_active,
+                    "reference_offer_amount": state.reference_offer_amount,
+                    "reference_jetton_amount": state.reference_jetton_amount,
+                    "updated_at": state.updated_at,
+                }
+                for state in states
+            ]
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[TonStakingStateDb.contract_address],
+            set_={
+                column: query.excluded[column]
+                for column in (
+                    "price",
+                    "is_active",
+                    "reference_offer_amount",
+                    "reference_jetton_amount",
+                    "updated_at",
+                )
+            },
+        )
+
+        await self.session.execute(query)
+
+    # === === === === === === ===
+
+    async def get_all(self) -> List[TonStakingStateDb]:
+
+        result = await self.session.execute(select(TonStakingStateDb))
+        states = list(result.scalars().all())
+
+        return states
+
+    # === === === === === === ===
@@ -53,3 +53,19 @@ class TonAsset(BaseModel):
         )
 
     # === === === === === === ===
+
+    def to_db_model(self) -> TonAssetDb:
+
+        return TonAssetDb(
+            address=self.address.to_string(),
+            symbol=self.symbol,
+            name=self.name,
+            image_url=self.image_url,
+            decimals=self.decimals,
+            is_whitelisted=self.is_whitelisted,
+            is_community=self.is_community,
+            is_deprecated=self.is_deprecated,
+            is_blacklisted=self.is_blacklisted,
+        )
+
+    # === === === === === === ===
@@ -0,0 +1,224 @@
+# === === === === === === ===
+
+from math import isqrt
+from typing import List, Sequence, Tuple
+
+from src.exceptions.ton_dex_exceptions import NotEnoughLiquidityError
+
+# === === === === === === ===
+
+FEE_DIVIDER = 10000
+REQUIRED_MIN_LIQUIDITY = 1000
+
+# === === === === === === ===
+# Integer-only mirrors of the pool contract formulas.
+# Every division rounds exactly like the contract does, so the results match on-chain amounts.
+# === === === === === === ===
+
+
+def _divc(
+    numerator: int,
+    denominator: int,
+) -> int:
+
+    return -(-numerator // denominator)
+
+
+# === === === === === === ===
+
+
+def _get_fees_out(
+    base_out: int,
+    has_ref: bool,
+    protocol_fee: int,
+    ref_fee: int,
+) -> Tuple[int, int]:
+    """Returns `(protocol_fee_out, ref_fee_out)` taken from the pool output."""
+
+    protocol_fee_out = _divc(base_out * protocol_fee, FEE_DIVIDER) if protocol_fee > 0 else 0
+    ref_fee_out = _divc(base_out * ref_fee, FEE_DIVIDER) if has_ref and ref_fee > 0 else 0
+
+    return (protocol_fee_out, ref_fee_out)
+
+
+# === === === === === === ===
+
+
+def _get_net_out(
+    base_out: int,
+    has_ref: bool,
+    protocol_fee: int,
+    ref_fee: int,
+) -> int:
+
+    return base_out - sum(_get_fees_out(base_out, has_ref, protocol_fee, ref_fee))
+
+
+# === === === === === === ===
+
+
+def get_amount_out(
+    has_ref: bool,
+    amount_in: int,
+    reserve_in: int,
+    reserve_out: int,
+    lp_fee: int,
+    protocol_fee: int,
+    ref_fee: int,
+) -> Tuple[int, int, int]:
+    """Returns `(amount_out, protocol_fee_out, ref_fee_out)` of a swap, as the pool pays them."""
+
+    if amount_in <= 0 or reserve_in <= 0 or reserve_out <= 0:
+        return (0, 0, 0)
+
+    amount_in_with_fee = amount_in * (FEE_DIVIDER - lp_fee)
+    base_out = amount_in_with_fee * reserve_out // (reserve_in * FEE_DIVIDER + amount_in_with_fee)
+    protocol_fee_out, ref_fee_out = _get_fees_out(base_out, has_ref, protocol_fee, ref_fee)
+
+    return (base_out - protocol_fee_out - ref_fee_out, protocol_fee_out, ref_fee_out)
+
+
+# === === === === === === ===
+
+
+def get_amounts_out(
+    has_ref: bool,
+    amounts_in: Sequence[int],
+    reserve_in: int,
+    reserve_out: int,
+    lp_fee: int,
+    protocol_fee: int,
+    ref_fee: int,
+) -> List[Tuple[int, int, int]]:
+    """Same as `get_amount_out` for many inputs over the same reserves.
+
+    Pool constants are computed once for the whole sequence, which makes a
+    quote curve of hundreds of points cost about as much as a few single quotes.
+    """
+
+    if reserve_in <= 0 or reserve_out <= 0:
+        return [(0, 0, 0)] * len(amounts_in)
+
+    lp_multiplier = FEE_DIVIDER - lp_fee
+    scaled_reserve_in = reserve_in * FEE_DIVIDER
+
+    results: List[Tuple[int, int, int]] = []
+
+    for amount_in in amounts_in:
+        if amount_in <= 0:
+            results.append((0, 0, 0))
+            continue
+
+        amount_in_with_fee = amount_in * lp_multiplier
+        base_out = amount_in_with_fee * reserve_out // (scaled_reserve_in + amount_in_with_fee)
+        protocol_fee_out, ref_fee_out = _get_fees_out(base_out, has_ref, protocol_fee, ref_fee)
+
+        results.append((base_out - protocol_fee_out - ref_fee_out, protocol_fee_out, ref_fee_out))
+
+    return results
+
+
+# === === === === === === ===
+
+
+def get_amount_in(
+    has_ref: bool,
+    amount_out: int,
+    reserve_in: int,
+    reserve_out: int,
+    lp_fee: int,
+    protocol_fee: int,
+    ref_fee: int,
+) -> int:
+    """Returns the minimal input, for which `get_amount_out` pays at least `amount_out`."""
+
+    if amount_out <= 0:
+        return 0
+
+    fees = max(protocol_fee, 0) + (max(ref_fee, 0) if has_ref else 0)
+    if fees >= FEE_DIVIDER:
+        raise NotEnoughLiquidityError()
+
+    # Minimal output before protocol and referral fees. Fees are rounded up separately,
+    # so the estimate is corrected by a few units.
+    base_out = _divc(amount_out * FEE_DIVIDER, FEE_DIVIDER - fees)
+    while _get_net_out(base_out - 1, has_ref, protocol_fee, ref_fee) >= amount_out:
+        base_out -= 1
+    while _get_net_out(base_out, has_ref, protocol_fee, ref_fee) < amount_out:
+        base_out += 1
+
+    if (
+        base_out >= reserve_out
+        or _get_net_out(reserve_out - 1, has_ref, protocol_fee, ref_fee) < amount_out
+    ):
+        raise NotEnoughLiquidityError()
+
+    amount_in = _divc(
+        base_out * reserve_in * FEE_DIVIDER,
+        (FEE_DIVIDER - lp_fee) * (reserve_out - base_out),
+    )
+
+    # The pool may round the output a unit above `base_out`, where a fee rounds up
+    # and the net output drops below `amount_out` again.
+    while True:
+        net_out, _, _ = get_amount_out(
+            has_ref, amount_in, reserve_in, reserve_out, lp_fee, protocol_fee, ref_fee
+        )
+        if net_out >= amount_out:
+            return amount_in
+        amount_in += 1
+
+
+# === === === === === === ===
+
+
+def add_slippage(
+    amount: int,
+    slippage_tolerance: float,
+) -> int:
+    """Returns `amount` raised by `slippage_tolerance` percent, rounded up to whole units."""
+
+    slippage_bps = round(slippage_tolerance * 100)
+
+    return _divc(amount * (FEE_DIVIDER + slippage_bps), FEE_DIVIDER)
+
+
+# === === === === === === ===
+
+
+def get_expected_lp_tokens(
+    amount_0: int,
+    amount_1: int,
+    reserve_0: int,
+    reserve_1: int,
+    total_supply: int,
+) -> int:
+    """Returns LP tokens minted for providing `amount_0` and `amount_1` (`get_expected_tokens`)."""
+
+    if total_supply == 0:
+        return isqrt(amount_0 * amount_1) // REQUIRED_MIN_LIQUIDITY
+
+    if reserve_0 <= 0 or reserve_1 <= 0:
+        return 0
+
+    return min(amount_0 * total_supply // reserve_0, amount_1 * total_supply // reserve_1)
+
+
+# === === === === === === ===
+
+
+def get_expected_liquidity(
+    lp_amount: int,
+    reserve_0: int,
+    reserve_1: int,
+    total_supply: int,
+) -> Tuple[int, int]:
+    """Returns token amounts paid for burning `lp_amount` LP tokens (`get_expected_liquidity`)."""
+
+    if total_supply <= 0:
+        return (0, 0)
+
+    return (lp_amount * reserve_0 // total_supply, lp_amount * reserve_1 // total_supply)
+
+
+# === === === === === === ===
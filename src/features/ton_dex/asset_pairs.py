@@ -0,0 +1,67 @@
+# === === === === === === ===
+
+import json
+from typing import List, Tuple
+
+from src.blockchains.ton.constants import TonConstants
+from src.utils.singleton import SingletonMeta
+from src.utils.ton_address import TonAddress
+
+from .pool_graph import PoolGraph
+
+# === === === === === === ===
+
+
+class AssetPairsPayload(metaclass=SingletonMeta):
+    """Pre-serialized `/assets/pairs` response, with the proxy TON shown as TON.
+
+    The pairs only change when pools are added, which rebuilds `PoolGraph`,
+    so the payload is rebuilt once per graph version and served as is.
+    """
+
+    # === === === === === === ===
+
+    def __init__(self) -> None:
+
+        self._payload: bytes = b"[]"
+        self._version: int = 0
+
+    # === === === === === === ===
+
+    def get(
+        self,
+        proxy_ton_address: TonAddress,
+    ) -> bytes | None:
+        """Returns the payload, or `None` until the pool graph is first built."""
+
+        pool_graph = PoolGraph()
+        if pool_graph.version == 0:
+            return None
+
+        if self._version != pool_graph.version:
+            proxy_ton = proxy_ton_address.to_string()
+            ton = TonConstants.ContractAddresses.TON.to_string()
+            self._payload = self.serialize(
+                [
+                    (
+                        ton if token_0 == proxy_ton else token_0,
+                        ton if token_1 == proxy_ton else token_1,
+                    )
+                    for token_0, token_1 in pool_graph.get_pairs()
+                ]
+            )
+            self._version = pool_graph.version
+
+        return self._payload
+
+    # === === === === === === ===
+
+    @staticmethod
+    def serialize(
+        pairs: List[Tuple[str, str]],
+    ) -> bytes:
+
+        return json.dumps(pairs, separators=(",", ":")).encode()
+
+
+# === === === === === === ===
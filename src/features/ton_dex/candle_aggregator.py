@@ -0,0 +1,102 @@
+# === === === === === === ===
+
+from datetime import UTC, datetime
+from typing import Dict, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.database_models.ton.ton_dex_candle import TonDexCandleDb
+from src.database.database_models.ton.ton_dex_event import TonDexEventDb
+from src.database.repositories.ton.ton_dex_candle_repository import TonDexCandleRepository
+
+from .schemas import TonDexCandleResolution
+
+# === === === === === === ===
+
+
+class CandleAggregator:
+    """Rolls completed swaps into the candles of every resolution.
+
+    Swaps of a page are pre-aggregated per candle and merged into the stored
+    candles with a single upsert, so each swap is applied exactly once, when it
+    becomes complete, and candles are never recomputed.
+    """
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        session: AsyncSession,
+    ) -> None:
+
+        self.session = session
+
+    # === === === === === === ===
+
+    async def add_swaps(
+        self,
+        swaps: List[TonDexEventDb],
+    ) -> None:
+
+        candles: Dict[Tuple[str, str, datetime], TonDexCandleDb] = {}
+
+        for swap in swaps:
+            trade = self._get_trade(swap)
+            if trade is None:
+                continue
+            price, volume_0, volume_1 = trade
+
+            for resolution in TonDexCandleResolution:
+                timestamp = int(swap.time.timestamp())
+                open_time = datetime.fromtimestamp(timestamp - timestamp % resolution.seconds, UTC)
+                key = (swap.pool_address, resolution.value, open_time)
+
+                candle = candles.get(key)
+                if candle is None:
+                    candles[key] = TonDexCandleDb(
+                        pool_address=swap.pool_address,
+                        resolution=resolution.value,
+                        open_time=open_time,
+                        open=price,
+                        high=price,
+                        low=price,
+                        close=price,
+                        volume_0=volume_0,
+                        volume_1=volume_1,
+                        trades_count=1,
+                        first_lt=swap.lt,
+                        last_lt=swap.lt,
+                    )
+                    continue
+
+                if swap.lt < candle.first_lt:
+                    candle.open = price
+                    candle.first_lt = swap.lt
+                if swap.lt > candle.last_lt:
+                    candle.close = price
+                    candle.last_lt = swap.lt
+                candle.high = max(candle.high, price)
+                candle.low = min(candle.low, price)
+                candle.volume_0 += volume_0
+                candle.volume_1 += volume_1
+                candle.trades_count += 1
+
+        if candles:
+            await TonDexCandleRepository(session=self.session).merge_many(list(candles.values()))
+
+    # === === === === === === ===
+
+    @staticmethod
+    def _get_trade(
+        swap: TonDexEventDb,
+    ) -> Tuple[float, int, int] | None:
+        """Returns the price and the token volumes of a swap."""
+
+        if swap.amount_0_in and swap.amount_1_out:
+            return swap.amount_1_out / swap.amount_0_in, swap.amount_0_in, swap.amount_1_out
+        if swap.amount_1_in and swap.amount_0_out:
+            return swap.amount_1_in / swap.amount_0_out, swap.amount_0_out, swap.amount_1_in
+
+        return None
+
+
+# === === === === === === ===
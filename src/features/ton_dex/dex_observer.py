@@ -1,20 +1,39 @@
 # === === === === === === ===
 
+import asyncio
+import time
 from asyncio.locks import Lock
-from typing import Dict, List, Set, cast
+from datetime import UTC, datetime, timedelta
+from typing import Dict, List, NamedTuple, Set, Tuple, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.blockchains.ton.clients.ton_client import TonClient
 from src.blockchains.ton.constants import TonConstants
-from src.blockchains.ton.schemas.ton_jetton_info import TonJettonInfo
 from src.blockchains.ton.schemas.ton_transaction import TonTransaction
+from src.blockchains.ton.schemas.transaction_cursor import TransactionCursor
 from src.config.config import Config
+from src.database.database_models.ton.ton_dex_pool import TonDexPoolDb
+from src.database.database_models.ton.ton_dex_pool_refresh import TonDexPoolRefreshDb
 from src.database.repositories.storage_repo import StorageCellRepo
 from src.database.repositories.ton.ton_asset_repository import TonAssetRepository
+from src.database.repositories.ton.ton_dex_pool_refresh_repository import (
+    TonDexPoolRefreshRepository,
+)
 from src.database.repositories.ton.ton_dex_pool_repository import TonDexPoolRepository
+from src.database.repositories.ton.ton_dex_pool_snapshot_repository import (
+    TonDexPoolSnapshotRepository,
+)
 from src.features.ton_common.jetton_wallet_contract import JettonWalletContract
 from src.features.ton_common.schemas.ton_asset import TonAsset
+from src.features.ton_dex.event_indexer import DexEventIndexer
 from src.features.ton_dex.pool_contract import PoolContract
+from src.features.ton_dex.pool_graph import PoolGraph
+from src.features.ton_dex.pool_pair_index import PoolPairIndex
+from src.features.ton_dex.pool_state_store import PoolStateStore
+from src.features.ton_dex.pool_stats import PoolStatsCalculator
+from src.features.ton_dex.price_oracle import AssetPriceOracle
+from src.features.ton_dex.router_backfill import RouterBackfill
+from src.features.ton_dex.schemas import PoolData, PoolState
 from src.utils.logging.logging import create_custom_logger
 from src.utils.ton_address import TonAddress
 
@@ -22,12 +41,32 @@ from src.utils.ton_address import TonAddress
 
 logger = create_custom_logger("DexObserver")
 
+ROUTER_CURSOR_NAME = "router"
+POOLS_SYNCED_AT_KEY = "pools_synced_at"
+UNKNOWN_JETTON_RETRY_SECONDS = 30 * 60
+
+POOL_REFRESH_BASE_BACKOFF_SECONDS = 60
+POOL_REFRESH_MAX_BACKOFF_SECONDS = 6 * 60 * 60
+POOL_REFRESH_MAX_ATTEMPTS = 12
+
+# === === === === === === ===
+
+
+class FetchedPool(NamedTuple):
+
+    pool_data: PoolData
+    total_supply: int
+    token_0_minter_address: TonAddress
+    token_1_minter_address: TonAddress
+
+
 # === === === === === === ===
 
 
 class DexObserver:
 
     lock = Lock()
+    unknown_jettons_retry_at: Dict[TonAddress, float] = {}
 
     # === === === === === === ===
 
@@ -52,6 +91,8 @@ class DexObserver:
                 return
             async with DexObserver.lock:
                 await self._update_pools()
+                await self.update_prices()
+                await self.update_pool_stats()
         except Exception as e:
             logger.exception(e)
             raise e
@@ -71,66 +112,305 @@ class DexObserver:
             " ".join([address.to_string() for address in pool_addresses]),
         )
 
-        if not pool_addresses:
-            return
+        expired_count = await DexEventIndexer(
+            ton_client=self.ton_client, session=self.session
+        ).expire_swaps(now=datetime.now(UTC))
+        if expired_count:
+            logger.info("Expired %d swaps without a payout", expired_count)
 
-        logger.info("Retrieving all registered jettons...")
-        jettons = await self.get_all_jettons()
-        logger.info("Found %d jettons.", len(jettons))
-        jettons_dict: Dict[TonAddress, TonJettonInfo] = {
-            jetton.address: jetton for jetton in jettons
-        }
+        synced_at = time.time()
 
-        updated_assets = set()
+        updated_count, created_count = await self.refresh_queued_pools(
+            synced_at=datetime.fromtimestamp(synced_at, UTC)
+        )
 
-        for pool_address in pool_addresses:
-            try:
-                await self.update_pool(
-                    pool_address=pool_address,
-                    jettons_dict=jettons_dict,
-                    updated_assets=updated_assets,
+        await StorageCellRepo(session=self.session).set(POOLS_SYNCED_AT_KEY, int(synced_at))
+        await self.session.commit()
+        PoolStateStore().mark_synced(synced_at)
+
+        if created_count:
+            await self.rebuild_pool_graph()
+            logger.info("Rebuilt pool graph with %d new pools", created_count)
+        logger.info("Updated %d pools", updated_count)
+
+    # === === === === === === ===
+
+    async def refresh_queued_pools(
+        self,
+        synced_at: datetime,
+    ) -> Tuple[int, int]:
+        """Refreshes the due pools of the refresh queue, committing batch by batch.
+
+        Pools that failed to be fetched stay queued with exponential backoff and are
+        dropped after `POOL_REFRESH_MAX_ATTEMPTS`. Addresses that aren't pools and pools
+        with unresolved jettons are dropped at once. Returns the updated and the created
+        pools counts.
+        """
+
+        refresh_repo = TonDexPoolRefreshRepository(session=self.session)
+        snapshot_repo = TonDexPoolSnapshotRepository(session=self.session)
+        pool_state_store = PoolStateStore()
+
+        updated_count = 0
+        created_count = 0
+
+        # Failed pools are rescheduled after `synced_at`, so each is attempted once per cycle.
+        while refreshes := await refresh_repo.get_due(
+            now=synced_at, limit=self.config.ton_dex.pool_refresh_batch_size
+        ):
+            pools_db, created_pools, failed_pools = await self.refresh_pools(
+                pool_addresses={TonAddress(refresh.pool_address) for refresh in refreshes}
+            )
+
+            done_refreshes: List[TonDexPoolRefreshDb] = []
+            for refresh in refreshes:
+                if TonAddress(refresh.pool_address) not in failed_pools:
+                    done_refreshes.append(refresh)
+                    continue
+
+                refresh.attempts += 1
+                if refresh.attempts >= POOL_REFRESH_MAX_ATTEMPTS:
+                    logger.warning("Giving up refreshing pool %s", refresh.pool_address)
+                    done_refreshes.append(refresh)
+                    continue
+
+                backoff_seconds = min(
+                    POOL_REFRESH_BASE_BACKOFF_SECONDS * 2 ** (refresh.attempts - 1),
+                    POOL_REFRESH_MAX_BACKOFF_SECONDS,
                 )
-            except Exception as e:
-                e.add_note(f"Pool updating: {pool_address.to_string()}")
-                raise e
+                refresh.next_attempt_at = synced_at + timedelta(seconds=backoff_seconds)
+                refresh.last_error = "Pool state not fetched"
+                # Live fallbacks are used until the pool is refreshed.
+                pool_state_store.invalidate(TonAddress(refresh.pool_address))
+
+            await refresh_repo.delete_many(done_refreshes)
+            await snapshot_repo.create_many(pools=pools_db, time=synced_at)
+            await self.session.commit()
+
+            updated_count += len(pools_db)
+            created_count += len(created_pools)
+
+        return updated_count, created_count
 
+    # === === === === === === ===
+
+    async def refresh_pools(
+        self,
+        pool_addresses: Set[TonAddress],
+    ) -> Tuple[List[TonDexPoolDb], Set[TonAddress], Set[TonAddress]]:
+        """Fetches the pools and saves their state, without committing.
+
+        Returns the saved pool rows, the addresses of the new pools and the
+        addresses, whose fetch failed with an error.
+        """
+
+        # Fetch all pools concurrently first, then apply the DB writes in one batch.
+        semaphore = asyncio.Semaphore(self.config.ton_dex.pool_refresh_concurrency)
+
+        async def fetch_pool(pool_address: TonAddress) -> FetchedPool | None:
+            async with semaphore:
+                return await self.fetch_pool(pool_address=pool_address)
+
+        fetch_started_at = time.monotonic()
+        fetch_results = await asyncio.gather(
+            *[fetch_pool(pool_address) for pool_address in pool_addresses],
+            return_exceptions=True,
+        )
+        logger.info(
+            "Fetched %d pools in %.2fs", len(pool_addresses), time.monotonic() - fetch_started_at
+        )
+
+        fetched_pools: List[FetchedPool] = []
+        failed_pools: Set[TonAddress] = set()
+
+        for pool_address, fetch_result in zip(pool_addresses, fetch_results):
+            if isinstance(fetch_result, Exception):
+                logger.warning(
+                    "Pool not fetched: %s. Error: %s", pool_address.to_string(), fetch_result
+                )
+                failed_pools.add(pool_address)
+            elif fetch_result is not None:
+                fetched_pools.append(fetch_result)
+
+        assets = await self.resolve_assets(
+            minter_addresses={
+                minter_address
+                for fetched_pool in fetched_pools
+                for minter_address in (
+                    fetched_pool.token_0_minter_address,
+                    fetched_pool.token_1_minter_address,
+                )
+            }
+        )
+
+        pools_db: List[TonDexPoolDb] = []
+
+        for fetched_pool in fetched_pools:
+            first_asset = assets.get(fetched_pool.token_0_minter_address, None)
+            second_asset = assets.get(fetched_pool.token_1_minter_address, None)
+
+            if not first_asset or not second_asset:
+                logger.info(
+                    "Jettons for pool %s not found: %s, %s",
+                    fetched_pool.pool_data.address.to_string(),
+                    fetched_pool.token_0_minter_address.to_string(),
+                    fetched_pool.token_1_minter_address.to_string(),
+                )
+                continue
+
+            pools_db.append(
+                self.update_pool_state(
+                    fetched_pool=fetched_pool,
+                    first_asset=first_asset,
+                    second_asset=second_asset,
+                )
+            )
+
+        created_pools = await self.save_pools(pools_db=pools_db)
+
+        return pools_db, created_pools, failed_pools
+
+    # === === === === === === ===
+
+    async def rebuild_pool_graph(
+        self,
+    ) -> None:
+
+        # The pool graph depends on pool membership only, so reserve updates don't touch it.
+        pool_repo = TonDexPoolRepository(session=self.session)
+        PoolGraph().rebuild(await pool_repo.get_all())
+
+    # === === === === === === ===
+
+    async def follow_leader(
+        self,
+    ) -> None:
+        """Loads the pools saved by the leader, in processes that don't run the observer."""
+
+        storage_repo = StorageCellRepo(session=self.session)
+        synced_at = cast(int | None, await storage_repo.get_value(POOLS_SYNCED_AT_KEY, "int"))
+        pool_state_store = PoolStateStore()
+        if synced_at is None or synced_at <= pool_state_store.synced_at:
+            return
+
+        pool_repo = TonDexPoolRepository(session=self.session)
+        pools_db = await pool_repo.get_all()
+
+        new_pools_db = [
+            pool_db for pool_db in pools_db if not pool_state_store.get(TonAddress(pool_db.address))
+        ]
+        PoolPairIndex().load(new_pools_db)
+
+        pool_state_store.load(pools_db, overwrite_before=synced_at)
+        # Queued pools keep reserves from before their failed refresh, they aren't current.
+        refresh_repo = TonDexPoolRefreshRepository(session=self.session)
+        pool_state_store.invalidate_many(await refresh_repo.get_pool_addresses())
+        pool_state_store.mark_synced(synced_at)
+        if new_pools_db:
+            PoolGraph().rebuild(pools_db)
+        await self.update_prices()
+
+        logger.info("Loaded %d pools synced by the leader", len(pools_db))
+
+    # === === === === === === ===
+
+    async def update_prices(
+        self,
+    ) -> None:
+        """Updates the asset prices from the current reserves, loading decimals of new tokens."""
+
+        price_oracle = AssetPriceOracle()
+        new_tokens = [
+            TonAddress(token)
+            for token in PoolGraph().get_tokens()
+            if not price_oracle.has_decimals(token)
+        ]
+        assets_db = await TonAssetRepository(session=self.session).get_many(addresses=new_tokens)
+
+        if price_oracle.update(
+            config=self.config,
+            decimals={
+                TonAddress(asset_db.address).to_string(): asset_db.decimals
+                for asset_db in assets_db
+            },
+        ):
+            logger.info("Recomputed prices of %d assets", len(price_oracle.get_all()))
+
+    # === === === === === === ===
+
+    async def update_pool_stats(
+        self,
+    ) -> None:
+        """Recomputes the pool stats, also without new activity since the 24h window moves."""
+
+        stats_calculator = PoolStatsCalculator(config=self.config, session=self.session)
+        updated_count = await stats_calculator.update()
         await self.session.commit()
-        logger.info("Updated %d pools and %d assets", len(pool_addresses), len(updated_assets))
+
+        logger.info("Updated stats of %d pools", updated_count)
 
     # === === === === === === ===
 
-    async def update_pool(
+    async def fetch_pool(
         self,
         pool_address: TonAddress,
-        jettons_dict: Dict[TonAddress, TonJettonInfo],
-        updated_assets: Set[TonAddress],
-    ) -> None:
+    ) -> FetchedPool | None:
 
         # === === === === === === ===
 
         pool_contract = PoolContract(address=pool_address, ton_client=self.ton_client)
 
-        try:
-            pool_data = await pool_contract.get_pool_data()
-            if not pool_data:
-                logger.info("Pool data not found: %s", pool_address.to_string())
-                return
-        except Exception as e:
-            logger.warning("Pool data not found: %s. Error: %s", pool_address.to_string(), e)
-            return
-        try:
-            pool_jetton_data = await pool_contract.get_jetton_data()
-            if not pool_jetton_data:
-                logger.info("Pool jetton data not found: %s", pool_address.to_string())
-                return
-        except Exception as e:
-            logger.warning(
-                "Pool jetton data not found: %s. Error: %s", pool_address.to_string(), e
-            )
-            return
+        pool_data_result, pool_jetton_data_result = await asyncio.gather(
+            pool_contract.get_pool_data(),
+            pool_contract.get_jetton_data(),
+            return_exceptions=True,
+        )
+
+        # Fetch errors are raised, so that the pool is retried. Contracts that aren't
+        # pools return None.
+        if isinstance(pool_data_result, Exception):
+            raise pool_data_result
+        if not pool_data_result:
+            logger.info("Pool data not found: %s", pool_address.to_string())
+            return None
+        if isinstance(pool_jetton_data_result, Exception):
+            raise pool_jetton_data_result
+        if not pool_jetton_data_result:
+            logger.info("Pool jetton data not found: %s", pool_address.to_string())
+            return None
+
+        pool_data = pool_data_result
+        pool_jetton_data = pool_jetton_data_result
 
         # === === === === === === ===
 
+        minter_addresses = await self.get_pool_minter_addresses(pool_data=pool_data)
+        if not minter_addresses:
+            return None
+
+        return FetchedPool(
+            pool_data=pool_data,
+            total_supply=pool_jetton_data.total_supply,
+            token_0_minter_address=minter_addresses[0],
+            token_1_minter_address=minter_addresses[1],
+        )
+
+    # === === === === === === ===
+
+    async def get_pool_minter_addresses(
+        self,
+        pool_data: PoolData,
+    ) -> Tuple[TonAddress, TonAddress] | None:
+
+        # The pool jetton wallets never change, so their minters are reused from the known state.
+        known_state = PoolStateStore().get(pool_data.address)
+        if (
+            known_state
+            and known_state.pool_data.token_0_address == pool_data.token_0_address
+            and known_state.pool_data.token_1_address == pool_data.token_1_address
+        ):
+            return (known_state.token_0_minter_address, known_state.token_1_minter_address)
+
         first_wallet_contract = JettonWalletContract(
             address=pool_data.token_0_address, ton_client=self.ton_client
         )
@@ -138,107 +418,150 @@ class DexObserver:
             address=pool_data.token_1_address, ton_client=self.ton_client
         )
 
-        try:
-            first_jetton_wallet_data = await first_wallet_contract.get_wallet_data()
-        except Exception as e:
-            logger.warning(
-                "Jetton wallet data not found: %s. Error: %s", pool_address.to_string(), e
-            )
-            return
-        try:
-            second_jetton_wallet_data = await second_wallet_contract.get_wallet_data()
-        except Exception as e:
-            logger.warning(
-                "Jetton wallet data not found: %s. Error: %s", pool_address.to_string(), e
-            )
-            return
+        first_jetton_wallet_data, second_jetton_wallet_data = await asyncio.gather(
+            first_wallet_contract.get_wallet_data(),
+            second_wallet_contract.get_wallet_data(),
+        )
 
         if not first_jetton_wallet_data or not second_jetton_wallet_data:
             logger.info(
                 "Jetton wallet data for pool %s not found(wallets): %s, %s",
-                pool_address.to_string(),
+                pool_data.address.to_string(),
                 pool_data.token_0_address.to_string(),
                 pool_data.token_1_address.to_string(),
             )
-            return
+            return None
 
-        first_jetton = jettons_dict.get(first_jetton_wallet_data.jetton_contract_address, None)
-        second_jetton = jettons_dict.get(second_jetton_wallet_data.jetton_contract_address, None)
+        return (
+            first_jetton_wallet_data.jetton_contract_address,
+            second_jetton_wallet_data.jetton_contract_address,
+        )
 
-        if not first_jetton or not second_jetton:
-            logger.info(
-                "Jettons for pool %s not found: %s, %s",
-                pool_address.to_string(),
-                pool_data.token_0_address.to_string(),
-                pool_data.token_1_address.to_string(),
-            )
-            return
-        # === === === === === === ===
+    # === === === === === === ===
+
+    async def resolve_assets(
+        self,
+        minter_addresses: Set[TonAddress],
+    ) -> Dict[TonAddress, TonAsset]:
+        """Resolves pool minters to assets, creating the ones seen for the first time.
+
+        Known assets come from `ton_asset`; unknown minters are looked up one by
+        one. Minters TonAPI doesn't know are not retried for a while, while
+        failed lookups are retried on the next refresh.
+        """
 
-        pool_repo = TonDexPoolRepository(session=self.session)
         asset_repo = TonAssetRepository(session=self.session)
 
-        first_asset = TonAsset.from_jetton_info(first_jetton)
-        second_asset = TonAsset.from_jetton_info(second_jetton)
-        for asset in [first_asset, second_asset]:
-            if asset.address in updated_assets:
-                continue
-            if await asset_repo.get(address=asset.address):
-                await asset_repo.update(
-                    address=asset.address,
-                    image_url=asset.image_url,
-                    decimals=asset.decimals,
-                    symbol=asset.symbol,
-                    name=asset.name,
-                    is_blacklisted=asset.is_blacklisted,
-                    is_community=asset.is_community,
-                    is_deprecated=asset.is_deprecated,
-                    is_whitelisted=asset.is_whitelisted,
+        assets: Dict[TonAddress, TonAsset] = {
+            TonAddress(asset_db.address): TonAsset.from_db_model(asset_db)
+            for asset_db in await asset_repo.get_many(addresses=list(minter_addresses))
+        }
+
+        now = time.monotonic()
+        unknown_minter_addresses = [
+            minter_address
+            for minter_address in minter_addresses
+            if minter_address not in assets
+            and DexObserver.unknown_jettons_retry_at.get(minter_address, 0) <= now
+        ]
+        if not unknown_minter_addresses:
+            return assets
+
+        jetton_infos = await asyncio.gather(
+            *[
+                self.ton_client.get_jetton_info(minter_address=minter_address)
+                for minter_address in unknown_minter_addresses
+            ],
+            return_exceptions=True,
+        )
+
+        new_assets: List[TonAsset] = []
+        for minter_address, jetton_info in zip(unknown_minter_addresses, jetton_infos):
+            if isinstance(jetton_info, BaseException):
+                logger.warning(
+                    "Jetton info not loaded: %s. Error: %s", minter_address.to_string(), jetton_info
                 )
-            else:
-                await asset_repo.create(
-                    address=asset.address,
-                    symbol=asset.symbol,
-                    name=asset.name,
-                    image_url=asset.image_url,
-                    decimals=asset.decimals,
-                    is_community=asset.is_community,
-                    is_deprecated=asset.is_deprecated,
-                    is_blacklisted=asset.is_blacklisted,
-                    is_whitelisted=asset.is_whitelisted,
+                continue
+
+            if jetton_info is None:
+                DexObserver.unknown_jettons_retry_at[minter_address] = (
+                    now + UNKNOWN_JETTON_RETRY_SECONDS
                 )
-            updated_assets.add(asset.address)
+                continue
 
-        # === === === === === === ===
-        if await pool_repo.get(address=pool_address):
-            await pool_repo.update(
-                address=pool_address,
-                reserve_0=pool_data.reserve_0,
-                reserve_1=pool_data.reserve_1,
-                lp_fee=pool_data.lp_fee,
-                protocol_fee=pool_data.protocol_fee,
-                ref_fee=pool_data.ref_fee,
-                collected_token_0_protocol_fee=pool_data.collected_token_0_protocol_fee,
-                collected_token_1_protocol_fee=pool_data.collected_token_1_protocol_fee,
-                total_supply=pool_jetton_data.total_supply,
-            )
-        else:
-            await pool_repo.create(
-                address=pool_address,
-                reserve_0=pool_data.reserve_0,
-                reserve_1=pool_data.reserve_1,
-                token_0_wallet_address=pool_data.token_0_address,
-                token_1_wallet_address=pool_data.token_1_address,
+            DexObserver.unknown_jettons_retry_at.pop(minter_address, None)
+
+            assets[minter_address] = TonAsset.from_jetton_info(jetton_info)
+            new_assets.append(assets[minter_address])
+
+        await asset_repo.upsert_many(assets=[asset.to_db_model() for asset in new_assets])
+
+        logger.info(
+            "Resolved %d of %d unknown jettons",
+            len(new_assets),
+            len(unknown_minter_addresses),
+        )
+
+        return assets
+
+    # === === === === === === ===
+
+    def update_pool_state(
+        self,
+        fetched_pool: FetchedPool,
+        first_asset: TonAsset,
+        second_asset: TonAsset,
+    ) -> TonDexPoolDb:
+        """Puts the fetched state into the store and returns the pool row to save."""
+
+        pool_data = fetched_pool.pool_data
+
+        PoolStateStore().put(
+            PoolState(
+                pool_data=pool_data,
                 token_0_minter_address=first_asset.address,
                 token_1_minter_address=second_asset.address,
-                lp_fee=pool_data.lp_fee,
-                protocol_fee=pool_data.protocol_fee,
-                ref_fee=pool_data.ref_fee,
-                protocol_fee_address=pool_data.protocol_fee_address,
-                collected_token_0_protocol_fee=pool_data.collected_token_0_protocol_fee,
-                collected_token_1_protocol_fee=pool_data.collected_token_1_protocol_fee,
-                total_supply=pool_jetton_data.total_supply,
+                total_supply=fetched_pool.total_supply,
+                updated_at=time.time(),
             )
+        )
+
+        return TonDexPoolDb(
+            address=pool_data.address.to_string(),
+            reserve_0=pool_data.reserve_0,
+            reserve_1=pool_data.reserve_1,
+            token_0_wallet_address=pool_data.token_0_address.to_string(),
+            token_1_wallet_address=pool_data.token_1_address.to_string(),
+            token_0_minter_address=first_asset.address.to_string(),
+            token_1_minter_address=second_asset.address.to_string(),
+            lp_fee=pool_data.lp_fee,
+            protocol_fee=pool_data.protocol_fee,
+            ref_fee=pool_data.ref_fee,
+            protocol_fee_address=pool_data.protocol_fee_address.to_string(),
+            collected_token_0_protocol_fee=pool_data.collected_token_0_protocol_fee,
+            collected_token_1_protocol_fee=pool_data.collected_token_1_protocol_fee,
+            total_supply=fetched_pool.total_supply,
+        )
+
+    # === === === === === === ===
+
+    async def save_pools(
+        self,
+        pools_db: List[TonDexPoolDb],
+    ) -> Set[TonAddress]:
+        """Upserts the pool rows and indexes the pairs of new pools. Returns the new pools."""
+
+        pool_repo = TonDexPoolRepository(session=self.session)
+
+        created_pools = await pool_repo.upsert_many(pools=pools_db)
+
+        PoolPairIndex().load(
+            pool_db for pool_db in pools_db if TonAddress(pool_db.address) in created_pools
+        )
+
+        return created_pools
+
+    # === === === === === === ===
 
     async def find_pools(
         self,
@@ -248,43 +571,55 @@ class DexObserver:
 
         storage_repo = StorageCellRepo(session=self.session)
 
-        max_lt = cast(int | None, await storage_repo.get_value("max_lt", "int"))
-        min_lt = cast(int | None, await storage_repo.get_value("min_lt", "int"))
+        cursor = await storage_repo.get_transaction_cursor(ROUTER_CURSOR_NAME)
+        if cursor.after_lt is None and cursor.before_lt is None:
+            # Continue from the cursor kept before the paged sweep was introduced.
+            cursor.after_lt = cast(int | None, await storage_repo.get_value("max_lt", "int"))
+        if (
+            cursor.after_lt is None
+            and cursor.before_lt is None
+            and self.config.ton_dex.backfill_segments > 0
+        ):
+            # Fresh database: the history is backfilled concurrently, the live sweep starts now.
+            router_backfill = RouterBackfill(config=self.config, ton_client=self.ton_client)
+            cursor.after_lt = await router_backfill.plan(session=self.session)
+            await storage_repo.set_transaction_cursor(ROUTER_CURSOR_NAME, cursor)
+
+        event_indexer = DexEventIndexer(ton_client=self.ton_client, session=self.session)
+        refresh_repo = TonDexPoolRefreshRepository(session=self.session)
+
+        async def checkpoint(next_cursor: TransactionCursor) -> None:
+            # Commits the processed page together with the cursor past it.
+            await storage_repo.set_transaction_cursor(ROUTER_CURSOR_NAME, next_cursor)
+            await self.session.commit()
+
+        async for transactions in self.ton_client.iter_account_transactions(
+            account_address=self.config.ton_dex.router_address,
+            cursor=cursor,
+            checkpoint=checkpoint,
+        ):
+            page_pools = await self.detect_pools_by_transactions(transactions=transactions)
+            await self.enqueue_pools(pool_addresses=page_pools, refresh_repo=refresh_repo)
+            await event_indexer.index_transactions(transactions=transactions)
+            pools.update(page_pools)
 
-        is_first_run = not max_lt and not min_lt
-
-        has_transactions = True
-        limit = 500
-        while has_transactions:
-            try:
-                transactions = await self.get_router_transactions(
-                    limit=limit,
-                    before_lt=min_lt if is_first_run else None,
-                    after_lt=max_lt if not is_first_run else None,
-                )
-                if limit < 500:
-                    limit = min(500, limit * 2)
-            except Exception as e:
-                logger.error(e)
-                if limit > 1:
-                    limit = max(1, limit // 2)
-                else:
-                    raise e
-                continue
+        return pools
 
-            if not transactions:
-                has_transactions = False
-                continue
+    # === === === === === === ===
 
-            for t in transactions:
-                min_lt = min(min_lt, t.lt) if min_lt else t.lt
-                max_lt = max(max_lt, t.lt) if max_lt else t.lt
-            pools.update(await self.detect_pools_by_transactions(transactions=transactions))
+    async def enqueue_pools(
+        self,
+        pool_addresses: Set[TonAddress],
+        refresh_repo: TonDexPoolRefreshRepository | None = None,
+    ) -> None:
+        """Queues the pools for a refresh and marks their known state outdated."""
 
-        await storage_repo.set("max_lt", value=max_lt)
-        await storage_repo.set("min_lt", value=min_lt)
+        refresh_repo = refresh_repo or TonDexPoolRefreshRepository(session=self.session)
+        await refresh_repo.enqueue_many(pool_addresses=pool_addresses, now=datetime.now(UTC))
 
-        return pools
+        pool_state_store = PoolStateStore()
+        for pool_address in pool_addresses:
+            pool_state_store.invalidate(pool_address)
 
     # === === === === === === ===
 
@@ -297,28 +632,15 @@ class DexObserver:
 
         for transaction in transactions:
             in_msg = transaction.in_msg
-            if in_msg and in_msg.op_code and in_msg.source:
-                if in_msg.op_code == TonConstants.OpCodes.PAY_TO:
-                    pools.add(in_msg.source)
-                elif in_msg.op_code == TonConstants.OpCodes.JETTON_TRANSFER_NOTIFICATION:
-                    if (
-                        in_msg.decoded_body
-                        and isinstance(in_msg.decoded_body, dict)
-                        and "op_code" in in_msg.decoded_body
-                    ):
-                        try:
-                            op_code = int(in_msg.decoded_body["op_code"], 16)
-                        except Exception:
-                            continue
-                        if op_code in {
-                            TonConstants.OpCodes.SWAP,
-                            TonConstants.OpCodes.PROVIDE_LIQUIDITY,
-                        }:
-                            pools.add(in_msg.source.to_string())
+            if in_msg and in_msg.op_code == TonConstants.OpCodes.PAY_TO and in_msg.source:
+                pools.add(in_msg.source)
+            # Jetton transfer notifications come from the router jetton wallets. The pools
+            # are the destinations of the `swap` and `provide_lp` messages sent for them.
             if transaction.out_msgs:
                 for out_msg in transaction.out_msgs:
                     if (
-                        out_msg.op_code == TonConstants.OpCodes.PROVIDE_LIQUIDITY
+                        out_msg.op_code
+                        in {TonConstants.OpCodes.SWAP, TonConstants.OpCodes.PROVIDE_LIQUIDITY}
                         and out_msg.destination
                     ):
                         pools.add(out_msg.destination)
@@ -342,25 +664,5 @@ class DexObserver:
 
         return transactions
 
-    # === === === === === ===
-
-    async def get_all_jettons(
-        self,
-    ) -> List[TonJettonInfo]:
-
-        jettons = []
-
-        limit = 1000
-        offset = 0
-
-        while True:
-            next_jettons = await self.ton_client.get_all_jettons(limit=limit, offset=offset)
-            offset += limit
-            if not next_jettons:
-                break
-            jettons.extend(next_jettons)
-
-        return jettons
-
 
 # === === === === === === ===
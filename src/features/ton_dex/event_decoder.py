@@ -0,0 +1,196 @@
+# === === === === === === ===
+
+from typing import List
+
+from pytoniq_core import Address, Cell, Slice
+from src.blockchains.ton.constants import TonConstants
+from src.blockchains.ton.schemas.ton_message import TonMessage
+from src.blockchains.ton.schemas.ton_transaction import TonTransaction
+from src.utils.logging.logging import create_custom_logger
+from src.utils.ton_address import TonAddress
+
+from .schemas import TonDexPayTo, TonDexProvideRequest, TonDexSwapRequest
+
+# === === === === === === ===
+
+logger = create_custom_logger("DexEventDecoder")
+
+# === === === === === === ===
+
+type TonDexLeg = TonDexSwapRequest | TonDexProvideRequest | TonDexPayTo
+
+# === === === === === === ===
+
+
+def decode_router_transaction(
+    transaction: TonTransaction,
+) -> List[TonDexLeg]:
+    """Decodes the pool messages of a router transaction.
+
+    These are `pay_to` received from a pool and `swap` / `provide_lp` sent to
+    a pool. Messages with an unexpected layout are skipped.
+    """
+
+    legs: List[TonDexLeg] = []
+
+    in_msg = transaction.in_msg
+    if in_msg and in_msg.op_code == TonConstants.OpCodes.PAY_TO and in_msg.source:
+        leg = _decode_message(transaction, in_msg, in_msg.source)
+        if leg:
+            legs.append(leg)
+
+    for out_msg in transaction.out_msgs:
+        if not out_msg.destination or out_msg.op_code not in {
+            TonConstants.OpCodes.SWAP,
+            TonConstants.OpCodes.PROVIDE_LIQUIDITY,
+        }:
+            continue
+        leg = _decode_message(transaction, out_msg, out_msg.destination)
+        if leg:
+            legs.append(leg)
+
+    return legs
+
+
+# === === === === === === ===
+
+
+def _decode_message(
+    transaction: TonTransaction,
+    message: TonMessage,
+    pool_address: TonAddress,
+) -> TonDexLeg | None:
+
+    if not message.raw_body:
+        return None
+
+    try:
+        body = Cell.one_from_boc(bytes.fromhex(message.raw_body)).begin_parse()
+        op_code = body.load_uint(32)
+        common = {
+            "pool_address": pool_address,
+            "query_id": body.load_uint(64),
+            "lt": transaction.lt,
+            "utime": transaction.utime,
+            "transaction_hash": transaction.hash,
+        }
+
+        if op_code == TonConstants.OpCodes.SWAP:
+            return _decode_swap(body, common)
+        if op_code == TonConstants.OpCodes.PROVIDE_LIQUIDITY:
+            return _decode_provide(body, common)
+        if op_code == TonConstants.OpCodes.PAY_TO:
+            return _decode_pay_to(body, common)
+    except Exception as e:
+        logger.warning("Can't decode message of %s: %s", transaction.hash, e)
+
+    return None
+
+
+# === === === === === === ===
+
+
+def _decode_swap(
+    body: Slice,
+    common: dict,
+) -> TonDexSwapRequest | None:
+
+    to_address = _load_address(body)
+    offer_wallet_address = _load_address(body)
+    offer_amount = body.load_coins()
+    min_out = body.load_coins()
+    has_ref = body.load_uint(1)
+
+    from_address = None
+    referral_address = None
+    if body.remaining_refs:
+        ref = body.load_ref().begin_parse()
+        from_address = _load_address(ref)
+        if has_ref:
+            referral_address = _load_address(ref)
+
+    if not to_address or not offer_wallet_address:
+        return None
+
+    return TonDexSwapRequest(
+        **common,
+        to_address=to_address,
+        from_address=from_address,
+        referral_address=referral_address,
+        offer_wallet_address=offer_wallet_address,
+        offer_amount=offer_amount or 0,
+        min_out=min_out or 0,
+    )
+
+
+# === === === === === === ===
+
+
+def _decode_provide(
+    body: Slice,
+    common: dict,
+) -> TonDexProvideRequest | None:
+
+    owner_address = _load_address(body)
+    min_lp_out = body.load_coins()
+    amount_0 = body.load_coins()
+    amount_1 = body.load_coins()
+
+    if not owner_address:
+        return None
+
+    return TonDexProvideRequest(
+        **common,
+        owner_address=owner_address,
+        min_lp_out=min_lp_out or 0,
+        amount_0=amount_0 or 0,
+        amount_1=amount_1 or 0,
+    )
+
+
+# === === === === === === ===
+
+
+def _decode_pay_to(
+    body: Slice,
+    common: dict,
+) -> TonDexPayTo | None:
+
+    owner_address = _load_address(body)
+    exit_code = body.load_uint(32)
+
+    amounts = body.load_ref().begin_parse()
+    amount_0 = amounts.load_coins()
+    wallet_0_address = _load_address(amounts)
+    amount_1 = amounts.load_coins()
+    wallet_1_address = _load_address(amounts)
+
+    if not owner_address:
+        return None
+
+    return TonDexPayTo(
+        **common,
+        owner_address=owner_address,
+        exit_code=exit_code,
+        amount_0=amount_0 or 0,
+        wallet_0_address=wallet_0_address,
+        amount_1=amount_1 or 0,
+        wallet_1_address=wallet_1_address,
+    )
+
+
+# === === === === === === ===
+
+
+def _load_address(
+    body: Slice,
+) -> TonAddress | None:
+
+    address = body.load_address()
+    if not isinstance(address, Address):
+        return None
+
+    return TonAddress(address)
+
+
+# === === === === === === ===
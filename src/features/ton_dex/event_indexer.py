@@ -0,0 +1,443 @@
+# === === === === === === ===
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import ClassVar, Dict, List, NamedTuple, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.blockchains.ton.clients.ton_client import TonClient
+from src.blockchains.ton.constants import TonConstants
+from src.blockchains.ton.schemas.ton_transaction import TonTransaction
+from src.database.database_models.ton.ton_dex_event import TonDexEventDb
+from src.database.repositories.ton.ton_dex_event_repository import TonDexEventRepository
+from src.features.ton_common.jetton_wallet_contract import JettonWalletContract
+from src.utils.logging.logging import create_custom_logger
+from src.utils.ton_address import TonAddress
+
+from .candle_aggregator import CandleAggregator
+from .event_decoder import TonDexLeg, decode_router_transaction
+from .pool_contract import PoolContract
+from .pool_state_store import PoolStateStore
+from .schemas import (
+    TonDexEventStatus,
+    TonDexEventType,
+    TonDexPayTo,
+    TonDexProvideRequest,
+    TonDexSwapRequest,
+)
+
+# === === === === === === ===
+
+logger = create_custom_logger("DexEventIndexer")
+
+# Both legs of a swap are sent within seconds. Legs further apart aren't merged.
+SWAP_LEGS_WINDOW = timedelta(hours=1)
+
+# === === === === === === ===
+
+
+class PoolTokens(NamedTuple):
+    """Router jetton wallets and minters of the pool tokens, in pool order."""
+
+    wallet_0_address: TonAddress
+    wallet_1_address: TonAddress
+    minter_0_address: TonAddress
+    minter_1_address: TonAddress
+
+
+# === === === === === === ===
+
+
+class DexEventIndexer:
+    """Turns router transactions into `ton_dex_event` rows.
+
+    Provides, burns and refunds are complete in a single router transaction.
+    A swap spans two of them, which may be indexed in any order and in
+    different pages, so each leg is merged into the incomplete swap it belongs
+    to, matched by pool, query id and recipient. Already indexed legs are
+    skipped, so pages can be indexed again after a failure. Swaps are added to
+    the candles once, when their second leg is indexed.
+
+    Requests still without a payout after `SWAP_LEGS_WINDOW` are marked expired.
+    """
+
+    # The pool jetton wallets never change, so their tokens are looked up once per process.
+    pool_tokens: ClassVar[Dict[TonAddress, PoolTokens]] = {}
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        ton_client: TonClient,
+        session: AsyncSession,
+    ) -> None:
+
+        self.ton_client = ton_client
+        self.session = session
+
+    # === === === === === === ===
+
+    async def index_transactions(
+        self,
+        transactions: List[TonTransaction],
+    ) -> int:
+        """Indexes the DEX events of a page of router transactions. Returns the new legs count.
+
+        Raises if the tokens of a pool can't be loaded, so the page is indexed again later.
+        """
+
+        event_repo = TonDexEventRepository(session=self.session)
+
+        legs: List[TonDexLeg] = [
+            leg for transaction in transactions for leg in decode_router_transaction(transaction)
+        ]
+        if not legs:
+            return 0
+
+        indexed_lts, indexed_completion_lts = await event_repo.get_indexed_lts(
+            {leg.lt for leg in legs}
+        )
+        legs = [
+            leg
+            for leg in legs
+            if (isinstance(leg, TonDexPayTo) and leg.lt not in indexed_completion_lts)
+            or (not isinstance(leg, TonDexPayTo) and leg.lt not in indexed_lts)
+        ]
+
+        pool_tokens = await self._get_pool_tokens({leg.pool_address for leg in legs})
+
+        events: List[TonDexEventDb] = []
+        swap_legs: List[TonDexSwapRequest | TonDexPayTo] = []
+
+        for leg in legs:
+            tokens = pool_tokens.get(leg.pool_address)
+            if not tokens:
+                logger.warning("Unknown pool of transaction %s", leg.transaction_hash)
+                continue
+
+            if isinstance(leg, TonDexProvideRequest):
+                events.append(self._create_provide_event(leg, tokens))
+            elif isinstance(leg, TonDexSwapRequest):
+                swap_legs.append(leg)
+            elif leg.exit_code in {
+                TonConstants.PayToExitCodes.BURN_OK,
+                TonConstants.PayToExitCodes.REFUND_OK,
+            }:
+                events.append(self._create_payout_event(leg, tokens))
+            elif leg.exit_code != TonConstants.PayToExitCodes.SWAP_OK_REF:
+                # Swap payouts, unless it's the separate referral fee payout.
+                swap_legs.append(leg)
+
+        new_swaps, completed_swaps = await self._merge_swap_legs(swap_legs, pool_tokens)
+        events.extend(new_swaps)
+
+        await event_repo.create_many(events=events)
+        await CandleAggregator(session=self.session).add_swaps(swaps=completed_swaps)
+        await self.session.flush()
+
+        return len(legs)
+
+    # === === === === === === ===
+
+    async def expire_swaps(
+        self,
+        now: datetime,
+    ) -> int:
+        """Marks the requests left without a payout as expired. Returns the expired count.
+
+        A late payout still completes an expired swap while it's within the window.
+        """
+
+        event_repo = TonDexEventRepository(session=self.session)
+
+        return await event_repo.expire_swaps(before=now - SWAP_LEGS_WINDOW)
+
+    # === === === === === === ===
+
+    async def _merge_swap_legs(
+        self,
+        swap_legs: List[TonDexSwapRequest | TonDexPayTo],
+        pool_tokens: Dict[TonAddress, PoolTokens],
+    ) -> Tuple[List[TonDexEventDb], List[TonDexEventDb]]:
+        """Merges swap legs into incomplete swaps.
+
+        Returns the swaps to insert and the swaps completed by these legs.
+        """
+
+        if not swap_legs:
+            return [], []
+
+        event_repo = TonDexEventRepository(session=self.session)
+
+        leg_times = [datetime.fromtimestamp(leg.utime, UTC) for leg in swap_legs]
+        incomplete_swaps = await event_repo.get_incomplete_swaps(
+            pool_addresses={leg.pool_address for leg in swap_legs},
+            since=min(leg_times) - SWAP_LEGS_WINDOW,
+            until=max(leg_times) + SWAP_LEGS_WINDOW,
+        )
+
+        new_swaps: List[TonDexEventDb] = []
+        completed_swaps: List[TonDexEventDb] = []
+
+        for leg in sorted(swap_legs, key=lambda leg: leg.lt):
+            tokens = pool_tokens[leg.pool_address]
+
+            if isinstance(leg, TonDexSwapRequest):
+                swap = self._find_swap_for_request(incomplete_swaps, leg)
+                if swap is None:
+                    swap = self._create_swap(leg, tokens, status=TonDexEventStatus.PENDING)
+                    incomplete_swaps.append(swap)
+                    new_swaps.append(swap)
+
+                self._apply_request(
+                    swap, leg, is_offer_token_0=tokens.wallet_0_address == leg.offer_wallet_address
+                )
+            else:
+                status = (
+                    TonDexEventStatus.COMPLETED
+                    if leg.exit_code == TonConstants.PayToExitCodes.SWAP_OK
+                    else TonDexEventStatus.FAILED
+                )
+
+                swap = self._find_swap_for_payout(incomplete_swaps, leg)
+                if swap is None:
+                    swap = self._create_swap(leg, tokens, status=status)
+                    incomplete_swaps.append(swap)
+                    new_swaps.append(swap)
+
+                self._apply_payout(swap, leg, status=status)
+
+            if (
+                swap.lt is not None
+                and swap.completion_lt is not None
+                and swap.status == TonDexEventStatus.COMPLETED
+            ):
+                completed_swaps.append(swap)
+
+        return new_swaps, completed_swaps
+
+    # === === === === === === ===
+
+    async def _get_pool_tokens(
+        self,
+        pool_addresses: Set[TonAddress],
+    ) -> Dict[TonAddress, PoolTokens]:
+        """Returns the tokens of the pools. Addresses that aren't pools are left out."""
+
+        tokens: Dict[TonAddress, PoolTokens] = {}
+
+        pool_state_store = PoolStateStore()
+        for pool_address in pool_addresses:
+            known_tokens = DexEventIndexer.pool_tokens.get(pool_address)
+            if known_tokens:
+                tokens[pool_address] = known_tokens
+                continue
+
+            state = pool_state_store.get(pool_address)
+            if state:
+                tokens[pool_address] = PoolTokens(
+                    wallet_0_address=state.pool_data.token_0_address,
+                    wallet_1_address=state.pool_data.token_1_address,
+                    minter_0_address=state.token_0_minter_address,
+                    minter_1_address=state.token_1_minter_address,
+                )
+
+        # Pools created since the last observer cycle, or with unresolved jettons, aren't stored.
+        # Errors are raised rather than skipped, so their events aren't lost.
+        for pool_address in pool_addresses - tokens.keys():
+            pool_data = await PoolContract(
+                address=pool_address, ton_client=self.ton_client
+            ).get_pool_data()
+            if not pool_data:
+                continue
+
+            wallet_0_data, wallet_1_data = await asyncio.gather(
+                JettonWalletContract(
+                    address=pool_data.token_0_address, ton_client=self.ton_client
+                ).get_wallet_data(),
+                JettonWalletContract(
+                    address=pool_data.token_1_address, ton_client=self.ton_client
+                ).get_wallet_data(),
+            )
+            if not wallet_0_data or not wallet_1_data:
+                continue
+
+            tokens[pool_address] = PoolTokens(
+                wallet_0_address=pool_data.token_0_address,
+                wallet_1_address=pool_data.token_1_address,
+                minter_0_address=wallet_0_data.jetton_contract_address,
+                minter_1_address=wallet_1_data.jetton_contract_address,
+            )
+
+        DexEventIndexer.pool_tokens.update(tokens)
+
+        return tokens
+
+    # === === === === === === ===
+
+    @staticmethod
+    def _find_swap_for_request(
+        swaps: List[TonDexEventDb],
+        request: TonDexSwapRequest,
+    ) -> TonDexEventDb | None:
+        """Finds the earliest payout-only swap paid after the request."""
+
+        candidates = [
+            swap
+            for swap in swaps
+            if swap.lt is None
+            and swap.completion_lt is not None
+            and swap.completion_lt > request.lt
+            and swap.pool_address == request.pool_address.to_string()
+            and swap.query_id == request.query_id
+            and swap.recipient_address == request.to_address.to_string()
+        ]
+
+        return min(candidates, key=lambda swap: swap.completion_lt or 0, default=None)
+
+    # === === === === === === ===
+
+    @staticmethod
+    def _find_swap_for_payout(
+        swaps: List[TonDexEventDb],
+        payout: TonDexPayTo,
+    ) -> TonDexEventDb | None:
+        """Finds the latest request-only swap sent before the payout."""
+
+        candidates = [
+            swap
+            for swap in swaps
+            if swap.completion_lt is None
+            and swap.lt is not None
+            and swap.lt < payout.lt
+            and swap.pool_address == payout.pool_address.to_string()
+            and swap.query_id == payout.query_id
+            and swap.recipient_address == payout.owner_address.to_string()
+        ]
+
+        return max(candidates, key=lambda swap: swap.lt or 0, default=None)
+
+    # === === === === === === ===
+
+    @staticmethod
+    def _create_swap(
+        leg: TonDexSwapRequest | TonDexPayTo,
+        tokens: PoolTokens,
+        status: TonDexEventStatus,
+    ) -> TonDexEventDb:
+
+        recipient_address = (
+            leg.to_address if isinstance(leg, TonDexSwapRequest) else leg.owner_address
+        )
+
+        return TonDexEventDb(
+            time=datetime.fromtimestamp(leg.utime, UTC),
+            event_type=TonDexEventType.SWAP,
+            status=status,
+            pool_address=leg.pool_address.to_string(),
+            token_0_minter_address=tokens.minter_0_address.to_string(),
+            token_1_minter_address=tokens.minter_1_address.to_string(),
+            user_address=recipient_address.to_string(),
+            recipient_address=recipient_address.to_string(),
+            query_id=leg.query_id,
+            amount_0_in=0,
+            amount_1_in=0,
+            amount_0_out=0,
+            amount_1_out=0,
+            transaction_hash=leg.transaction_hash,
+        )
+
+    # === === === === === === ===
+
+    @staticmethod
+    def _apply_request(
+        swap: TonDexEventDb,
+        request: TonDexSwapRequest,
+        is_offer_token_0: bool,
+    ) -> None:
+
+        swap.lt = request.lt
+        if request.from_address:
+            swap.user_address = request.from_address.to_string()
+        if request.referral_address:
+            swap.referral_address = request.referral_address.to_string()
+
+        if is_offer_token_0:
+            swap.amount_0_in = request.offer_amount
+        else:
+            swap.amount_1_in = request.offer_amount
+
+    # === === === === === === ===
+
+    @staticmethod
+    def _apply_payout(
+        swap: TonDexEventDb,
+        payout: TonDexPayTo,
+        status: TonDexEventStatus,
+    ) -> None:
+
+        swap.completion_lt = payout.lt
+        swap.status = status
+        swap.amount_0_out = payout.amount_0
+        swap.amount_1_out = payout.amount_1
+
+    # === === === === === === ===
+
+    @staticmethod
+    def _create_provide_event(
+        provide: TonDexProvideRequest,
+        tokens: PoolTokens,
+    ) -> TonDexEventDb:
+
+        return TonDexEventDb(
+            time=datetime.fromtimestamp(provide.utime, UTC),
+            event_type=TonDexEventType.PROVIDE,
+            status=TonDexEventStatus.COMPLETED,
+            pool_address=provide.pool_address.to_string(),
+            token_0_minter_address=tokens.minter_0_address.to_string(),
+            token_1_minter_address=tokens.minter_1_address.to_string(),
+            user_address=provide.owner_address.to_string(),
+            recipient_address=provide.owner_address.to_string(),
+            query_id=provide.query_id,
+            amount_0_in=provide.amount_0,
+            amount_1_in=provide.amount_1,
+            amount_0_out=0,
+            amount_1_out=0,
+            lt=provide.lt,
+            completion_lt=provide.lt,
+            transaction_hash=provide.transaction_hash,
+        )
+
+    # === === === === === === ===
+
+    @staticmethod
+    def _create_payout_event(
+        payout: TonDexPayTo,
+        tokens: PoolTokens,
+    ) -> TonDexEventDb:
+
+        return TonDexEventDb(
+            time=datetime.fromtimestamp(payout.utime, UTC),
+            event_type=(
+                TonDexEventType.BURN
+                if payout.exit_code == TonConstants.PayToExitCodes.BURN_OK
+                else TonDexEventType.REFUND
+            ),
+            status=TonDexEventStatus.COMPLETED,
+            pool_address=payout.pool_address.to_string(),
+            token_0_minter_address=tokens.minter_0_address.to_string(),
+            token_1_minter_address=tokens.minter_1_address.to_string(),
+            user_address=payout.owner_address.to_string(),
+            recipient_address=payout.owner_address.to_string(),
+            query_id=payout.query_id,
+            amount_0_in=0,
+            amount_1_in=0,
+            amount_0_out=payout.amount_0,
+            amount_1_out=payout.amount_1,
+            lt=payout.lt,
+            completion_lt=payout.lt,
+            transaction_hash=payout.transaction_hash,
+        )
+
+
+# === === === === === === ===
@@ -0,0 +1,75 @@
+# === === === === === === ===
+
+from typing import Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.blockchains.ton.clients.ton_client import TonClient
+from src.database.repositories.ton.ton_asset_repository import TonAssetRepository
+from src.features.ton_common.schemas.ton_asset import TonAsset
+from src.utils.logging.logging import create_custom_logger
+from src.utils.ton_address import TonAddress
+
+# === === === === === === ===
+
+logger = create_custom_logger("JettonCatalogSync")
+
+# === === === === === === ===
+
+
+class JettonCatalogSync:
+    """Refreshes the metadata of known assets from the TonAPI jetton registry.
+
+    The registry is paged through in full, so this runs as an infrequent job.
+    New assets are created by `DexObserver` when a pool with them shows up.
+    """
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        ton_client: TonClient,
+        session: AsyncSession,
+    ) -> None:
+
+        self.ton_client = ton_client
+        self.session = session
+
+    # === === === === === === ===
+
+    async def sync(
+        self,
+        page_size: int = 1000,
+    ) -> None:
+
+        asset_repo = TonAssetRepository(session=self.session)
+
+        jettons_count = 0
+        updated_count = 0
+        offset = 0
+
+        while True:
+            jettons = await self.ton_client.get_all_jettons(limit=page_size, offset=offset)
+            offset += page_size
+            if not jettons:
+                break
+            jettons_count += len(jettons)
+
+            assets: Dict[TonAddress, TonAsset] = {
+                TonAddress(jetton.address): TonAsset.from_jetton_info(jetton) for jetton in jettons
+            }
+
+            # Only known assets are refreshed, so the upsert never inserts here.
+            assets_db = await asset_repo.get_many(addresses=list(assets.keys()))
+            await asset_repo.upsert_many(
+                assets=[
+                    assets[TonAddress(asset_db.address)].to_db_model() for asset_db in assets_db
+                ]
+            )
+            updated_count += len(assets_db)
+
+            await self.session.commit()
+
+        logger.info("Synced %d jettons, updated %d assets", jettons_count, updated_count)
+
+
+# === === === === === === ===
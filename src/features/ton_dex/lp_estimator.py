@@ -0,0 +1,85 @@
+# === === === === === === ===
+
+from src.blockchains.ton.clients.ton_client import TonClient
+from src.utils.logging.logging import create_custom_logger
+
+from . import amm_math
+from .pool_contract import PoolContract
+from .schemas import ExpectedLiquidityData, PoolState
+
+# === === === === === === ===
+
+logger = create_custom_logger("LpEstimator")
+
+# === === === === === === ===
+
+
+class LpEstimator:
+    """Estimates LP mint and burn amounts from a cached pool state.
+
+    The pool get-methods are called only when the state has no known LP total
+    supply, e.g. when it was fetched live and reserves changed since the last
+    observer cycle.
+    """
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        ton_client: TonClient,
+    ) -> None:
+
+        self.ton_client = ton_client
+
+    # === === === === === === ===
+
+    async def get_expected_lp_tokens(
+        self,
+        pool_state: PoolState,
+        token_0_amount: int,
+        token_1_amount: int,
+    ) -> int | None:
+
+        if pool_state.total_supply is not None:
+            return amm_math.get_expected_lp_tokens(
+                amount_0=token_0_amount,
+                amount_1=token_1_amount,
+                reserve_0=pool_state.pool_data.reserve_0,
+                reserve_1=pool_state.pool_data.reserve_1,
+                total_supply=pool_state.total_supply,
+            )
+
+        logger.info("No total supply for %s, calling get-method.", pool_state.address.to_string())
+
+        pool = PoolContract(address=pool_state.address, ton_client=self.ton_client)
+        return await pool.get_expected_lp_tokens(
+            token_0_amount=token_0_amount,
+            token_1_amount=token_1_amount,
+        )
+
+    # === === === === === === ===
+
+    async def get_expected_liquidity(
+        self,
+        pool_state: PoolState,
+        lp_amount: int,
+    ) -> ExpectedLiquidityData | None:
+
+        if pool_state.total_supply is not None:
+            token_0_amount, token_1_amount = amm_math.get_expected_liquidity(
+                lp_amount=lp_amount,
+                reserve_0=pool_state.pool_data.reserve_0,
+                reserve_1=pool_state.pool_data.reserve_1,
+                total_supply=pool_state.total_supply,
+            )
+            return ExpectedLiquidityData(
+                token_0_amount=token_0_amount,
+                token_1_amount=token_1_amount,
+            )
+
+        logger.info("No total supply for %s, calling get-method.", pool_state.address.to_string())
+
+        pool = PoolContract(address=pool_state.address, ton_client=self.ton_client)
+        return await pool.get_expected_liquidity(lp_jetton_amount=lp_amount)
+
+    # === === === === === === ===
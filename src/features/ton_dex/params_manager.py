@@ -1,4 +1,6 @@
-from typing import Literal, Tuple
+import asyncio
+import time
+from typing import Dict, FrozenSet, List, Literal, Tuple
 
 from src.blockchains.ton.clients.ton_client import TonClient
 from src.blockchains.ton.constants import TonConstants
@@ -13,24 +15,32 @@ from src.features.ton_dex.lp_account_contract import LpAccountContract
 from src.features.ton_dex.pool_contract import PoolContract
 from src.utils.ton_address import TonAddress
 
+from . import amm_math
+from .lp_estimator import LpEstimator
+from .pool_graph import PoolEdge, PoolGraph
+from .pool_state_store import PoolStateStore
 from .router_contract import TonDexRouterContract
 from .schemas import (
     PoolData,
+    PoolState,
     TonBaseProvideLiquidityParams,
     TonCreateLiquidityPoolParams,
     TonProvideAction,
     TonProvideCommonParams,
     TonProvideLiquidityParams,
+    TonSwapCurve,
+    TonSwapCurvePoint,
     TonSwapParams,
+    TonSwapRouteStep,
 )
 
 # === === === === === === ===
 
-FEE_DIVIDER = 10000
+type SwapType = Literal["direct", "reverse"]
 
-# === === === === === === ===
+type SwapQuery = Tuple[TonAddress, TonAddress, int, SwapType]
 
-type SwapType = Literal["direct", "reverse"]
+type RouteHop = Tuple[str, str, PoolEdge]
 
 # === === === === === === ===
 
@@ -64,26 +74,90 @@ class DexParamsManager:
         units: int,
         slippage_tolerance: float,
         swap_type: SwapType,
+        allow_route: bool = False,
+    ) -> TonSwapParams:
+        """Returns swap params through the pool of the pair.
+
+        With `allow_route`, a direct swap may be quoted through a multi-hop route
+        instead, when the route pays more. Such params carry the `route` steps and
+        cannot be prepared as a single swap transaction.
+        """
+
+        if not allow_route or swap_type != "direct":
+            return await self._get_pool_swap_params(
+                offer_address=offer_address,
+                ask_address=ask_address,
+                referral_address=referral_address,
+                units=units,
+                slippage_tolerance=slippage_tolerance,
+                swap_type=swap_type,
+            )
+
+        direct_params: TonSwapParams | None = None
+        try:
+            direct_params = await self._get_pool_swap_params(
+                offer_address=offer_address,
+                ask_address=ask_address,
+                referral_address=referral_address,
+                units=units,
+                slippage_tolerance=slippage_tolerance,
+                swap_type=swap_type,
+            )
+        except (PoolAddressNotFoundError, PoolNotFoundError):
+            pass
+
+        route = self._find_best_route(
+            offer_minter_address=self._to_minter_address(offer_address),
+            ask_minter_address=self._to_minter_address(ask_address),
+            offer_units=units,
+            has_ref=bool(referral_address),
+        )
+
+        if len(route) < 2:
+            if not direct_params:
+                raise PoolNotFoundError()
+            return direct_params
+
+        route_params = await self.get_route_swap_params(
+            offer_address=offer_address,
+            ask_address=ask_address,
+            referral_address=referral_address,
+            offer_units=units,
+            slippage_tolerance=slippage_tolerance,
+            route=route,
+        )
+
+        # The route was chosen on cached states, so it is checked against the direct
+        # swap once both are quoted on up-to-date ones.
+        if direct_params and direct_params.ask_units >= route_params.ask_units:
+            return direct_params
+
+        return route_params
+
+    # === === === === === === ===
+
+    async def _get_pool_swap_params(
+        self,
+        offer_address: TonAddress,
+        ask_address: TonAddress,
+        referral_address: TonAddress | None,
+        units: int,
+        slippage_tolerance: float,
+        swap_type: SwapType,
     ) -> TonSwapParams:
 
-        pool_data = await self._get_pool_data(
+        offer_minter_address = self._to_minter_address(offer_address)
+
+        pool_state = await self._get_pool_state(
             token_0_address=offer_address, token_1_address=ask_address
         )
 
-        if not pool_data:
+        if not pool_state:
             raise PoolNotFoundError()
 
-        # pool_offer_wallet_address = await self._get_wallet_address(
-        #     jetton_minter_address=offer_address, owner_address=pool_data.address
-        # )
-        # if not pool_offer_wallet_address:
-        #     raise Exception("Pool offer wallet address not found.")
-
-        in_reserved, out_reserved = (
-            (pool_data.reserve_0, pool_data.reserve_1)
-            # if pool_data.token_0_address == pool_offer_wallet_address
-            if hash(offer_address.to_raw_string()) > hash(ask_address.to_raw_string())
-            else (pool_data.reserve_1, pool_data.reserve_0)
+        pool_data = pool_state.pool_data
+        in_reserved, out_reserved = pool_state.get_reserves(
+            offer_minter_address=offer_minter_address
         )
 
         if swap_type == "direct":
@@ -115,6 +189,117 @@ class DexParamsManager:
 
     # === === === === === === ===
 
+    async def get_batch_swap_params(
+        self,
+        queries: List[SwapQuery],
+        referral_address: TonAddress | None,
+        slippage_tolerance: float,
+    ) -> List[TonSwapParams | Exception]:
+        """Returns swap params for every `(offer, ask, units, swap_type)` query.
+
+        Every distinct stored pool is refreshed once before quoting, so the
+        queries share the same pool states. Results are in the order of queries,
+        with the exception raised for a query in place of its params.
+        """
+
+        store = PoolStateStore()
+
+        stored_pool_states: Dict[TonAddress, PoolState] = {}
+        for offer_address, ask_address, _, _ in queries:
+            pool_state = store.find(
+                self._to_minter_address(offer_address), self._to_minter_address(ask_address)
+            )
+            if pool_state:
+                stored_pool_states[pool_state.address] = pool_state
+
+        await asyncio.gather(
+            *[self._refresh_pool_state(pool_state) for pool_state in stored_pool_states.values()],
+            return_exceptions=True,
+        )
+
+        results: List[TonSwapParams | Exception] = []
+        failed_queries: Dict[Tuple[FrozenSet[TonAddress], SwapType], Exception] = {}
+
+        for offer_address, ask_address, units, swap_type in queries:
+            # Pools that were not found once are not looked up again within the batch.
+            failure_key = (frozenset((offer_address, ask_address)), swap_type)
+            if failure_key in failed_queries:
+                results.append(failed_queries[failure_key])
+                continue
+
+            try:
+                result = await self.get_swap_params(
+                    offer_address=offer_address,
+                    ask_address=ask_address,
+                    referral_address=referral_address,
+                    units=units,
+                    slippage_tolerance=slippage_tolerance,
+                    swap_type=swap_type,
+                )
+            except (PoolAddressNotFoundError, PoolNotFoundError) as e:
+                failed_queries[failure_key] = e
+                results.append(e)
+                continue
+            except Exception as e:
+                results.append(e)
+                continue
+
+            results.append(result)
+
+        return results
+
+    # === === === === === === ===
+
+    async def get_swap_curve(
+        self,
+        offer_address: TonAddress,
+        ask_address: TonAddress,
+        referral_address: TonAddress | None,
+        units: List[int],
+    ) -> TonSwapCurve:
+        """Returns direct swap quotes for every offered amount over the same pool state."""
+
+        pool_state = await self._get_pool_state(
+            token_0_address=offer_address, token_1_address=ask_address
+        )
+
+        if not pool_state:
+            raise PoolNotFoundError()
+
+        pool_data = pool_state.pool_data
+        in_reserved, out_reserved = pool_state.get_reserves(
+            offer_minter_address=self._to_minter_address(offer_address)
+        )
+
+        amounts_out = amm_math.get_amounts_out(
+            has_ref=bool(referral_address),
+            amounts_in=units,
+            reserve_in=in_reserved,
+            reserve_out=out_reserved,
+            lp_fee=pool_data.lp_fee,
+            protocol_fee=pool_data.protocol_fee,
+            ref_fee=pool_data.ref_fee,
+        )
+
+        return TonSwapCurve(
+            offer_address=offer_address,
+            ask_address=ask_address,
+            pool_address=pool_data.address,
+            points=[
+                TonSwapCurvePoint(
+                    offer_units=offer_units,
+                    ask_units=ask_units,
+                    fee_units=protocol_fee_units + ref_fee_units,
+                    price_impact=_calculate_price_impact(amount=offer_units, reserved=in_reserved),
+                )
+                for offer_units, (ask_units, protocol_fee_units, ref_fee_units) in zip(
+                    units, amounts_out
+                )
+            ],
+        )
+
+    # === === === === === === ===
+
     async def get_direct_swap_params(
         self,
         offer_address: TonAddress,
@@ -128,7 +313,7 @@ class DexParamsManager:
         pool_address: TonAddress,
     ) -> TonSwapParams:
 
-        ask_units, protocol_fee_units, ref_fee_units = _calculate_out_amount(
+        ask_units, protocol_fee_units, ref_fee_units = amm_math.get_amount_out(
             has_ref=bool(referral_address),
             amount_in=offer_units,
             reserve_in=in_reserved,
@@ -155,7 +340,7 @@ class DexParamsManager:
             ask_units=ask_units,
             fee_address=ask_address,
             fee_percent=fee_percent,
-            fee_units=int(protocol_fee_units + ref_fee_units),
+            fee_units=protocol_fee_units + ref_fee_units,
             min_ask_units=min_ask_units,
             offer_address=offer_address,
             offer_units=offer_units,
@@ -190,17 +375,31 @@ class DexParamsManager:
         if out_reserved < ask_units:
             raise NotEnoughLiquidityError()
 
-        offer_units = _calculate_in_amount(
-            has_ref=bool(referral_address),
+        has_ref = bool(referral_address)
+
+        exact_offer_units = amm_math.get_amount_in(
+            has_ref=has_ref,
             amount_out=ask_units,
             reserve_in=in_reserved,
             reserve_out=out_reserved,
             lp_fee=pool_data.lp_fee,
             protocol_fee=pool_data.protocol_fee,
             ref_fee=pool_data.ref_fee,
-            slippage_tolerance=slippage_tolerance,
+        )
+        _, protocol_fee_units, ref_fee_units = amm_math.get_amount_out(
+            has_ref=has_ref,
+            amount_in=exact_offer_units,
+            reserve_in=in_reserved,
+            reserve_out=out_reserved,
+            lp_fee=pool_data.lp_fee,
+            protocol_fee=pool_data.protocol_fee,
+            ref_fee=pool_data.ref_fee,
         )
 
+        # The exact amount pays `ask_units` only if reserves don't move until the swap.
+        # Rounded up in integers, so the offer never drops below the exact amount.
+        offer_units = amm_math.add_slippage(exact_offer_units, slippage_tolerance)
+
         price_impact = _calculate_price_impact(
             amount=offer_units,
             reserved=in_reserved,
@@ -210,18 +409,8 @@ class DexParamsManager:
         swap_rate = (ask_units / offer_units) if offer_units > 0 else 0
 
         slippage_tolerance /= 100
-        protocol_fee_units = (
-            min_ask_units * (100 + slippage_tolerance) / (10_000 * pool_data.protocol_fee)
-        )
-        ref_fee_units = (
-            (min_ask_units * (100 + slippage_tolerance) / (10_000 * pool_data.ref_fee))
-            if referral_address
-            else 0
-        )
         fee_percent = (
-            (protocol_fee_units + ref_fee_units) / min_ask_units * (100 + slippage_tolerance)
-            if min_ask_units > 0
-            else 0
+            (protocol_fee_units + ref_fee_units) / min_ask_units if min_ask_units > 0 else 0
         )
 
         response = TonSwapParams(
@@ -229,7 +418,7 @@ class DexParamsManager:
             ask_units=min_ask_units,
             fee_address=ask_address,
             fee_percent=fee_percent,
-            fee_units=int(protocol_fee_units + ref_fee_units),
+            fee_units=protocol_fee_units + ref_fee_units,
             min_ask_units=min_ask_units,
             offer_address=offer_address,
             offer_units=offer_units,
@@ -248,6 +437,112 @@ class DexParamsManager:
 
     # === === === === === === ===
 
+    async def get_route_swap_params(
+        self,
+        offer_address: TonAddress,
+        ask_address: TonAddress,
+        referral_address: TonAddress | None,
+        offer_units: int,
+        slippage_tolerance: float,
+        route: List[RouteHop],
+    ) -> TonSwapParams:
+
+        store = PoolStateStore()
+
+        cached_pool_states: List[PoolState] = []
+        for _, _, edge in route:
+            pool_state = store.get(edge.pool_address)
+            if not pool_state:
+                raise PoolNotFoundError()
+            cached_pool_states.append(pool_state)
+
+        # The route was chosen on cached states. Quote it again on up-to-date ones.
+        pool_states = await asyncio.gather(
+            *[self._refresh_pool_state(pool_state) for pool_state in cached_pool_states]
+        )
+
+        steps: List[TonSwapRouteStep] = []
+        units = offer_units
+        price_ratio = 1.0
+
+        for (offer_token, ask_token, edge), pool_state in zip(route, pool_states):
+            if not pool_state:
+                raise PoolNotFoundError()
+
+            pool_data = pool_state.pool_data
+            in_reserved, out_reserved = _get_edge_reserves(pool_state=pool_state, edge=edge)
+
+            ask_units, protocol_fee_units, ref_fee_units = amm_math.get_amount_out(
+                has_ref=bool(referral_address),
+                amount_in=units,
+                reserve_in=in_reserved,
+                reserve_out=out_reserved,
+                lp_fee=pool_data.lp_fee,
+                protocol_fee=pool_data.protocol_fee,
+                ref_fee=pool_data.ref_fee,
+            )
+            price_impact = _calculate_price_impact(amount=units, reserved=in_reserved)
+            price_ratio *= 1 - price_impact / 100
+
+            steps.append(
+                TonSwapRouteStep(
+                    pool_address=pool_data.address,
+                    offer_address=self._to_asset_address(TonAddress(offer_token)),
+                    ask_address=self._to_asset_address(TonAddress(ask_token)),
+                    offer_units=units,
+                    ask_units=ask_units,
+                    fee_units=protocol_fee_units + ref_fee_units,
+                    price_impact=price_impact,
+                )
+            )
+            units = ask_units
+
+        ask_units = units
+
+        # Each hop takes its fees in its own ask token. Carry the fees of earlier hops
+        # to the final ask token at the effective rate of the hops that follow.
+        fee_units = 0
+        for step in steps:
+            if step.offer_units > 0:
+                fee_units = fee_units * step.ask_units // step.offer_units
+            fee_units += step.fee_units
+
+        slippage_tolerance /= 100
+        min_ask_units = int(ask_units * (1 - slippage_tolerance)) if ask_units > 0 else 0
+
+        swap_rate = ask_units / offer_units if offer_units > 0 else 0
+
+        fee_percent = fee_units / ask_units if ask_units > 0 else 0
+
+        response = TonSwapParams(
+            ask_address=ask_address,
+            ask_units=ask_units,
+            fee_address=ask_address,
+            fee_percent=fee_percent,
+            fee_units=fee_units,
+            min_ask_units=min_ask_units,
+            offer_address=offer_address,
+            offer_units=offer_units,
+            pool_address=steps[0].pool_address,
+            price_impact=(1 - price_ratio) * 100,
+            router_address=self.router.address,
+            slippage_tolerance=slippage_tolerance,
+            swap_rate=swap_rate,
+            min_fee=TonConstants.Fees.SWAP_MIN * len(steps),
+            max_fee=sum(
+                self._get_swap_max_fee(
+                    offer_contract_address=step.offer_address,
+                    ask_contract_address=step.ask_address,
+                )
+                for step in steps
+            ),
+            route=steps,
+        )
+
+        return response
+
+    # === === === === === === ===
+
     async def get_provide_liquidity_params(
         self,
         first_token_address: TonAddress,
@@ -259,17 +554,18 @@ class DexParamsManager:
         account_address: TonAddress | None = None,
     ) -> TonBaseProvideLiquidityParams:
 
-        pool_address = await self.router.get_pool_address(
+        pool_state = await self._get_pool_state(
             token_0_address=first_token_address, token_1_address=second_token_address
         )
-        if not pool_address:
-            raise PoolAddressNotFoundError()
-
-        pool = PoolContract(address=pool_address, ton_client=self.ton_client)
-        pool_data = await pool.get_pool_data()
 
-        if not pool_data:
+        if not pool_state:
             # Pool not exists yet. Creating 'create' params.
+            pool_address = await self.router.get_pool_address(
+                token_0_address=first_token_address, token_1_address=second_token_address
+            )
+            if not pool_address:
+                raise PoolAddressNotFoundError()
+
             return await self._get_create_pool_params(
                 first_token_address=first_token_address,
                 second_token_address=second_token_address,
@@ -278,8 +574,17 @@ class DexParamsManager:
                 pool_address=pool_address,
             )
 
+        pool_data = pool_state.pool_data
+        pool = PoolContract(address=pool_data.address, ton_client=self.ton_client)
+        first_is_token_0 = (
+            self._to_minter_address(first_token_address) == pool_state.token_0_minter_address
+        )
+
         if account_address:
-            lp_account_address = await pool.get_lp_account_address(owner_address=account_address)
+            lp_account_address = await pool.get_lp_account_address(
+                owner_address=account_address,
+                lp_account_code=await self.router.get_lp_account_code(),
+            )
             if not lp_account_address:
                 raise LpAccountAddressNotFoundError()
 
@@ -304,16 +609,11 @@ class DexParamsManager:
                 second_token_units=second_token_units,
                 slippage_tolerance=slippage_tolerance,
                 first_is_base=first_is_base,
-                pool=pool,
                 lp_account_address=lp_account_address,
-                pool_data=pool_data,
+                pool_state=pool_state,
+                first_is_token_0=first_is_token_0,
             )
 
-        # pool_first_token_wallet_address = await self._get_wallet_address(
-        #     jetton_minter_address=first_token_address,
-        #     owner_address=pool_data.address,
-        # )
-
         (
             first_token_reserved,
             second_token_reserved,
@@ -326,9 +626,7 @@ class DexParamsManager:
                 lp_account_data.token_0_balance,
                 lp_account_data.token_1_balance,
             )
-            # if pool_data.token_0_wallet_address == pool_first_token_wallet_address
-            if hash(first_token_address.to_raw_string())
-            > hash(second_token_address.to_raw_string())
+            if first_is_token_0
             else (
                 pool_data.reserve_1,
                 pool_data.reserve_0,
@@ -386,9 +684,8 @@ class DexParamsManager:
         # === === === === === === ===
 
         common_params = await self._get_provide_common_params(
-            pool=pool,
-            first_token_address=first_token_address,
-            second_token_address=second_token_address,
+            pool_state=pool_state,
+            first_is_token_0=first_is_token_0,
             first_token_units=first_token_units_r,
             second_token_units=second_token_units_r,
             first_token_reserved=first_token_reserved,
@@ -419,11 +716,25 @@ class DexParamsManager:
 
     # === === === === === === ===
 
-    async def _get_pool_data(
+    async def _get_pool_state(
         self,
         token_0_address: TonAddress,
         token_1_address: TonAddress,
-    ) -> PoolData | None:
+    ) -> PoolState | None:
+        """Returns the pool state from `PoolStateStore`.
+
+        The pool is fetched with a live `get_pool_data` call only when the
+        stored state is missing or older than `pool_state_max_age_seconds`.
+        """
+
+        token_0_minter_address = self._to_minter_address(token_0_address)
+        token_1_minter_address = self._to_minter_address(token_1_address)
+
+        store = PoolStateStore()
+        pool_state = store.find(token_0_minter_address, token_1_minter_address)
+
+        if pool_state:
+            return await self._refresh_pool_state(pool_state)
 
         pool_address = await self.router.get_pool_address(
             token_0_address=token_0_address, token_1_address=token_1_address
@@ -434,7 +745,203 @@ class DexParamsManager:
         pool = PoolContract(address=pool_address, ton_client=self.ton_client)
         pool_data = await pool.get_pool_data()
 
-        return pool_data
+        if not pool_data:
+            return None
+
+        # Router jetton wallets are usually cached by 'get_pool_address'.
+        token_0_wallet_address = await self.ton_client.get_jetton_wallet_address(
+            jetton_minter_address=token_0_minter_address,
+            owner_address=self.router.address,
+        )
+        if pool_data.token_0_address != token_0_wallet_address:
+            token_0_minter_address, token_1_minter_address = (
+                token_1_minter_address,
+                token_0_minter_address,
+            )
+
+        pool_state = PoolState(
+            pool_data=pool_data,
+            token_0_minter_address=token_0_minter_address,
+            token_1_minter_address=token_1_minter_address,
+            updated_at=time.time(),
+        )
+        store.put(pool_state)
+
+        return pool_state
+
+    # === === === === === === ===
+
+    async def _refresh_pool_state(
+        self,
+        pool_state: PoolState,
+    ) -> PoolState | None:
+        """Returns the stored pool state, re-fetching it only when it is outdated."""
+
+        store = PoolStateStore()
+
+        if store.is_fresh(
+            pool_state, max_age_seconds=self.config.ton_dex.pool_state_max_age_seconds
+        ):
+            return pool_state
+
+        pool = PoolContract(address=pool_state.address, ton_client=self.ton_client)
+        pool_data = await pool.get_pool_data()
+
+        if not pool_data:
+            return None
+
+        # LP supply changes only together with reserves, so it stays known while they match.
+        reserves_changed = (pool_data.reserve_0, pool_data.reserve_1) != (
+            pool_state.pool_data.reserve_0,
+            pool_state.pool_data.reserve_1,
+        )
+
+        pool_state = PoolState(
+            pool_data=pool_data,
+            token_0_minter_address=pool_state.token_0_minter_address,
+            token_1_minter_address=pool_state.token_1_minter_address,
+            total_supply=None if reserves_changed else pool_state.total_supply,
+            updated_at=time.time(),
+        )
+        store.put(pool_state)
+
+        return pool_state
+
+    # === === === === === === ===
+
+    def _find_best_route(
+        self,
+        offer_minter_address: TonAddress,
+        ask_minter_address: TonAddress,
+        offer_units: int,
+        has_ref: bool,
+    ) -> List[RouteHop]:
+        """Returns the route of up to `max_route_hops` pools with the best output.
+
+        Routes are quoted on cached pool states only, so the search makes no
+        network calls. Since the output of a pool grows with its input, only the
+        best amount of every token paired with the ask token is kept on the way.
+        """
+
+        graph = PoolGraph()
+        max_route_hops = self.config.ton_dex.max_route_hops
+
+        offer_token = offer_minter_address.to_string()
+        ask_token = ask_minter_address.to_string()
+
+        offer_neighbors = graph.get_neighbors(offer_token)
+        ask_neighbors = graph.get_neighbors(ask_token)
+
+        best_units = 0
+        best_route: List[RouteHop] = []
+
+        if ask_token in offer_neighbors:
+            edge = offer_neighbors[ask_token]
+            best_units = self._quote_edge(edge=edge, amount_in=offer_units, has_ref=has_ref)
+            best_route = [(offer_token, ask_token, edge)]
+
+        if max_route_hops < 2:
+            return best_route
+
+        # Best routes of two hops to the tokens paired with the ask token.
+        two_hop_routes: Dict[str, Tuple[int, List[RouteHop]]] = {}
+
+        for token_1, edge_1 in offer_neighbors.items():
+            if token_1 == ask_token:
+                continue
+
+            token_1_neighbors = graph.get_neighbors(token_1)
+
+            next_tokens: List[str] = []
+            if max_route_hops >= 3:
+                smaller, larger = sorted((token_1_neighbors, ask_neighbors), key=len)
+                next_tokens = [
+                    token
+                    for token in smaller
+                    if token in larger and token != offer_token and token != ask_token
+                ]
+
+            if ask_token not in token_1_neighbors and not next_tokens:
+                continue
+
+            units_1 = self._quote_edge(edge=edge_1, amount_in=offer_units, has_ref=has_ref)
+            if units_1 <= 0:
+                continue
+            hop_1 = (offer_token, token_1, edge_1)
+
+            if ask_token in token_1_neighbors:
+                edge_2 = token_1_neighbors[ask_token]
+                units = self._quote_edge(edge=edge_2, amount_in=units_1, has_ref=has_ref)
+                if units > best_units:
+                    best_units = units
+                    best_route = [hop_1, (token_1, ask_token, edge_2)]
+
+            for token_2 in next_tokens:
+                edge_2 = token_1_neighbors[token_2]
+                units_2 = self._quote_edge(edge=edge_2, amount_in=units_1, has_ref=has_ref)
+                if units_2 > two_hop_routes.get(token_2, (0, []))[0]:
+                    two_hop_routes[token_2] = (units_2, [hop_1, (token_1, token_2, edge_2)])
+
+        for token_2, (units_2, route) in two_hop_routes.items():
+            edge_3 = graph.get_neighbors(token_2)[ask_token]
+            units = self._quote_edge(edge=edge_3, amount_in=units_2, has_ref=has_ref)
+            if units > best_units:
+                best_units = units
+                best_route = [*route, (token_2, ask_token, edge_3)]
+
+        return best_route
+
+    # === === === === === === ===
+
+    def _quote_edge(
+        self,
+        edge: PoolEdge,
+        amount_in: int,
+        has_ref: bool,
+    ) -> int:
+
+        pool_state = PoolStateStore().get(edge.pool_address)
+        if not pool_state:
+            return 0
+
+        pool_data = pool_state.pool_data
+        reserve_in, reserve_out = _get_edge_reserves(pool_state=pool_state, edge=edge)
+
+        amount_out, _, _ = amm_math.get_amount_out(
+            has_ref=has_ref,
+            amount_in=amount_in,
+            reserve_in=reserve_in,
+            reserve_out=reserve_out,
+            lp_fee=pool_data.lp_fee,
+            protocol_fee=pool_data.protocol_fee,
+            ref_fee=pool_data.ref_fee,
+        )
+
+        return amount_out
+
+    # === === === === === === ===
+
+    def _to_minter_address(
+        self,
+        address: TonAddress,
+    ) -> TonAddress:
+
+        if address == TonConstants.ContractAddresses.TON:
+            return self.config.ton_dex.proxy_ton_address
+
+        return address
+
+    # === === === === === === ===
+
+    def _to_asset_address(
+        self,
+        address: TonAddress,
+    ) -> TonAddress:
+
+        if address == self.config.ton_dex.proxy_ton_address:
+            return TonConstants.ContractAddresses.TON
+
+        return address
 
     # === === === === === === ===
 
@@ -472,32 +979,27 @@ class DexParamsManager:
 
     async def _get_simple_provide_params(
         self,
-        pool: PoolContract,
+        pool_state: PoolState,
+        first_is_token_0: bool,
         first_token_address: TonAddress,
         second_token_address: TonAddress,
         first_token_units: int,
         second_token_units: int,
         first_is_base: bool,
         slippage_tolerance: float,
-        pool_data: PoolData,
         lp_account_address: TonAddress | None = None,
     ) -> TonProvideLiquidityParams:
 
-        # pool_first_token_wallet_address = await self._get_wallet_address(
-        #     jetton_minter_address=first_token_address, owner_address=pool_data.address
-        # )
-        (first_token_reserved, second_token_reserved) = (
+        pool_data = pool_state.pool_data
+        first_token_reserved, second_token_reserved = (
             (pool_data.reserve_0, pool_data.reserve_1)
-            # if pool_data.token_0_wallet_address == pool_first_token_wallet_address
-            if hash(first_token_address.to_raw_string())
-            > hash(second_token_address.to_raw_string())
+            if first_is_token_0
             else (pool_data.reserve_1, pool_data.reserve_0)
         )
 
         common_params = await self._get_provide_common_params(
-            pool=pool,
-            first_token_address=first_token_address,
-            second_token_address=second_token_address,
+            pool_state=pool_state,
+            first_is_token_0=first_is_token_0,
             first_token_units=first_token_units,
             second_token_units=second_token_units,
             slippage_tolerance=slippage_tolerance,
@@ -528,9 +1030,8 @@ class DexParamsManager:
 
     async def _get_provide_common_params(
         self,
-        pool: PoolContract,
-        first_token_address: TonAddress,
-        second_token_address: TonAddress,
+        pool_state: PoolState,
+        first_is_token_0: bool,
         first_token_units: int,
         second_token_units: int,
         slippage_tolerance: float,
@@ -554,18 +1055,16 @@ class DexParamsManager:
 
         first_token_units_t, second_token_units_t = (
             (first_token_units, second_token_units)
-            if hash(first_token_address.to_raw_string())
-            > hash(second_token_address.to_raw_string())
+            if first_is_token_0
             else (second_token_units, first_token_units)
         )
 
-        # TODO: Modify contract to send total supply in 'get_pool_data'
-        #       and calculate expected units here
-        expected_units = await pool.get_expected_lp_tokens(
+        expected_units = await LpEstimator(ton_client=self.ton_client).get_expected_lp_tokens(
+            pool_state=pool_state,
             token_0_amount=first_token_units_t,
             token_1_amount=second_token_units_t,
         )
-        if not expected_units:
+        if expected_units is None:
             raise PoolNotFoundError()
 
         min_expected_tokens = int(expected_units * (100 - slippage_tolerance) / 100)
@@ -620,70 +1119,17 @@ class DexParamsManager:
     # === === === === === === ===
 
 
-def _calculate_out_amount(
-    has_ref: int,
-    amount_in: int,
-    reserve_in: int,
-    reserve_out: int,
-    lp_fee: int,
-    protocol_fee: int,
-    ref_fee: int,
-) -> Tuple[int, int, int]:
-    # TODO: Refactor
-
-    if amount_in <= 0:
-        return (0, 0, 0)
-
-    amount_in_with_fee = amount_in / 1_000_000_000 * (FEE_DIVIDER - lp_fee)
-    base_out = (amount_in_with_fee * reserve_out / 1_000_000_000) / (
-        reserve_in / 1_000_000_000 * FEE_DIVIDER + amount_in_with_fee
-    )
-
-    protocol_fee_out = 0
-    ref_fee_out = 0
-
-    if protocol_fee > 0:
-        protocol_fee_out = base_out * protocol_fee / FEE_DIVIDER
-
-    if has_ref and (ref_fee > 0):
-        ref_fee_out = base_out * ref_fee / FEE_DIVIDER
-
-    base_out -= protocol_fee_out + ref_fee_out
-
-    return (
-        int(base_out * 1_000_000_000),
-        int(protocol_fee_out * 1_000_000_000),
-        int(ref_fee_out * 1_000_000_000),
-    )
-
-
-# === === === === === === ===
-
-
-def _calculate_in_amount(
-    has_ref: int,
-    amount_out: int,
-    reserve_in: int,
-    reserve_out: int,
-    lp_fee: int,
-    protocol_fee: int,
-    ref_fee: int,
-    slippage_tolerance: float,
-) -> int:
-
-    if amount_out <= 0:
-        return 0
-
-    numerator = (
-        ((reserve_in / 1_000_000_000) * (amount_out / 1_000_000_000)) * 10_000 * 1_000_000_000
-    )
-    denominator = (reserve_out - amount_out) / 1_000_000_000 * (10_000 - lp_fee)
+def _get_edge_reserves(
+    pool_state: PoolState,
+    edge: PoolEdge,
+) -> Tuple[int, int]:
 
-    amount_in = numerator / denominator + 1
+    pool_data = pool_state.pool_data
 
-    amount_in = int((amount_in * (10_020 + (slippage_tolerance * 100))) // 10_000)
+    if edge.offer_is_token_0:
+        return (pool_data.reserve_0, pool_data.reserve_1)
 
-    return amount_in
+    return (pool_data.reserve_1, pool_data.reserve_0)
 
 
 # === === === === === === ===
@@ -1,7 +1,8 @@
 # === === === === === === ===
 
-from typing import Dict
+from typing import Tuple
 
+from pytoniq_core import Address, Cell, StateInit, begin_cell
 from src.blockchains.ton.clients.exceptions import (
     TonGetMethodNotFoundError,
     TonGetMethodResultValidationError,
@@ -10,16 +11,32 @@ from src.blockchains.ton.clients.ton_client import TonClient
 from src.blockchains.ton.clients.utils import parse_address_from_cell_str
 from src.blockchains.ton.schemas._models import JettonData
 from src.features.ton_common.jetton_minter_contract import JettonMinterContract
+from src.utils.logging.logging import create_custom_logger
+from src.utils.lru_cache import LruCache
 from src.utils.ton_address import TonAddress
 
 from .schemas import ExpectedLiquidityData, PoolData
 
 # === === === === === === ===
 
+logger = create_custom_logger("PoolContract")
+
+# === === === === === === ===
+
+LP_ACCOUNT_ADDRESSES_CACHE_SIZE = 10_000
+
+# === === === === === === ===
+
 
 class PoolContract:
 
-    lp_account_addresses_cache: Dict[TonAddress, TonAddress] = {}
+    lp_account_addresses_cache: LruCache[Tuple[TonAddress, TonAddress], TonAddress] = LruCache(
+        max_size=LP_ACCOUNT_ADDRESSES_CACHE_SIZE
+    )
+
+    # Local derivation is trusted after its first result matches the get-method.
+    is_lp_account_derivation_verified: bool = False
+    is_lp_account_derivation_disabled: bool = False
 
     # === === === === === === ===
 
@@ -48,6 +65,10 @@ class PoolContract:
         except TonGetMethodNotFoundError:
             return None
 
+        # The get-method fails on contracts that aren't pools.
+        if response and not response.success:
+            return None
+
         if not response or not response.stack:
             raise TonGetMethodResultValidationError("No response or stack.")
 
@@ -135,13 +156,25 @@ class PoolContract:
     async def get_lp_account_address(
         self,
         owner_address: TonAddress,
+        lp_account_code: Cell | None = None,
     ) -> TonAddress | None:
 
-        lp_account_address = PoolContract.lp_account_addresses_cache.get(owner_address)
+        cache_key = (self.address, owner_address)
+
+        lp_account_address = PoolContract.lp_account_addresses_cache.get(cache_key)
 
         if lp_account_address:
             return lp_account_address
 
+        derived_lp_account_address = None
+        if lp_account_code and not PoolContract.is_lp_account_derivation_disabled:
+            derived_lp_account_address = self.derive_lp_account_address(
+                owner_address=owner_address, lp_account_code=lp_account_code
+            )
+            if PoolContract.is_lp_account_derivation_verified:
+                PoolContract.lp_account_addresses_cache.put(cache_key, derived_lp_account_address)
+                return derived_lp_account_address
+
         try:
             response = await self.ton_client.run_get_method(
                 self.address,
@@ -159,12 +192,45 @@ class PoolContract:
         if not lp_account_address:
             raise TonGetMethodResultValidationError("Wrong stack data.")
 
-        PoolContract.lp_account_addresses_cache[owner_address] = lp_account_address
+        if derived_lp_account_address:
+            if derived_lp_account_address == lp_account_address:
+                PoolContract.is_lp_account_derivation_verified = True
+            else:
+                PoolContract.is_lp_account_derivation_disabled = True
+                logger.warning(
+                    "Derived LP account mismatch for pool %s: %s != %s. Derivation disabled.",
+                    self.address.to_string(),
+                    derived_lp_account_address.to_string(),
+                    lp_account_address.to_string(),
+                )
+
+        PoolContract.lp_account_addresses_cache.put(cache_key, lp_account_address)
 
         return lp_account_address
 
     # === === === === === === ===
 
+    def derive_lp_account_address(
+        self,
+        owner_address: TonAddress,
+        lp_account_code: Cell,
+    ) -> TonAddress:
+        """Computes the LP account address from the router's LP account code."""
+
+        lp_account_data = (
+            begin_cell()
+            .store_address(owner_address.address)
+            .store_address(self.address.address)
+            .store_coins(0)
+            .store_coins(0)
+            .end_cell()
+        )
+        state_init = StateInit(code=lp_account_code, data=lp_account_data)
+
+        return TonAddress(Address((0, state_init.serialize().hash)))
+
+    # === === === === === === ===
+
     async def get_expected_liquidity(
         self,
         lp_jetton_amount: int,
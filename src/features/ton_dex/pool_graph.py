@@ -0,0 +1,99 @@
+# === === === === === === ===
+
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from src.database.database_models.ton.ton_dex_pool import TonDexPoolDb
+from src.utils.singleton import SingletonMeta
+from src.utils.ton_address import TonAddress
+
+# === === === === === === ===
+
+
+class PoolEdge(NamedTuple):
+
+    pool_address: TonAddress
+    offer_is_token_0: bool
+
+
+# === === === === === === ===
+
+
+class PoolGraph(metaclass=SingletonMeta):
+    """Token graph of DEX pools used for multi-hop route search.
+
+    Nodes are token minter addresses in their string form and edges are pools.
+    The graph only depends on pool membership, so it is rebuilt when the observer
+    adds pools. Reserves are read from `PoolStateStore` at quote time.
+    """
+
+    # === === === === === === ===
+
+    def __init__(self) -> None:
+
+        self._adjacency: Dict[str, Dict[str, PoolEdge]] = {}
+        self._pairs: List[Tuple[str, str]] = []
+        self.pools_count: int = 0
+        # Bumped on every rebuild, for the structures derived from pool membership.
+        self.version: int = 0
+
+    # === === === === === === ===
+
+    def rebuild(
+        self,
+        pools_db: Iterable[TonDexPoolDb],
+    ) -> None:
+
+        adjacency: Dict[str, Dict[str, PoolEdge]] = {}
+        pairs: List[Tuple[str, str]] = []
+        pools_count = 0
+
+        for pool_db in pools_db:
+            pool_address = TonAddress(pool_db.address)
+            token_0 = TonAddress(pool_db.token_0_minter_address).to_string()
+            token_1 = TonAddress(pool_db.token_1_minter_address).to_string()
+
+            adjacency.setdefault(token_0, {})[token_1] = PoolEdge(pool_address, True)
+            adjacency.setdefault(token_1, {})[token_0] = PoolEdge(pool_address, False)
+            pairs.append((token_0, token_1))
+            pools_count += 1
+
+        # Swap the whole structure at once, so readers never see a partial graph.
+        self._adjacency = adjacency
+        self._pairs = pairs
+        self.pools_count = pools_count
+        self.version += 1
+
+    # === === === === === === ===
+
+    def get_pairs(self) -> List[Tuple[str, str]]:
+        """Returns the token pairs of all pools, in pool token order."""
+
+        return self._pairs
+
+    # === === === === === === ===
+
+    def get_tokens(self) -> List[str]:
+
+        return list(self._adjacency)
+
+    # === === === === === === ===
+
+    def get_neighbors(
+        self,
+        token: str,
+    ) -> Dict[str, PoolEdge]:
+        """Returns pools of the token as a `{paired token: pool edge}` dict."""
+
+        return self._adjacency.get(token, {})
+
+    # === === === === === === ===
+
+    def has_pool(
+        self,
+        token_0: str,
+        token_1: str,
+    ) -> bool:
+
+        return token_1 in self._adjacency.get(token_0, {})
+
+    # === === === === === === ===
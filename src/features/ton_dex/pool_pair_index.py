@@ -0,0 +1,61 @@
+# === === === === === === ===
+
+from typing import Dict, Iterable, Tuple
+
+from src.database.database_models.ton.ton_dex_pool import TonDexPoolDb
+from src.utils.singleton import SingletonMeta
+from src.utils.ton_address import TonAddress
+
+# === === === === === === ===
+
+
+class PoolPairIndex(metaclass=SingletonMeta):
+    """In-process index of pool addresses by token minter pair.
+
+    The index is loaded from `ton_dex_pool` at startup and filled by
+    `DexObserver`, so known pairs are resolved without router get-method calls.
+    """
+
+    # === === === === === === ===
+
+    def __init__(self) -> None:
+
+        self._pools: Dict[Tuple[TonAddress, TonAddress], TonAddress] = {}
+
+    # === === === === === === ===
+
+    def get(
+        self,
+        token_0_minter_address: TonAddress,
+        token_1_minter_address: TonAddress,
+    ) -> TonAddress | None:
+
+        return self._pools.get((token_0_minter_address, token_1_minter_address))
+
+    # === === === === === === ===
+
+    def put(
+        self,
+        pool_address: TonAddress,
+        token_0_minter_address: TonAddress,
+        token_1_minter_address: TonAddress,
+    ) -> None:
+
+        self._pools[(token_0_minter_address, token_1_minter_address)] = pool_address
+        self._pools[(token_1_minter_address, token_0_minter_address)] = pool_address
+
+    # === === === === === === ===
+
+    def load(
+        self,
+        pools_db: Iterable[TonDexPoolDb],
+    ) -> None:
+
+        for pool_db in pools_db:
+            self.put(
+                pool_address=TonAddress(pool_db.address),
+                token_0_minter_address=TonAddress(pool_db.token_0_minter_address),
+                token_1_minter_address=TonAddress(pool_db.token_1_minter_address),
+            )
+
+    # === === === === === === ===
@@ -0,0 +1,152 @@
+# === === === === === === ===
+
+import time
+from typing import Dict, Iterable, Tuple
+
+from src.database.database_models.ton.ton_dex_pool import TonDexPoolDb
+from src.utils.singleton import SingletonMeta
+from src.utils.ton_address import TonAddress
+
+from .schemas import PoolData, PoolState
+
+# === === === === === === ===
+
+
+class PoolStateStore(metaclass=SingletonMeta):
+    """In-process store of the latest known on-chain state of every DEX pool.
+
+    The store is fed by `DexObserver` after each refresh cycle and by live
+    `get_pool_data` fallbacks. Since pool reserves only change through router
+    transactions, every state that was not touched by the last successful
+    observer cycle is considered current as of that cycle (`synced_at`).
+    """
+
+    # === === === === === === ===
+
+    def __init__(self) -> None:
+
+        self._states: Dict[TonAddress, PoolState] = {}
+        self._pairs: Dict[Tuple[TonAddress, TonAddress], TonAddress] = {}
+        self.synced_at: float = 0
+
+    # === === === === === === ===
+
+    def get(
+        self,
+        pool_address: TonAddress,
+    ) -> PoolState | None:
+
+        return self._states.get(pool_address)
+
+    # === === === === === === ===
+
+    def find(
+        self,
+        token_0_minter_address: TonAddress,
+        token_1_minter_address: TonAddress,
+    ) -> PoolState | None:
+
+        pool_address = self._pairs.get((token_0_minter_address, token_1_minter_address))
+        if not pool_address:
+            return None
+
+        return self._states.get(pool_address)
+
+    # === === === === === === ===
+
+    def put(
+        self,
+        state: PoolState,
+    ) -> None:
+
+        self._states[state.address] = state
+        self._pairs[(state.token_0_minter_address, state.token_1_minter_address)] = state.address
+        self._pairs[(state.token_1_minter_address, state.token_0_minter_address)] = state.address
+
+    # === === === === === === ===
+
+    def invalidate(
+        self,
+        pool_address: TonAddress,
+    ) -> None:
+        """Marks the pool state as outdated without forgetting the pool itself."""
+
+        state = self._states.get(pool_address)
+        if state:
+            self._states[pool_address] = state.model_copy(update={"updated_at": -1})
+
+    # === === === === === === ===
+
+    def invalidate_many(
+        self,
+        pool_addresses: Iterable[str],
+    ) -> None:
+        """Invalidates pools still waiting in `ton_dex_pool_refresh_queue`, after a `load`."""
+
+        for pool_address in pool_addresses:
+            self.invalidate(TonAddress(pool_address))
+
+    # === === === === === === ===
+
+    def mark_synced(
+        self,
+        synced_at: float | None = None,
+    ) -> None:
+
+        self.synced_at = synced_at if synced_at is not None else time.time()
+
+    # === === === === === === ===
+
+    def is_fresh(
+        self,
+        state: PoolState,
+        max_age_seconds: float,
+    ) -> bool:
+
+        if state.updated_at < 0:
+            return False
+
+        return time.time() - max(state.updated_at, self.synced_at) <= max_age_seconds
+
+    # === === === === === === ===
+
+    def load(
+        self,
+        pools_db: Iterable[TonDexPoolDb],
+        overwrite_before: float | None = None,
+    ) -> None:
+        """Warms the store up from `ton_dex_pool` rows.
+
+        Loaded states are not considered fresh until the next successful
+        observer cycle confirms them. States already in the store are kept,
+        unless they were updated before `overwrite_before`, so newer live
+        states aren't replaced by older rows.
+        """
+
+        for pool_db in pools_db:
+            state = self._states.get(TonAddress(pool_db.address))
+            if state and (overwrite_before is None or state.updated_at >= overwrite_before):
+                continue
+            self.put(
+                PoolState(
+                    pool_data=PoolData(
+                        address=TonAddress(pool_db.address),
+                        reserve_0=pool_db.reserve_0,
+                        reserve_1=pool_db.reserve_1,
+                        token_0_address=TonAddress(pool_db.token_0_wallet_address),
+                        token_1_address=TonAddress(pool_db.token_1_wallet_address),
+                        lp_fee=pool_db.lp_fee,
+                        protocol_fee=pool_db.protocol_fee,
+                        ref_fee=pool_db.ref_fee,
+                        protocol_fee_address=TonAddress(pool_db.protocol_fee_address),
+                        collected_token_0_protocol_fee=pool_db.collected_token_0_protocol_fee,
+                        collected_token_1_protocol_fee=pool_db.collected_token_1_protocol_fee,
+                    ),
+                    token_0_minter_address=TonAddress(pool_db.token_0_minter_address),
+                    token_1_minter_address=TonAddress(pool_db.token_1_minter_address),
+                    total_supply=pool_db.total_supply,
+                    updated_at=0,
+                )
+            )
+
+    # === === === === === === ===
@@ -0,0 +1,93 @@
+# === === === === === === ===
+
+from datetime import UTC, datetime, timedelta
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.config.config import Config
+from src.database.database_models.ton.ton_dex_pool_stats import TonDexPoolStatsDb
+from src.database.repositories.ton.ton_dex_candle_repository import TonDexCandleRepository
+from src.database.repositories.ton.ton_dex_pool_repository import TonDexPoolRepository
+from src.database.repositories.ton.ton_dex_pool_stats_repository import TonDexPoolStatsRepository
+
+from .amm_math import FEE_DIVIDER
+from .price_oracle import AssetPriceOracle
+from .schemas import TonDexCandleResolution
+
+# === === === === === === ===
+
+
+class PoolStatsCalculator:
+    """Recomputes TVL, 24h volume and LP fee APR of every pool into `ton_dex_pool_stats`.
+
+    Volumes are summed from the hourly candles. Tokens are priced in TON by
+    `AssetPriceOracle`, which the observer updates first. The fee APR doesn't
+    need prices: the 24h LP fees and the TVL are both measured in token 0 units.
+    """
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        config: Config,
+        session: AsyncSession,
+    ) -> None:
+
+        self.config = config
+        self.session = session
+
+    # === === === === === === ===
+
+    async def update(self) -> int:
+        """Returns the updated pools count."""
+
+        now = datetime.now(UTC)
+
+        pools_db = await TonDexPoolRepository(session=self.session).get_all()
+        volumes = await TonDexCandleRepository(session=self.session).get_volumes(
+            resolution=TonDexCandleResolution.HOUR.value,
+            since=now - timedelta(hours=24),
+        )
+        ton_prices = AssetPriceOracle().get_nanoton_prices()
+
+        stats: List[TonDexPoolStatsDb] = []
+
+        for pool_db in pools_db:
+            volume_0, volume_1 = volumes.get(pool_db.address, (0, 0))
+
+            price_0 = ton_prices.get(pool_db.token_0_minter_address)
+            price_1 = ton_prices.get(pool_db.token_1_minter_address)
+
+            # Both sides of a constant product pool hold the same value.
+            tvl_ton = None
+            volume_24h_ton = None
+            if price_0 is not None:
+                tvl_ton = int(2 * pool_db.reserve_0 * price_0)
+                volume_24h_ton = int(volume_0 * price_0)
+            elif price_1 is not None:
+                tvl_ton = int(2 * pool_db.reserve_1 * price_1)
+                volume_24h_ton = int(volume_1 * price_1)
+
+            fee_apr = None
+            if pool_db.reserve_0 > 0:
+                fees_24h_0 = volume_0 * pool_db.lp_fee / FEE_DIVIDER
+                fee_apr = fees_24h_0 * 365 / (2 * pool_db.reserve_0)
+
+            stats.append(
+                TonDexPoolStatsDb(
+                    pool_address=pool_db.address,
+                    tvl_ton=tvl_ton,
+                    volume_24h_0=volume_0,
+                    volume_24h_1=volume_1,
+                    volume_24h_ton=volume_24h_ton,
+                    fee_apr=fee_apr,
+                    updated_at=now,
+                )
+            )
+
+        await TonDexPoolStatsRepository(session=self.session).upsert_many(stats=stats)
+
+        return len(stats)
+
+
+# === === === === === === ===
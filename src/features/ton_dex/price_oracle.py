@@ -0,0 +1,305 @@
+# === === === === === === ===
+
+import heapq
+import math
+import time
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+from src.config.config import Config
+from src.utils.singleton import SingletonMeta
+from src.utils.ton_address import TonAddress
+
+from .pool_graph import PoolEdge, PoolGraph
+from .pool_state_store import PoolStateStore
+from .schemas import TonDexAssetPrice
+
+# === === === === === === ===
+
+TON_DECIMALS = 9
+
+# === === === === === === ===
+
+
+class PricePaths(NamedTuple):
+    """Result of a price propagation from one set of anchors.
+
+    Unit prices are in whole anchor units per token unit. `depths` is the anchor
+    value of the shallowest pool on the pricing path of each token.
+    """
+
+    unit_prices: Dict[str, float]
+    depths: Dict[str, float]
+    pools: Set[TonAddress]
+
+
+# === === === === === === ===
+
+
+class AssetPriceOracle(metaclass=SingletonMeta):
+    """Prices of all pool assets in TON and USD, propagated through pool reserves.
+
+    Prices start from the anchors - TON, and the configured stablecoins at
+    1 USD - and spread over `PoolGraph` using reserves from `PoolStateStore`.
+    Each asset takes its price from the path whose shallowest pool holds the
+    most anchor value, so a thin pool never sets the price when a deeper route
+    exists. On update, prices are only recomputed if a changed pool lies on a
+    pricing path or would open a deeper one.
+    """
+
+    # === === === === === === ===
+
+    def __init__(self) -> None:
+
+        self._decimals: Dict[str, int] = {}
+        self._reserves: Dict[TonAddress, Tuple[int, int]] = {}
+        self._anchors: Tuple[str, Tuple[str, ...]] | None = None
+
+        self._ton_paths = PricePaths({}, {}, set())
+        self._usd_paths = PricePaths({}, {}, set())
+
+        self._prices: Dict[str, TonDexAssetPrice] = {}
+        self.updated_at: float = 0
+        self.recomputed_count = 0
+
+    # === === === === === === ===
+
+    def get(
+        self,
+        address: TonAddress,
+    ) -> TonDexAssetPrice | None:
+
+        return self._prices.get(address.to_string())
+
+    # === === === === === === ===
+
+    def get_all(self) -> List[TonDexAssetPrice]:
+
+        return list(self._prices.values())
+
+    # === === === === === === ===
+
+    def get_nanoton_prices(self) -> Dict[str, float]:
+        """Returns the nanoton price of one token unit, by minter address."""
+
+        return {
+            token: unit_price * 10**TON_DECIMALS
+            for token, unit_price in self._ton_paths.unit_prices.items()
+        }
+
+    # === === === === === === ===
+
+    def has_decimals(
+        self,
+        token: str,
+    ) -> bool:
+
+        return token in self._decimals
+
+    # === === === === === === ===
+
+    def update(
+        self,
+        config: Config,
+        decimals: Dict[str, int],
+    ) -> bool:
+        """Reads the current reserves and recomputes the prices they affect.
+
+        `decimals` adds the decimals of tokens not known yet, by minter address.
+        Returns whether the prices were recomputed.
+        """
+
+        self._decimals.update(decimals)
+
+        ton_address = config.ton_dex.proxy_ton_address.to_string()
+        stablecoins = tuple(
+            address.to_string()
+            for address in config.ton_dex.stablecoin_addresses
+            if address.to_string() in self._decimals
+        )
+        anchors = (ton_address, stablecoins)
+
+        changed_pools = self._read_reserves()
+
+        if (
+            anchors != self._anchors
+            or bool(decimals)
+            or any(self._affects(self._ton_paths, pool) for pool in changed_pools)
+            or any(self._affects(self._usd_paths, pool) for pool in changed_pools)
+        ):
+            self._anchors = anchors
+            self._recompute(ton_address, stablecoins)
+            return True
+
+        return False
+
+    # === === === === === === ===
+
+    def _read_reserves(self) -> List[Tuple[str, str, PoolEdge]]:
+        """Snapshots pool reserves. Returns the pools changed since the last snapshot."""
+
+        pool_graph = PoolGraph()
+        pool_state_store = PoolStateStore()
+
+        reserves: Dict[TonAddress, Tuple[int, int]] = {}
+        changed_pools: List[Tuple[str, str, PoolEdge]] = []
+
+        for token in pool_graph.get_tokens():
+            for paired_token, edge in pool_graph.get_neighbors(token).items():
+                # Each pool is seen from both of its tokens, take it once.
+                if not edge.offer_is_token_0:
+                    continue
+
+                state = pool_state_store.get(edge.pool_address)
+                if not state:
+                    continue
+
+                reserves[edge.pool_address] = (state.pool_data.reserve_0, state.pool_data.reserve_1)
+                if self._reserves.get(edge.pool_address) != reserves[edge.pool_address]:
+                    changed_pools.append((token, paired_token, edge))
+
+        removed_pools = self._reserves.keys() - reserves.keys()
+        self._reserves = reserves
+
+        # Removed pools can only matter if they were on a pricing path.
+        if removed_pools & (self._ton_paths.pools | self._usd_paths.pools):
+            self._anchors = None
+
+        return changed_pools
+
+    # === === === === === === ===
+
+    def _affects(
+        self,
+        paths: PricePaths,
+        changed_pool: Tuple[str, str, PoolEdge],
+    ) -> bool:
+
+        token_0, token_1, edge = changed_pool
+        if edge.pool_address in paths.pools:
+            return True
+
+        for token, paired_token in ((token_0, token_1), (token_1, token_0)):
+            if token not in paths.depths:
+                continue
+            reserves = self._get_reserves(token, edge)
+            if not reserves:
+                continue
+            depth = min(paths.depths[token], 2 * reserves[0] * paths.unit_prices[token])
+            if depth > paths.depths.get(paired_token, 0):
+                return True
+
+        return False
+
+    # === === === === === === ===
+
+    def _recompute(
+        self,
+        ton_address: str,
+        stablecoins: Tuple[str, ...],
+    ) -> None:
+
+        self._ton_paths = self._propagate({ton_address: 1 / 10**TON_DECIMALS})
+        self._usd_paths = self._propagate(
+            {stablecoin: 1 / 10 ** self._decimals[stablecoin] for stablecoin in stablecoins}
+        )
+
+        prices: Dict[str, TonDexAssetPrice] = {}
+
+        for token in self._ton_paths.unit_prices.keys() | self._usd_paths.unit_prices.keys():
+            decimals = TON_DECIMALS if token == ton_address else self._decimals.get(token)
+            if decimals is None:
+                continue
+
+            price_ton, liquidity_ton = self._get_price(self._ton_paths, token, decimals)
+            price_usd, liquidity_usd = self._get_price(self._usd_paths, token, decimals)
+            prices[token] = TonDexAssetPrice(
+                address=TonAddress(token),
+                price_ton=price_ton,
+                price_usd=price_usd,
+                liquidity_ton=liquidity_ton,
+                liquidity_usd=liquidity_usd,
+            )
+
+        # Swap the whole dict at once, so readers never see partial prices.
+        self._prices = prices
+        self.updated_at = time.time()
+        self.recomputed_count += 1
+
+    # === === === === === === ===
+
+    def _propagate(
+        self,
+        anchors: Dict[str, float],
+    ) -> PricePaths:
+        """Widest path search: maximizes the shallowest pool value on the path to each token."""
+
+        pool_graph = PoolGraph()
+
+        unit_prices: Dict[str, float] = dict(anchors)
+        depths: Dict[str, float] = {anchor: math.inf for anchor in anchors}
+        path_pools: Dict[str, TonAddress] = {}
+
+        queue: List[Tuple[float, str]] = [(-math.inf, anchor) for anchor in anchors]
+        visited: Set[str] = set()
+
+        while queue:
+            _, token = heapq.heappop(queue)
+            if token in visited:
+                continue
+            visited.add(token)
+
+            for paired_token, edge in pool_graph.get_neighbors(token).items():
+                if paired_token in visited:
+                    continue
+                reserves = self._get_reserves(token, edge)
+                if not reserves:
+                    continue
+
+                reserve_in, reserve_out = reserves
+                # Both sides of a constant product pool hold the same value.
+                depth = min(depths[token], 2 * reserve_in * unit_prices[token])
+                if depth <= depths.get(paired_token, 0):
+                    continue
+
+                depths[paired_token] = depth
+                unit_prices[paired_token] = unit_prices[token] * reserve_in / reserve_out
+                path_pools[paired_token] = edge.pool_address
+                heapq.heappush(queue, (-depth, paired_token))
+
+        return PricePaths(unit_prices, depths, set(path_pools.values()))
+
+    # === === === === === === ===
+
+    def _get_reserves(
+        self,
+        token: str,
+        edge: PoolEdge,
+    ) -> Tuple[int, int] | None:
+        """Returns the snapshotted pool reserves as `(reserve of token, paired reserve)`."""
+
+        reserves = self._reserves.get(edge.pool_address)
+        if not reserves or reserves[0] <= 0 or reserves[1] <= 0:
+            return None
+
+        return reserves if edge.offer_is_token_0 else (reserves[1], reserves[0])
+
+    # === === === === === === ===
+
+    @staticmethod
+    def _get_price(
+        paths: PricePaths,
+        token: str,
+        decimals: int,
+    ) -> Tuple[float | None, float | None]:
+        """Returns the price of a whole token and its path liquidity, `None` for anchors."""
+
+        unit_price = paths.unit_prices.get(token)
+        if unit_price is None:
+            return None, None
+
+        depth = paths.depths[token]
+
+        return unit_price * 10**decimals, None if math.isinf(depth) else depth
+
+
+# === === === === === === ===
@@ -0,0 +1,220 @@
+# === === === === === === ===
+
+import asyncio
+import time
+from typing import List, cast
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.blockchains.ton.clients.ton_client import TonClient
+from src.blockchains.ton.schemas.transaction_cursor import TransactionCursor
+from src.config.config import Config
+from src.database.repositories.storage_repo import StorageCellRepo
+from src.utils.logging.logging import create_custom_logger
+
+from .event_indexer import DexEventIndexer
+from .pool_state_store import PoolStateStore
+
+# === === === === === === ===
+
+logger = create_custom_logger("RouterBackfill")
+
+BACKFILL_CURSOR_NAME = "router_backfill"
+BACKFILL_SEGMENTS_KEY = "router_backfill_segments"
+
+# === === === === === === ===
+
+
+class RouterBackfill:
+    """Walks the router history that predates the live sweep, in concurrent lt segments.
+
+    `plan` splits the history up to the live sweep's starting point into
+    segments, each with its own `TransactionCursor` in `storage_cell`. `run`
+    sweeps the unfinished segments concurrently, under the client's rate
+    limiter, and commits each segment's cursor with the page it covers, so an
+    interrupted backfill resumes where each segment stopped. Pages are indexed
+    one at a time, so swap legs on both sides of a segment boundary still
+    merge into one event.
+    """
+
+    lock = asyncio.Lock()
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        config: Config,
+        ton_client: TonClient,
+    ) -> None:
+
+        self.config = config
+        self.ton_client = ton_client
+
+    # === === === === === === ===
+
+    async def plan(
+        self,
+        session: AsyncSession,
+    ) -> int | None:
+        """Plans the backfill of everything up to the newest router transaction.
+
+        Returns that transaction's lt, where the live sweep should start, or
+        None if the router has no transactions. Staged in `session`.
+        """
+
+        router_address = self.config.ton_dex.router_address
+
+        newest_transactions = await self.ton_client.get_account_transactions(
+            account_address=router_address, limit=1
+        )
+        if not newest_transactions:
+            return None
+        head_lt = newest_transactions[0].lt
+
+        first_lt = await self.find_first_lt(before_lt=head_lt + 1)
+
+        segments_count = self.config.ton_dex.backfill_segments
+        # Segment `i` covers lts in (bounds[i], bounds[i + 1]].
+        bounds = [
+            first_lt - 1 + (head_lt + 1 - first_lt) * i // segments_count
+            for i in range(segments_count + 1)
+        ]
+
+        storage_repo = StorageCellRepo(session=session)
+        for index in range(segments_count):
+            await storage_repo.set_transaction_cursor(
+                f"{BACKFILL_CURSOR_NAME}_{index}",
+                TransactionCursor(after_lt=bounds[index], before_lt=bounds[index + 1] + 1),
+            )
+        await storage_repo.set(BACKFILL_SEGMENTS_KEY, segments_count)
+
+        logger.info(
+            "Planned router backfill of lts %d..%d in %d segments",
+            first_lt,
+            head_lt,
+            segments_count,
+        )
+
+        return head_lt
+
+    # === === === === === === ===
+
+    async def find_first_lt(
+        self,
+        before_lt: int,
+    ) -> int:
+        """Binary searches the lt of the oldest router transaction below `before_lt`."""
+
+        router_address = self.config.ton_dex.router_address
+
+        # No transaction is below `low`; the transaction at `high - 1` exists.
+        low, high = 0, before_lt
+        while high - low > 1:
+            middle = (low + high) // 2
+            transactions = await self.ton_client.get_account_transactions(
+                account_address=router_address, limit=1, before_lt=middle
+            )
+            if transactions:
+                high = transactions[0].lt + 1
+            else:
+                low = middle
+
+        return high - 1
+
+    # === === === === === === ===
+
+    async def run(
+        self,
+        sessionmaker: async_sessionmaker,
+        run_seconds: float,
+    ) -> bool:
+        """Sweeps the unfinished segments for about `run_seconds`. Returns whether all are done."""
+
+        async with sessionmaker() as session:
+            segments_count = cast(
+                int | None,
+                await StorageCellRepo(session=session).get_value(BACKFILL_SEGMENTS_KEY, "int"),
+            )
+        if not segments_count:
+            return True
+
+        deadline = time.monotonic() + run_seconds
+        segments_done: List[bool] = await asyncio.gather(
+            *[
+                self.run_segment(sessionmaker=sessionmaker, index=index, deadline=deadline)
+                for index in range(segments_count)
+            ]
+        )
+
+        logger.info("Router backfill: %d of %d segments done", sum(segments_done), segments_count)
+
+        return all(segments_done)
+
+    # === === === === === === ===
+
+    async def run_segment(
+        self,
+        sessionmaker: async_sessionmaker,
+        index: int,
+        deadline: float,
+    ) -> bool:
+        """Sweeps one segment until it's done or the deadline passes. Returns whether it's done."""
+
+        # Avoids a circular import, the observer plans the backfill.
+        from .dex_observer import DexObserver
+
+        cursor_name = f"{BACKFILL_CURSOR_NAME}_{index}"
+
+        async with sessionmaker() as session:
+            storage_repo = StorageCellRepo(session=session)
+
+            cursor = await storage_repo.get_transaction_cursor(cursor_name)
+            if cursor.before_lt is None:
+                return True
+
+            dex_observer = DexObserver(
+                config=self.config, ton_client=self.ton_client, session=session
+            )
+            event_indexer = DexEventIndexer(ton_client=self.ton_client, session=session)
+
+            is_done = False
+
+            async def checkpoint(next_cursor: TransactionCursor) -> None:
+                nonlocal is_done
+                # The last checkpoint of a sweep has no `before_lt`.
+                is_done = next_cursor.before_lt is None
+                await storage_repo.set_transaction_cursor(cursor_name, next_cursor)
+
+            pages = self.ton_client.iter_account_transactions(
+                account_address=self.config.ton_dex.router_address,
+                cursor=cursor,
+                checkpoint=checkpoint,
+            )
+            try:
+                async for transactions in pages:
+                    async with RouterBackfill.lock:
+                        pool_addresses = await dex_observer.detect_pools_by_transactions(
+                            transactions=transactions
+                        )
+                        # Refreshed by the next observer cycle.
+                        await dex_observer.enqueue_pools(
+                            pool_addresses={
+                                pool_address
+                                for pool_address in pool_addresses
+                                if not PoolStateStore().get(pool_address)
+                            }
+                        )
+                        await event_indexer.index_transactions(transactions=transactions)
+                        # Also commits the checkpoint of the previous page.
+                        await session.commit()
+
+                    if time.monotonic() > deadline:
+                        break
+            finally:
+                await pages.aclose()
+
+            await session.commit()
+
+        return is_done
+
+
+# === === === === === === ===
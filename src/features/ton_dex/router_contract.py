@@ -1,11 +1,10 @@
 # === === === === === === ===
 
 import time
-from collections import defaultdict
 from datetime import timedelta
-from typing import Dict
 
 from pytoniq_core import Cell, begin_cell
+from src.blockchains.ton.clients.exceptions import TonGetMethodNotFoundError
 from src.blockchains.ton.clients.ton_client import TonClient
 from src.blockchains.ton.clients.utils import parse_address_from_cell_str
 from src.blockchains.ton.constants import TonConstants
@@ -18,15 +17,22 @@ from src.features.ton_common.schemas.ton_prepared_transaction import (
     TonPreparedMessage,
     TonPreparedTransaction,
 )
+from src.features.ton_dex.pool_pair_index import PoolPairIndex
 from src.utils.str_tools import bytes_to_b64str
 from src.utils.ton_address import TonAddress
 
 # === === === === === === ===
 
+LP_ACCOUNT_CODE_RETRY_SECONDS = 60
+
+# === === === === === === ===
+
 
 class TonDexRouterContract:
 
-    pool_addresses_cache: Dict[TonAddress, Dict[TonAddress, TonAddress]] = defaultdict(lambda: {})
+    lp_account_code: Cell | None = None
+    # Until then, a missing LP account code is not requested again.
+    lp_account_code_retry_at: float = 0.0
 
     # === === === === === === ===
 
@@ -538,17 +544,13 @@ class TonDexRouterContract:
         token_1_address: TonAddress,
     ) -> TonAddress | None:
 
-        # TODO: Add cache
-
         if token_0_address == TonConstants.ContractAddresses.TON:
             token_0_address = self.proxy_ton_address
 
         if token_1_address == TonConstants.ContractAddresses.TON:
             token_1_address = self.proxy_ton_address
 
-        pool_address = TonDexRouterContract.pool_addresses_cache[token_0_address].get(
-            token_1_address
-        )
+        pool_address = PoolPairIndex().get(token_0_address, token_1_address)
 
         if pool_address:
             return pool_address
@@ -576,10 +578,49 @@ class TonDexRouterContract:
         if not address:
             return None
 
-        TonDexRouterContract.pool_addresses_cache[token_0_address][token_1_address] = address
-        TonDexRouterContract.pool_addresses_cache[token_1_address][token_0_address] = address
+        PoolPairIndex().put(
+            pool_address=TonAddress(address),
+            token_0_minter_address=token_0_address,
+            token_1_minter_address=token_1_address,
+        )
 
         return TonAddress(address)
 
+    # === === === === === === ===
+
+    async def get_lp_account_code(
+        self,
+    ) -> Cell | None:
+        """Returns the LP account code from `get_router_data`. It's fetched once per process.
+
+        A missing code is remembered for `LP_ACCOUNT_CODE_RETRY_SECONDS`.
+        """
+
+        if TonDexRouterContract.lp_account_code:
+            return TonDexRouterContract.lp_account_code
+
+        if time.time() < TonDexRouterContract.lp_account_code_retry_at:
+            return None
+
+        try:
+            response = await self.ton_client.run_get_method(self.address, "get_router_data")
+        except TonGetMethodNotFoundError:
+            response = None
+
+        if (
+            not response
+            or not response.success
+            or len(response.stack) < 6
+            or not response.stack[5].cell
+        ):
+            TonDexRouterContract.lp_account_code_retry_at = (
+                time.time() + LP_ACCOUNT_CODE_RETRY_SECONDS
+            )
+            return None
+
+        TonDexRouterContract.lp_account_code = Cell.one_from_boc(response.stack[5].cell)
+
+        return TonDexRouterContract.lp_account_code
+
     # === === end Get Methods === === ===
     # ===================================
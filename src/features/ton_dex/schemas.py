@@ -1,7 +1,9 @@
 from enum import StrEnum
+from typing import List, Tuple
 
 from pydantic import BaseModel
 from src.types.ton.ton_address_annotated import TonAddressType
+from src.utils.ton_address import TonAddress
 
 # === === === === === === ===
 
@@ -35,6 +37,38 @@ class PoolData(BaseModel):
 # === === === === === === ===
 
 
+class PoolState(BaseModel):
+
+    pool_data: PoolData
+    token_0_minter_address: TonAddressType
+    token_1_minter_address: TonAddressType
+    total_supply: int | None = None
+    updated_at: float = 0
+
+    # === === === === === === ===
+
+    @property
+    def address(self) -> TonAddress:
+
+        return self.pool_data.address
+
+    # === === === === === === ===
+
+    def get_reserves(
+        self,
+        offer_minter_address: TonAddress,
+    ) -> Tuple[int, int]:
+        """Returns pool reserves as `(reserve_in, reserve_out)` for the offered token."""
+
+        if offer_minter_address == self.token_0_minter_address:
+            return (self.pool_data.reserve_0, self.pool_data.reserve_1)
+
+        return (self.pool_data.reserve_1, self.pool_data.reserve_0)
+
+
+# === === === === === === ===
+
+
 class ExpectedLiquidityData(BaseModel):
 
     token_0_amount: int
@@ -44,6 +78,20 @@ class ExpectedLiquidityData(BaseModel):
 # === === === === === === ===
 
 
+class TonSwapRouteStep(BaseModel):
+
+    pool_address: TonAddressType
+    offer_address: TonAddressType
+    ask_address: TonAddressType
+    offer_units: int
+    ask_units: int
+    fee_units: int
+    price_impact: float
+
+
+# === === === === === === ===
+
+
 class TonSwapParams(BaseModel):
 
     ask_address: TonAddressType
@@ -61,6 +109,30 @@ class TonSwapParams(BaseModel):
     swap_rate: float
     min_fee: int
     max_fee: int
+    # Set for multi-hop quotes only. They cannot be prepared as a single swap transaction.
+    route: List[TonSwapRouteStep] | None = None
+
+
+# === === === === === === ===
+
+
+class TonSwapCurvePoint(BaseModel):
+
+    offer_units: int
+    ask_units: int
+    fee_units: int
+    price_impact: float
+
+
+# === === === === === === ===
+
+
+class TonSwapCurve(BaseModel):
+
+    offer_address: TonAddressType
+    ask_address: TonAddressType
+    pool_address: TonAddressType
+    points: List[TonSwapCurvePoint]
 
 
 # === === === === === === ===
@@ -130,3 +202,168 @@ class TonCreateLiquidityPoolParams(TonBaseProvideLiquidityParams):
 
 
 # === === === === === === ===
+
+
+class TonDexEventType(StrEnum):
+
+    SWAP = "swap"
+    PROVIDE = "provide"
+    BURN = "burn"
+    REFUND = "refund"
+
+
+# === === === === === === ===
+
+
+class TonDexEventStatus(StrEnum):
+
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    # A request whose payout wasn't indexed within `SWAP_LEGS_WINDOW`.
+    EXPIRED = "expired"
+
+
+# === === === === === === ===
+
+
+class TonDexMessageLeg(BaseModel):
+    """A DEX message seen in a router transaction."""
+
+    pool_address: TonAddressType
+    query_id: int
+    lt: int
+    utime: int
+    transaction_hash: str
+
+
+# === === === === === === ===
+
+
+class TonDexSwapRequest(TonDexMessageLeg):
+    """`swap` sent by the router to a pool."""
+
+    to_address: TonAddressType
+    from_address: TonAddressType | None = None
+    referral_address: TonAddressType | None = None
+    offer_wallet_address: TonAddressType
+    offer_amount: int
+    min_out: int
+
+
+# === === === === === === ===
+
+
+class TonDexProvideRequest(TonDexMessageLeg):
+    """`provide_lp` sent by the router to a pool."""
+
+    owner_address: TonAddressType
+    min_lp_out: int
+    amount_0: int
+    amount_1: int
+
+
+# === === === === === === ===
+
+
+class TonDexPayTo(TonDexMessageLeg):
+    """`pay_to` sent by a pool to the router."""
+
+    owner_address: TonAddressType
+    exit_code: int
+    amount_0: int
+    wallet_0_address: TonAddressType | None = None
+    amount_1: int
+    wallet_1_address: TonAddressType | None = None
+
+
+# === === === === === === ===
+
+
+class TonDexEvent(BaseModel):
+
+    event_type: TonDexEventType
+    status: TonDexEventStatus
+    pool_address: TonAddressType
+    token_0_address: TonAddressType | None = None
+    token_1_address: TonAddressType | None = None
+    user_address: TonAddressType | None = None
+    recipient_address: TonAddressType | None = None
+    referral_address: TonAddressType | None = None
+    query_id: int
+    amount_0_in: int = 0
+    amount_1_in: int = 0
+    amount_0_out: int = 0
+    amount_1_out: int = 0
+    lt: int | None = None
+    completion_lt: int | None = None
+    utime: int
+
+
+# === === === === === === ===
+
+
+class TonDexCandleResolution(StrEnum):
+
+    MINUTE = "1m"
+    FIVE_MINUTES = "5m"
+    HOUR = "1h"
+    DAY = "1d"
+
+    @property
+    def seconds(self) -> int:
+
+        return {"1m": 60, "5m": 300, "1h": 3600, "1d": 86400}[self.value]
+
+
+# === === === === === === ===
+
+
+class TonDexCandle(BaseModel):
+    """OHLCV of a pool. Prices are in token 1 units per token 0 unit, without decimals."""
+
+    open_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume_0: int
+    volume_1: int
+    trades_count: int
+
+
+# === === === === === === ===
+
+
+class TonDexAssetPrice(BaseModel):
+    """Price of one whole token. `liquidity_*` is the value of the shallowest pool on the
+    pricing path, in whole TON / USD, and `None` for the anchors themselves."""
+
+    address: TonAddressType
+    price_ton: float | None = None
+    price_usd: float | None = None
+    liquidity_ton: float | None = None
+    liquidity_usd: float | None = None
+
+
+# === === === === === === ===
+
+
+class TonDexPoolSummary(BaseModel):
+    """Pool with its precomputed stats. TON values are in nanotons, `fee_apr` is a fraction."""
+
+    address: TonAddressType
+    token_0_address: TonAddressType
+    token_1_address: TonAddressType
+    reserve_0: int
+    reserve_1: int
+    total_supply: int
+    lp_fee: int
+    tvl_ton: int | None = None
+    volume_24h_0: int = 0
+    volume_24h_1: int = 0
+    volume_24h_ton: int | None = None
+    fee_apr: float | None = None
+
+
+# === === === === === === ===
@@ -1,7 +1,11 @@
 from .jetton_staking_contract import JettonStakingContract
 from .staking_manager import TonStakingManager
+from .staking_observer import StakingObserver
+from .staking_state_store import StakingStateStore
 
 __all__ = [
     "JettonStakingContract",
     "TonStakingManager",
+    "StakingObserver",
+    "StakingStateStore",
 ]
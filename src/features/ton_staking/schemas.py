@@ -34,3 +34,38 @@ class TonStakingPreparedTransactionData(BaseModel):
 
     transaction: TonPreparedTransaction
     expected_amount: int
+
+
+class TonStakingState(BaseModel):
+    """Cached stake data of a staking contract.
+
+    `get_jetton_amount` is linear in the offer, so a quote of the reference
+    offer amount prices any offer up to rounding.
+    """
+
+    address: TonAddressType
+    price: int
+    is_active: bool
+    reference_offer_amount: int
+    reference_jetton_amount: int
+    updated_at: float
+
+    # === === === === === === ===
+
+    def get_jetton_amount(
+        self,
+        offer_amount: int,
+    ) -> int:
+
+        return offer_amount * self.reference_jetton_amount // self.reference_offer_amount
+
+    # === === === === === === ===
+
+    def to_stake_data(self) -> TonContractStakeData:
+
+        return TonContractStakeData(
+            address=self.address, price=self.price, is_active=self.is_active
+        )
+
+
+# === === === === === === ===
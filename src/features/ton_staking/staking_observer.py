@@ -1,3 +1,146 @@
+# === === === === === === ===
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.blockchains.ton.clients.ton_client import TonClient
+from src.config.config import Config
+from src.database.database_models.ton.ton_staking_contract import TonStakingContractDb
+from src.database.database_models.ton.ton_staking_state import TonStakingStateDb
+from src.database.repositories.ton.ton_staking_contract_repo import TonStakingContractRepository
+from src.database.repositories.ton.ton_staking_state_repository import TonStakingStateRepository
+from src.features.ton_common.schemas.ton_asset import TonAsset
+from src.utils.logging.logging import create_custom_logger
+from src.utils.ton_address import TonAddress
+
+from .jetton_staking_contract import JettonStakingContract
+from .schemas import TonStakingState
+from .staking_state_store import StakingStateStore
+
+# === === === === === === ===
+
+logger = create_custom_logger("StakingObserver")
+
+# Large enough for `get_jetton_amount` rounding to be negligible when scaled down.
+REFERENCE_OFFER_AMOUNT = 10**18
+
+# Older states are not served, the contracts are queried remotely instead.
+STAKING_STATE_MAX_AGE_SECONDS = 5 * 60
+
+# === === === === === === ===
+
+
 class StakingObserver:
+    """Refreshes the stake data of all staking contracts into `StakingStateStore`.
+
+    Each refresh also stores the contract's quote for `REFERENCE_OFFER_AMOUNT`,
+    from which the expected output of any offer is computed locally. States
+    are saved to `ton_staking_state` for the processes that don't refresh them.
+    """
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        config: Config,
+        ton_client: TonClient,
+        session: AsyncSession,
+    ) -> None:
+
+        self.config = config
+        self.ton_client = ton_client
+        self.session = session
+
+    # === === === === === === ===
+
+    async def update_contracts(self) -> None:
+
+        staking_contract_repo = TonStakingContractRepository(session=self.session)
+        contracts_db = [
+            contract_db
+            for contract_db in await staking_contract_repo.get_all(limit=1000)
+            if not contract_db.is_deleted
+        ]
+
+        states = [
+            state
+            for state in await asyncio.gather(
+                *[self.fetch_state(contract_db) for contract_db in contracts_db]
+            )
+            if state is not None
+        ]
+
+        staking_state_store = StakingStateStore()
+        for state in states:
+            staking_state_store.put(state)
+
+        await TonStakingStateRepository(session=self.session).upsert_many(
+            states=[
+                TonStakingStateDb(
+                    contract_address=state.address.to_string(),
+                    price=state.price,
+                    is_active=state.is_active,
+                    reference_offer_amount=state.reference_offer_amount,
+                    reference_jetton_amount=state.reference_jetton_amount,
+                    updated_at=datetime.fromtimestamp(state.updated_at, UTC),
+                )
+                for state in states
+            ]
+        )
+        await self.session.commit()
+
+        logger.info("Updated %d of %d staking contracts", len(states), len(contracts_db))
+
+    # === === === === === === ===
+
+    async def fetch_state(
+        self,
+        contract_db: TonStakingContractDb,
+    ) -> TonStakingState | None:
+
+        contract = JettonStakingContract(
+            address=TonAddress(contract_db.address),
+            in_asset=TonAsset.from_db_model(contract_db.in_asset),
+            out_asset=TonAsset.from_db_model(contract_db.out_asset),
+            apy=contract_db.apy,
+            ton_client=self.ton_client,
+            config=self.config,
+        )
+
+        try:
+            stake_data, reference_jetton_amount = await asyncio.gather(
+                contract.get_stake_data(),
+                contract.get_jetton_amount(offer_amount=REFERENCE_OFFER_AMOUNT),
+            )
+        except Exception as e:
+            logger.warning("Stake data not found: %s. Error: %s", contract_db.address, e)
+            return None
+
+        if reference_jetton_amount is None:
+            logger.warning("Jetton amount not found: %s", contract_db.address)
+            return None
+
+        return TonStakingState(
+            address=contract.address,
+            price=stake_data.price,
+            is_active=stake_data.is_active,
+            reference_offer_amount=REFERENCE_OFFER_AMOUNT,
+            reference_jetton_amount=reference_jetton_amount,
+            updated_at=time.time(),
+        )
+
+    # === === === === === === ===
+
+    async def follow_leader(self) -> None:
+        """Loads the states saved by the leader, in processes that don't refresh them."""
+
+        states_db: List[TonStakingStateDb] = await TonStakingStateRepository(
+            session=self.session
+        ).get_all()
+        StakingStateStore().load(states_db)
+
 
-    pass
+# === === === === === === ===
@@ -0,0 +1,73 @@
+# === === === === === === ===
+
+import time
+from typing import Dict, Iterable
+
+from src.database.database_models.ton.ton_staking_state import TonStakingStateDb
+from src.utils.singleton import SingletonMeta
+from src.utils.ton_address import TonAddress
+
+from .schemas import TonStakingState
+
+# === === === === === === ===
+
+
+class StakingStateStore(metaclass=SingletonMeta):
+    """In-process store of the latest stake data of every staking contract.
+
+    Fed by `StakingObserver` in the leader process and by `ton_staking_state`
+    rows in the other processes.
+    """
+
+    # === === === === === === ===
+
+    def __init__(self) -> None:
+
+        self._states: Dict[TonAddress, TonStakingState] = {}
+
+    # === === === === === === ===
+
+    def get(
+        self,
+        address: TonAddress,
+        max_age_seconds: float | None = None,
+    ) -> TonStakingState | None:
+        """Returns the state, or None if it's unknown or older than `max_age_seconds`."""
+
+        state = self._states.get(address)
+        if state is None:
+            return None
+        if max_age_seconds is not None and time.time() - state.updated_at > max_age_seconds:
+            return None
+
+        return state
+
+    # === === === === === === ===
+
+    def put(
+        self,
+        state: TonStakingState,
+    ) -> None:
+
+        self._states[state.address] = state
+
+    # === === === === === === ===
+
+    def load(
+        self,
+        states_db: Iterable[TonStakingStateDb],
+    ) -> None:
+
+        for state_db in states_db:
+            self.put(
+                TonStakingState(
+                    address=TonAddress(state_db.contract_address),
+                    price=state_db.price,
+                    is_active=state_db.is_active,
+                    reference_offer_amount=state_db.reference_offer_amount,
+                    reference_jetton_amount=state_db.reference_jetton_amount,
+                    updated_at=state_db.updated_at.timestamp(),
+                )
+            )
+
+    # === === === === === === ===
@@ -0,0 +1,5 @@
+from .indexer import run_indexer
+
+__all__ = [
+    "run_indexer",
+]
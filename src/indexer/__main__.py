@@ -0,0 +1,7 @@
+import asyncio
+
+from src.indexer import run_indexer
+
+# === === === === === === ===
+
+asyncio.run(run_indexer())
@@ -0,0 +1,59 @@
+# === === === === === === ===
+
+from fastapi import FastAPI, Response
+from src.database.leader_election import LeaderElection
+from src.server.background_tasks.scheduler import BackgroundScheduler
+
+from .schemas import IndexerHealth, JobHealth
+
+# === === === === === === ===
+
+
+def create_health_app(
+    scheduler: BackgroundScheduler,
+) -> FastAPI:
+    """Serves `GET /health`, answering 503 when a job stopped completing."""
+
+    app = FastAPI(title="Terminus-Dex Indexer")
+
+    async def get_health(response: Response) -> IndexerHealth:
+
+        jobs = [
+            JobHealth(
+                name=status.name,
+                interval=status.interval,
+                leader_only=status.leader_only,
+                is_healthy=scheduler.is_healthy(status),
+                is_running=status.is_running,
+                runs_count=status.runs_count,
+                failures_count=status.failures_count,
+                last_started_at=status.last_started_at,
+                last_ok_at=status.last_ok_at,
+                last_error=status.last_error,
+            )
+            for status in scheduler.jobs.values()
+        ]
+        is_healthy = all(job.is_healthy for job in jobs)
+        if not is_healthy:
+            response.status_code = 503
+
+        leader_election = LeaderElection()
+
+        return IndexerHealth(
+            is_healthy=is_healthy,
+            identity=leader_election.identity,
+            is_leader=leader_election.is_leader,
+            jobs=jobs,
+        )
+
+    app.add_api_route(
+        path="/health",
+        endpoint=get_health,
+        methods=["GET"],
+        response_model=IndexerHealth,
+    )
+
+    return app
+
+
+# === === === === === === ===
@@ -0,0 +1,60 @@
+# === === === === === === ===
+
+import uvicorn
+from src.blockchains.ton.clients.client_manager import TonClientManager
+from src.config import ConfigManager
+from src.database.database import DatabaseSessionManager
+from src.database.leader_election import LeaderElection
+from src.server.background_tasks.background_scheduler import create_background_scheduler
+from src.server.init_tasks.load_pool_states import load_pool_states
+from src.utils.logging import init_logger
+
+from .health import create_health_app
+
+# === === === === === === ===
+
+
+async def run_indexer() -> None:
+    """Runs the indexers as a standalone process, serving their health over HTTP.
+
+    Several indexer processes may run; the leader election picks the one
+    that writes. Runs until the health server is stopped by a signal.
+    """
+
+    init_logger()
+
+    config = ConfigManager().get_config()
+    ton_client = TonClientManager(config=config).get_ton_client()
+    database_session_manager = DatabaseSessionManager(config=config)
+    sessionmaker = database_session_manager.sessionmaker
+
+    leader_election = LeaderElection(engine=database_session_manager.engine)
+
+    await load_pool_states(sessionmaker=sessionmaker)
+    await leader_election.campaign()
+
+    background_scheduler = create_background_scheduler(
+        config=config,
+        sessionmaker=sessionmaker,
+        ton_client=ton_client,
+        run_indexers=True,
+    )
+    background_scheduler.start()
+
+    health_server = uvicorn.Server(
+        uvicorn.Config(
+            create_health_app(background_scheduler),
+            host=config.indexer.health_host,
+            port=config.indexer.health_port,
+            log_level="warning",
+        )
+    )
+
+    try:
+        await health_server.serve()
+    finally:
+        await background_scheduler.stop()
+        await leader_election.resign()
+
+
+# === === === === === === ===
@@ -0,0 +1,33 @@
+from typing import List
+
+from pydantic import BaseModel
+
+# === === === === === === ===
+
+
+class JobHealth(BaseModel):
+
+    name: str
+    interval: int
+    leader_only: bool
+    is_healthy: bool
+    is_running: bool
+    runs_count: int
+    failures_count: int
+    last_started_at: float | None = None
+    last_ok_at: float | None = None
+    last_error: str | None = None
+
+
+# === === === === === === ===
+
+
+class IndexerHealth(BaseModel):
+
+    is_healthy: bool
+    identity: str
+    is_leader: bool
+    jobs: List[JobHealth]
+
+
+# === === === === === === ===
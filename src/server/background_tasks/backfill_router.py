@@ -0,0 +1,23 @@
+# === === === === === === ===
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.blockchains.ton.clients import TonClient
+from src.config import Config
+from src.features.ton_dex.router_backfill import RouterBackfill
+
+# === === === === === === ===
+
+
+async def backfill_router(
+    sessionmaker: async_sessionmaker,
+    config: Config,
+    ton_client: TonClient,
+):
+
+    router_backfill = RouterBackfill(config=config, ton_client=ton_client)
+    await router_backfill.run(
+        sessionmaker=sessionmaker, run_seconds=config.indexer.backfill_router_run_seconds
+    )
+
+
+# === === === === === === ===
@@ -0,0 +1,86 @@
+# === === === === === === ===
+
+from functools import partial
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.blockchains.ton.clients import TonClient
+from src.config import Config
+from src.database.leader_election import LeaderElection
+
+from .backfill_router import backfill_router
+from .downsample_pool_snapshots import downsample_pool_snapshots
+from .scheduler import BackgroundScheduler
+from .sync_jetton_catalog import sync_jetton_catalog
+from .update_pools import update_pools
+from .update_staking import update_staking
+
+# === === === === === === ===
+
+
+def create_background_scheduler(
+    config: Config,
+    sessionmaker: async_sessionmaker,
+    ton_client: TonClient,
+    run_indexers: bool,
+) -> BackgroundScheduler:
+    """Creates the background jobs of a process.
+
+    Without `run_indexers` the process never campaigns for leadership, so it
+    only follows the pool states saved by the indexer process.
+    """
+
+    indexer_config = config.indexer
+    scheduler = BackgroundScheduler(
+        leader_poll_interval=indexer_config.elect_leader_interval_seconds
+    )
+
+    if run_indexers:
+        scheduler.add_job(
+            name="elect_leader",
+            interval=indexer_config.elect_leader_interval_seconds,
+            function=LeaderElection().campaign,
+        )
+
+    scheduler.add_job(
+        name="update_pools",
+        interval=indexer_config.update_pools_interval_seconds,
+        function=partial(
+            update_pools, sessionmaker=sessionmaker, config=config, ton_client=ton_client
+        ),
+    )
+
+    scheduler.add_job(
+        name="update_staking",
+        interval=indexer_config.update_staking_interval_seconds,
+        function=partial(
+            update_staking, sessionmaker=sessionmaker, config=config, ton_client=ton_client
+        ),
+    )
+
+    if run_indexers:
+        scheduler.add_job(
+            name="sync_jetton_catalog",
+            interval=indexer_config.sync_jetton_catalog_interval_seconds,
+            function=partial(sync_jetton_catalog, sessionmaker=sessionmaker, ton_client=ton_client),
+            leader_only=True,
+        )
+        scheduler.add_job(
+            name="backfill_router",
+            interval=indexer_config.backfill_router_interval_seconds,
+            function=partial(
+                backfill_router, sessionmaker=sessionmaker, config=config, ton_client=ton_client
+            ),
+            leader_only=True,
+            max_run_seconds=indexer_config.backfill_router_run_seconds,
+        )
+        scheduler.add_job(
+            name="downsample_pool_snapshots",
+            interval=indexer_config.downsample_pool_snapshots_interval_seconds,
+            function=partial(downsample_pool_snapshots, sessionmaker=sessionmaker),
+            leader_only=True,
+        )
+
+    return scheduler
+
+
+# === === === === === === ===
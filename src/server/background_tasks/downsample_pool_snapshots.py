@@ -0,0 +1,38 @@
+# === === === === === === ===
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.database.repositories.ton.ton_dex_pool_snapshot_repository import (
+    TonDexPoolSnapshotRepository,
+)
+from src.utils.logging.logging import create_custom_logger
+
+# === === === === === === ===
+
+logger = create_custom_logger("DownsamplePoolSnapshots")
+
+# Snapshots are kept per observer cycle, then hourly, then daily.
+RAW_RETENTION = timedelta(days=2)
+HOURLY_RETENTION = timedelta(days=30)
+
+# === === === === === === ===
+
+
+async def downsample_pool_snapshots(
+    sessionmaker: async_sessionmaker,
+):
+
+    async with sessionmaker() as session:
+
+        now = datetime.now(UTC)
+        snapshot_repo = TonDexPoolSnapshotRepository(session=session)
+
+        deleted_count = await snapshot_repo.downsample(bucket="hour", before=now - RAW_RETENTION)
+        deleted_count += await snapshot_repo.downsample(bucket="day", before=now - HOURLY_RETENTION)
+        await session.commit()
+
+        logger.info("Downsampled pool snapshots, %d deleted", deleted_count)
+
+
+# === === === === === === ===
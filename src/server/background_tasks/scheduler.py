@@ -0,0 +1,163 @@
+# === === === === === === ===
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from src.blockchains.ton.clients.request_scheduler import RequestPriority, request_priority
+from src.database.leader_election import LeaderElection
+from src.utils.logging.logging import create_custom_logger
+
+# === === === === === === ===
+
+logger = create_custom_logger("BackgroundScheduler")
+
+# A job is unhealthy once it hasn't completed for this many intervals.
+UNHEALTHY_AFTER_INTERVALS = 3
+
+# === === === === === === ===
+
+
+class JobStatus:
+
+    def __init__(
+        self,
+        name: str,
+        interval: int,
+        leader_only: bool,
+        max_run_seconds: int,
+    ) -> None:
+
+        self.name = name
+        self.interval = interval
+        self.leader_only = leader_only
+        self.max_run_seconds = max_run_seconds
+
+        self.runs_count = 0
+        self.failures_count = 0
+        self.is_running = False
+        self.last_started_at: float | None = None
+        # Last successful run, or last leadership check of a leader-only job by a follower.
+        self.last_ok_at: float | None = None
+        self.last_error: str | None = None
+
+
+# === === === === === === ===
+
+
+class BackgroundScheduler:
+    """Runs periodic jobs, each in its own task at background request priority.
+
+    A job runs right away, then `interval` seconds after each run ends, so
+    runs of the same job never overlap. Failures are logged and retried on
+    the next interval. While another process holds the `LeaderElection` lock,
+    leader-only jobs check it every `leader_poll_interval` seconds, so they run
+    as soon as this process takes over.
+    """
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        leader_poll_interval: int,
+    ) -> None:
+
+        self.leader_poll_interval = leader_poll_interval
+
+        self.jobs: Dict[str, JobStatus] = {}
+        self.started_at: float | None = None
+
+        self._functions: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._tasks: List[asyncio.Task[None]] = []
+
+    # === === === === === === ===
+
+    def add_job(
+        self,
+        name: str,
+        interval: int,
+        function: Callable[[], Awaitable[Any]],
+        leader_only: bool = False,
+        max_run_seconds: int = 0,
+    ) -> None:
+        """Adds a job. `max_run_seconds` is how long a run may take on purpose, for health."""
+
+        self.jobs[name] = JobStatus(
+            name=name,
+            interval=interval,
+            leader_only=leader_only,
+            max_run_seconds=max_run_seconds,
+        )
+        self._functions[name] = function
+
+    # === === === === === === ===
+
+    def start(self) -> None:
+
+        self.started_at = time.time()
+        self._tasks = [
+            asyncio.create_task(self._run_job(status, self._functions[name]))
+            for name, status in self.jobs.items()
+        ]
+
+    # === === === === === === ===
+
+    async def stop(self) -> None:
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    # === === === === === === ===
+
+    def is_healthy(
+        self,
+        status: JobStatus,
+    ) -> bool:
+
+        last_ok_at = status.last_ok_at or self.started_at
+        if last_ok_at is None:
+            return False
+
+        return (
+            time.time() - last_ok_at
+            <= status.interval * UNHEALTHY_AFTER_INTERVALS + status.max_run_seconds
+        )
+
+    # === === === === === === ===
+
+    async def _run_job(
+        self,
+        status: JobStatus,
+        function: Callable[[], Awaitable[Any]],
+    ) -> None:
+
+        request_priority.set(RequestPriority.BACKGROUND)
+
+        while True:
+            if status.leader_only and not LeaderElection().is_leader:
+                status.last_ok_at = time.time()
+                await asyncio.sleep(min(status.interval, self.leader_poll_interval))
+                continue
+
+            try:
+                status.is_running = True
+                status.runs_count += 1
+                status.last_started_at = time.time()
+
+                await function()
+
+                status.last_ok_at = time.time()
+                status.last_error = None
+            except Exception as e:
+                status.failures_count += 1
+                status.last_error = repr(e)
+                logger.exception("Background job %s failed: %s", status.name, e)
+            finally:
+                status.is_running = False
+
+            await asyncio.sleep(status.interval)
+
+
+# === === === === === === ===
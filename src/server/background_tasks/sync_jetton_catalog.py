@@ -0,0 +1,21 @@
+# === === === === === === ===
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.blockchains.ton.clients import TonClient
+from src.features.ton_dex.jetton_catalog_sync import JettonCatalogSync
+
+# === === === === === === ===
+
+
+async def sync_jetton_catalog(
+    sessionmaker: async_sessionmaker,
+    ton_client: TonClient,
+):
+
+    async with sessionmaker() as session:
+
+        jetton_catalog_sync = JettonCatalogSync(ton_client=ton_client, session=session)
+        await jetton_catalog_sync.sync()
+
+
+# === === === === === === ===
@@ -1,32 +1,27 @@
 # === === === === === === ===
 
-import asyncio
-
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from src.blockchains.ton.clients import TonClient
 from src.config import Config
+from src.database.leader_election import LeaderElection
 from src.features.ton_dex.dex_observer import DexObserver
 
 # === === === === === === ===
 
 
-async def update_pools_interval(
-    interval: int,
+async def update_pools(
     sessionmaker: async_sessionmaker,
     config: Config,
     ton_client: TonClient,
 ):
 
-    while True:
-        try:
-            async with sessionmaker() as session:
+    async with sessionmaker() as session:
 
-                dex_observer = DexObserver(config=config, ton_client=ton_client, session=session)
-                await dex_observer.update_pools()
-        except Exception:
-            pass
-        finally:
-            await asyncio.sleep(interval)
+        dex_observer = DexObserver(config=config, ton_client=ton_client, session=session)
+        if LeaderElection().is_leader:
+            await dex_observer.update_pools()
+        else:
+            await dex_observer.follow_leader()
 
 
 # === === === === === === ===
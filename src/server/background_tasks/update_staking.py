@@ -0,0 +1,27 @@
+# === === === === === === ===
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.blockchains.ton.clients import TonClient
+from src.config import Config
+from src.database.leader_election import LeaderElection
+from src.features.ton_staking.staking_observer import StakingObserver
+
+# === === === === === === ===
+
+
+async def update_staking(
+    sessionmaker: async_sessionmaker,
+    config: Config,
+    ton_client: TonClient,
+):
+
+    async with sessionmaker() as session:
+
+        staking_observer = StakingObserver(config=config, ton_client=ton_client, session=session)
+        if LeaderElection().is_leader:
+            await staking_observer.update_contracts()
+        else:
+            await staking_observer.follow_leader()
+
+
+# === === === === === === ===
@@ -0,0 +1,34 @@
+# === === === === === === ===
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.database.repositories.ton.ton_dex_pool_refresh_repository import (
+    TonDexPoolRefreshRepository,
+)
+from src.database.repositories.ton.ton_dex_pool_repository import TonDexPoolRepository
+from src.features.ton_dex.pool_graph import PoolGraph
+from src.features.ton_dex.pool_pair_index import PoolPairIndex
+from src.features.ton_dex.pool_state_store import PoolStateStore
+
+# === === === === === === ===
+
+
+async def load_pool_states(
+    sessionmaker: async_sessionmaker,
+) -> None:
+
+    async with sessionmaker() as session:
+        pool_repo = TonDexPoolRepository(session=session)
+
+        pools_db = await pool_repo.get_all()
+        queued_pool_addresses = await TonDexPoolRefreshRepository(
+            session=session
+        ).get_pool_addresses()
+
+    PoolPairIndex().load(pools_db)
+    PoolStateStore().load(pools_db)
+    # Queued pools keep reserves from before their failed refresh, they aren't current.
+    PoolStateStore().invalidate_many(queued_pool_addresses)
+    PoolGraph().rebuild(pools_db)
+
+
+# === === === === === === ===
@@ -9,11 +9,13 @@ from src.api.v1.controller import api_v1_router
 from src.blockchains.ton.clients.client_manager import TonClientManager
 from src.config import ConfigManager
 from src.database.database import DatabaseSessionManager
+from src.database.leader_election import LeaderElection
 from src.server.middlewares import auth_middleware
 from src.utils.logging import init_logger
 
-from .background_tasks.update_pools import update_pools_interval
+from .background_tasks.background_scheduler import create_background_scheduler
 from .init_tasks.add_default_assets import add_default_assets
+from .init_tasks.load_pool_states import load_pool_states
 
 # === === === === === === ===
 
@@ -25,27 +27,36 @@ async def lifespan(app: FastAPI):
 
     config = ConfigManager().get_config()
     ton_client = TonClientManager(config=config).get_ton_client()
-    sessionmaker = DatabaseSessionManager(config=config).sessionmaker
+    database_session_manager = DatabaseSessionManager(config=config)
+    sessionmaker = database_session_manager.sessionmaker
+
+    # Only the leader among the processes runs the indexers.
+    leader_election = LeaderElection(engine=database_session_manager.engine)
+    if config.indexer.run_in_api:
+        await leader_election.campaign()
 
     # === === === === === === ===
 
     loop = asyncio.get_event_loop()
 
     loop.create_task(add_default_assets(sessionmaker=sessionmaker))
+    loop.create_task(load_pool_states(sessionmaker=sessionmaker))
 
-    loop.create_task(
-        update_pools_interval(
-            interval=5 * 60,
-            sessionmaker=sessionmaker,
-            config=config,
-            ton_client=ton_client,
-        )
+    background_scheduler = create_background_scheduler(
+        config=config,
+        sessionmaker=sessionmaker,
+        ton_client=ton_client,
+        run_indexers=config.indexer.run_in_api,
     )
+    background_scheduler.start()
 
     # === === === === === === ===
 
     yield
 
+    await background_scheduler.stop()
+    await leader_election.resign()
+
 
 # === === === === === === ===
 
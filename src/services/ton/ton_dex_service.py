@@ -1,5 +1,7 @@
 # === === === === === === ===
 
+import time
+from datetime import UTC, datetime
 from typing import List, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,7 +9,9 @@ from src.blockchains.ton.clients.ton_client import TonClient
 from src.blockchains.ton.constants import TonConstants
 from src.config.config import Config
 from src.database.repositories.ton.ton_asset_repository import TonAssetRepository
+from src.database.repositories.ton.ton_dex_candle_repository import TonDexCandleRepository
 from src.database.repositories.ton.ton_dex_pool_repository import TonDexPoolRepository
+from src.database.repositories.ton.ton_dex_pool_stats_repository import TonDexPoolStatsRepository
 from src.exceptions.ton_dex_exceptions import (
     LpAccountAddressNotFoundError,
     LpWalletAddressNotFoundError,
@@ -18,12 +22,21 @@ from src.features.ton_common.schemas.ton_prepared_transaction import (
     TonPreparedMessage,
     TonPreparedTransaction,
 )
+from src.features.ton_dex.asset_pairs import AssetPairsPayload
 from src.features.ton_dex.lp_account_contract import LpAccountContract
 from src.features.ton_dex.lp_wallet_contract import LpWalletContract
 from src.features.ton_dex.params_manager import DexParamsManager, SwapType
 from src.features.ton_dex.pool_contract import PoolContract
+from src.features.ton_dex.price_oracle import AssetPriceOracle
 from src.features.ton_dex.router_contract import TonDexRouterContract
-from src.features.ton_dex.schemas import TonBaseProvideLiquidityParams, TonSwapParams
+from src.features.ton_dex.schemas import (
+    TonBaseProvideLiquidityParams,
+    TonDexAssetPrice,
+    TonDexCandle,
+    TonDexCandleResolution,
+    TonDexPoolSummary,
+    TonSwapParams,
+)
 from src.utils.ton_address import TonAddress
 
 # === === === === === === ===
@@ -74,6 +87,19 @@ class TonDexService:
 
     # === === === === === === ===
 
+    async def get_assets_pairs_payload(
+        self,
+    ) -> bytes:
+        """Returns the serialized asset pairs, from the database until the pool graph is built."""
+
+        payload = AssetPairsPayload().get(proxy_ton_address=self.config.ton_dex.proxy_ton_address)
+        if payload is None:
+            payload = AssetPairsPayload.serialize(await self.get_assets_pairs())
+
+        return payload
+
+    # === === === === === === ===
+
     async def get_assets_pairs(
         self,
     ) -> List[Tuple[str, str]]:
@@ -95,6 +121,86 @@ class TonDexService:
 
     # === === === === === === ===
 
+    def get_asset_prices(
+        self,
+    ) -> List[TonDexAssetPrice]:
+
+        return [
+            price.model_copy(update={"address": self.swap_proxy_to_ton_address(price.address)})
+            for price in AssetPriceOracle().get_all()
+        ]
+
+    # === === === === === === ===
+
+    async def get_pools(
+        self,
+    ) -> List[TonDexPoolSummary]:
+
+        stats_repo = TonDexPoolStatsRepository(session=self.session)
+        pools_with_stats = await stats_repo.get_pools_with_stats()
+
+        return [
+            TonDexPoolSummary(
+                address=TonAddress(pool.address),
+                token_0_address=self.swap_proxy_to_ton_address(
+                    TonAddress(pool.token_0_minter_address)
+                ),
+                token_1_address=self.swap_proxy_to_ton_address(
+                    TonAddress(pool.token_1_minter_address)
+                ),
+                reserve_0=pool.reserve_0,
+                reserve_1=pool.reserve_1,
+                total_supply=pool.total_supply,
+                lp_fee=pool.lp_fee,
+                tvl_ton=stats.tvl_ton if stats else None,
+                volume_24h_0=stats.volume_24h_0 if stats else 0,
+                volume_24h_1=stats.volume_24h_1 if stats else 0,
+                volume_24h_ton=stats.volume_24h_ton if stats else None,
+                fee_apr=stats.fee_apr if stats else None,
+            )
+            for pool, stats in pools_with_stats
+        ]
+
+    # === === === === === === ===
+
+    async def get_pool_candles(
+        self,
+        pool_address: TonAddress,
+        resolution: TonDexCandleResolution,
+        start: int | None = None,
+        end: int | None = None,
+        limit: int = 500,
+    ) -> List[TonDexCandle]:
+        """Returns the candles opened in [start, end), the latest `limit` ones by default."""
+
+        end = end if end is not None else int(time.time()) + resolution.seconds
+        start = start if start is not None else end - limit * resolution.seconds
+
+        candle_repo = TonDexCandleRepository(session=self.session)
+        candles_db = await candle_repo.get_range(
+            pool_address=pool_address,
+            resolution=resolution.value,
+            start=datetime.fromtimestamp(start, UTC),
+            end=datetime.fromtimestamp(end, UTC),
+            limit=limit,
+        )
+
+        return [
+            TonDexCandle(
+                open_time=int(candle.open_time.timestamp()),
+                open=candle.open,
+                high=candle.high,
+                low=candle.low,
+                close=candle.close,
+                volume_0=candle.volume_0,
+                volume_1=candle.volume_1,
+                trades_count=candle.trades_count,
+            )
+            for candle in candles_db
+        ]
+
+    # === === === === === === ===
+
     async def find_asset(
         self,
         address: TonAddress,
@@ -316,7 +422,8 @@ class TonDexService:
 
         pool_contract = PoolContract(address=pool_address, ton_client=self.ton_client)
         lp_account_address = await pool_contract.get_lp_account_address(
-            owner_address=account_address
+            owner_address=account_address,
+            lp_account_code=await router.get_lp_account_code(),
         )
 
         if not lp_account_address:
@@ -358,7 +465,8 @@ class TonDexService:
 
         pool_contract = PoolContract(address=pool_address, ton_client=self.ton_client)
         lp_account_address = await pool_contract.get_lp_account_address(
-            owner_address=account_address
+            owner_address=account_address,
+            lp_account_code=await router.get_lp_account_code(),
         )
 
         if not lp_account_address:
@@ -11,6 +11,8 @@ from src.features.ton_staking.schemas import (
     TonStakingPreparedTransactionData,
 )
 from src.features.ton_staking.staking_manager import TonStakingManager
+from src.features.ton_staking.staking_observer import STAKING_STATE_MAX_AGE_SECONDS
+from src.features.ton_staking.staking_state_store import StakingStateStore
 from src.utils.ton_address import TonAddress
 
 
@@ -69,9 +71,10 @@ class TonStakingService:
     ) -> TonContractStakeData:
         """Retrieves stake data from the staking contract.
 
-        This function fetches stake data from the staking contract specified by
-        the `contract_address`. It returns a `TonContractStakeData` object
-        containing the stake data.
+        This function serves the stake data refreshed by `StakingObserver`, and
+        only fetches it from the staking contract specified by the
+        `contract_address` when it's missing or outdated. It returns a
+        `TonContractStakeData` object containing the stake data.
 
         Args:
             contract_address (TonAddress): The address of the staking contract
@@ -90,6 +93,12 @@ class TonStakingService:
                 stack size is not 2 or if the stack data is not valid.
         """
 
+        state = StakingStateStore().get(
+            address=contract_address, max_age_seconds=STAKING_STATE_MAX_AGE_SECONDS
+        )
+        if state is not None:
+            return state.to_stake_data()
+
         staking_manager = TonStakingManager(
             session=self.session, config=self.config, ton_client=self.ton_client
         )
@@ -109,7 +118,8 @@ class TonStakingService:
 
         This function creates a transfer message to the staking contract with the
         specified `offer_amount` and returns a `TonPreparedTransaction` containing
-        the prepared transfer message.
+        the prepared transfer message. The expected amount is computed from the
+        stake data cached by `StakingObserver` when it's fresh.
 
         Args:
             offer_amount (int): The amount of tokens to stake.
@@ -130,7 +140,13 @@ class TonStakingService:
         )
         contract = await staking_manager.get_contract(address=contract_address)
 
-        expected_amount = await contract.get_jetton_amount(offer_amount=offer_amount)
+        state = StakingStateStore().get(
+            address=contract_address, max_age_seconds=STAKING_STATE_MAX_AGE_SECONDS
+        )
+        if state is not None:
+            expected_amount = state.get_jetton_amount(offer_amount=offer_amount)
+        else:
+            expected_amount = await contract.get_jetton_amount(offer_amount=offer_amount)
         prepared_stake_transaction = await contract.get_prepared_stake_transaction(
             offer_amount=offer_amount
         )
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+# === === === === === === ===
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# === === === === === === ===
+
+
+class LruCache(Generic[K, V]):
+    """Size-bounded mapping that evicts the least recently used entries."""
+
+    # === === === === === === ===
+
+    def __init__(
+        self,
+        max_size: int,
+    ) -> None:
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict[K, V] = OrderedDict()
+
+    # === === === === === === ===
+
+    def __len__(self) -> int:
+
+        return len(self._items)
+
+    # === === === === === === ===
+
+    def get(
+        self,
+        key: K,
+    ) -> V | None:
+
+        value = self._items.get(key)
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._items.move_to_end(key)
+
+        return value
+
+    # === === === === === === ===
+
+    def put(
+        self,
+        key: K,
+        value: V,
+    ) -> None:
+
+        self._items[key] = value
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+
+# === === === === === === ===
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+# === === === === === === ===
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+# === === === === === === ===
+
+
+class SingleFlight(Generic[K, T]):
+    """Coalesces concurrent calls with the same key into one in-flight call.
+
+    Every caller gets the result or the exception of the shared call. The call
+    runs in its own task, so a cancelled caller doesn't cancel it for the others.
+    """
+
+    # === === === === === === ===
+
+    def __init__(self) -> None:
+
+        self.calls_count = 0
+        self.deduplicated_count = 0
+        self._tasks: Dict[K, asyncio.Task[T]] = {}
+
+    # === === === === === === ===
+
+    @property
+    def in_flight_count(self) -> int:
+
+        return len(self._tasks)
+
+    # === === === === === === ===
+
+    async def run(
+        self,
+        key: K,
+        function: Callable[[], Awaitable[T]],
+    ) -> T:
+
+        self.calls_count += 1
+
+        task = self._tasks.get(key)
+
+        if task is not None:
+            self.deduplicated_count += 1
+        else:
+            task = asyncio.ensure_future(function())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done_task: self._forget(key, done_task))
+
+        return await asyncio.shield(task)
+
+    # === === === === === === ===
+
+    def _forget(
+        self,
+        key: K,
+        task: asyncio.Task[T],
+    ) -> None:
+
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+        # Mark the exception as retrieved in case all callers were cancelled.
+        if not task.cancelled():
+            task.exception()
+
+
+# === === === === === === ===
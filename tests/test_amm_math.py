@@ -0,0 +1,38 @@
+# === === === === === === ===
+
+import random
+
+from src.features.ton_dex.amm_math import get_amount_in, get_amount_out
+
+# === === === === === === ===
+
+
+def test_get_amount_in_covers_fee_rounding() -> None:
+
+    pool = (159499185141, 353293452805, 30, 10, 10)
+
+    amount_in = get_amount_in(True, 44363935318, *pool)
+
+    assert get_amount_out(True, amount_in, *pool)[0] >= 44363935318
+    assert get_amount_out(True, amount_in - 1, *pool)[0] < 44363935318
+
+
+# === === === === === === ===
+
+
+def test_get_amount_in_is_minimal() -> None:
+
+    rng = random.Random(0)
+
+    for _ in range(1000):
+        has_ref = rng.random() < 0.5
+        pool = (rng.randint(10**9, 10**15), rng.randint(10**9, 10**15), 30, 10, 10)
+        amount_out = rng.randint(1, pool[1] // 2)
+
+        amount_in = get_amount_in(has_ref, amount_out, *pool)
+
+        assert get_amount_out(has_ref, amount_in, *pool)[0] >= amount_out
+        assert get_amount_out(has_ref, amount_in - 1, *pool)[0] < amount_out
+
+
+# === === === === === === ===